@@ -38,6 +38,8 @@ class AbjadObject(object, metaclass=abc.ABCMeta):
             state = {}
         for class_ in type(self).__mro__:
             for slot in getattr(class_, '__slots__', ()):
+                if slot == '__weakref__':
+                    continue
                 try:
                     state[slot] = getattr(self, slot)
                 except AttributeError:
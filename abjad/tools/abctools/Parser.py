@@ -1,11 +1,12 @@
 import abc
+import hashlib
+import importlib
 import logging
 import os
-import pickle
-import ply  # type: ignore
 import sys
+import types
+from ply import lex  # type: ignore
 from ply import yacc  # type: ignore
-import traceback
 from .AbjadObject import AbjadObject
 
 
@@ -17,6 +18,11 @@ class Parser(AbjadObject):
     abstract properties ``lexer_rules_object`` and ``parser_rules_object``.
 
     For most parsers these properties should simply return ``self``.
+
+    Builds lexer and parser on first use. Reads lexing and parsing tables
+    from modules generated next to each parser by ``write_tables()``; builds
+    tables in memory when those modules are missing or out of date. Parsers
+    of the same class share tables.
     """
 
     ### CLASS VARIABLES ###
@@ -28,6 +34,8 @@ class Parser(AbjadObject):
         '_parser',
         )
 
+    _prototypes: dict = {}
+
     ### INITIALIZER ###
 
     def __init__(self, debug=False):
@@ -47,31 +55,6 @@ class Parser(AbjadObject):
         else:
             self._logger = yacc.NullLogger()
 
-        self._lexer = ply.lex.lex(
-            debug=self.debug,
-            debuglog=self.logger,
-            object=self.lexer_rules_object
-            )
-
-        if self.pickle_path and not os.path.exists(self.pickle_path):
-            try:
-                directory, _ = os.path.split(self.pickle_path)
-                if not os.path.exists(directory):
-                    os.makedirs(directory)
-                string = pickle.dumps(None)
-                with open(self.pickle_path, 'wb') as file_pointer:
-                    file_pointer.write(string)
-            except (IOError, OSError):
-                traceback.print_exc()
-
-        self._parser = ply.yacc.yacc(
-            debug=self.debug,
-            debuglog=self.logger,
-            module=self.parser_rules_object,
-            outputdir=self.output_path,
-            picklefile=self.pickle_path,
-            )
-
     ### SPECIAL METHODS ###
 
     def __call__(self, string):
@@ -95,6 +78,122 @@ class Parser(AbjadObject):
 
         return result
 
+    ### PRIVATE METHODS ###
+
+    def _build_prototypes(self):
+        rules = self._get_rules_namespace(self.lexer_rules_object)
+        lextab = self._import_table_module('lextab')
+        if (lextab is not None and
+            getattr(lextab, '_lexsignature', None) ==
+            self._get_lexer_signature()):
+            lexer = lex.lex(object=rules, optimize=True, lextab=lextab)
+        else:
+            lexer = lex.lex(object=rules)
+        # regenerates tables in memory when signature does not match
+        parser = yacc.yacc(
+            debug=False,
+            errorlog=yacc.NullLogger(),
+            module=self._get_rules_namespace(self.parser_rules_object),
+            tabmodule=self._get_table_module_name('parsetab'),
+            write_tables=False,
+            )
+        return lexer, parser
+
+    def _get_lexer_signature(self):
+        rules = self.lexer_rules_object
+        items = []
+        for name in ('literals', 'reflags', 'states', 'tokens'):
+            items.append(repr(getattr(rules, name, None)))
+        functions, strings = [], []
+        for name in dir(rules):
+            if not name.startswith('t_'):
+                continue
+            value = getattr(rules, name)
+            if callable(value):
+                regex = getattr(value, 'regex', value.__doc__)
+                line_number = value.__code__.co_firstlineno
+                functions.append((line_number, name, regex))
+            else:
+                strings.append((name, value))
+        # lexer tries function rules in order of definition
+        functions.sort()
+        items.extend(repr(_[1:]) for _ in functions)
+        items.extend(repr(_) for _ in sorted(strings))
+        string = '\n'.join(items)
+        return hashlib.md5(string.encode('utf-8')).hexdigest()
+
+    def _get_prototypes(self):
+        class_ = type(self)
+        if class_ not in Parser._prototypes:
+            Parser._prototypes[class_] = self._build_prototypes()
+        return Parser._prototypes[class_]
+
+    @staticmethod
+    def _get_rules_namespace(rules):
+        # PLY gets every attribute; lazy properties must not build parser
+        namespace = types.SimpleNamespace()
+        for name in dir(rules):
+            if name.startswith('__') and name not in ('__file__', '__module__'):
+                continue
+            if isinstance(getattr(Parser, name, None), property):
+                continue
+            setattr(namespace, name, getattr(rules, name))
+        return namespace
+
+    def _get_table_module_name(self, kind):
+        class_ = type(self)
+        package = class_.__module__.rpartition('.')[0]
+        return f'{package}._{kind}_{class_.__name__}'
+
+    def _import_table_module(self, kind):
+        try:
+            return importlib.import_module(self._get_table_module_name(kind))
+        except ImportError:
+            return None
+
+    def _make_lexer(self):
+        if self.debug:
+            return lex.lex(
+                debug=self.debug,
+                debuglog=self.logger,
+                object=self._get_rules_namespace(self.lexer_rules_object),
+                )
+        lexer, parser = self._get_prototypes()
+        lexer = lexer.clone(self.lexer_rules_object)
+        lexer.lexstatestack = []
+        lexer.begin('INITIAL')
+        return lexer
+
+    def _make_parser(self):
+        if self.debug:
+            return yacc.yacc(
+                debug=self.debug,
+                debuglog=self.logger,
+                module=self._get_rules_namespace(self.parser_rules_object),
+                outputdir=self.output_path,
+                write_tables=False,
+                )
+        lexer, parser = self._get_prototypes()
+        rules = self.parser_rules_object
+        table = yacc.LRTable()
+        table.lr_action = parser.action
+        table.lr_goto = parser.goto
+        table.lr_productions = []
+        for production in parser.productions:
+            production = yacc.MiniProduction(
+                production.str,
+                production.name,
+                production.len,
+                production.func,
+                production.file,
+                production.line,
+                )
+            if production.func:
+                production.callable = getattr(rules, production.func)
+            table.lr_productions.append(production)
+        error_function = getattr(rules, 'p_error', None)
+        return yacc.LRParser(table, error_function)
+
     ### PUBLIC METHODS ###
 
     def tokenize(self, string):
@@ -105,6 +204,47 @@ class Parser(AbjadObject):
         for token in self.lexer:
             print(token)
 
+    def write_tables(self):
+        """
+        Writes lexing and parsing table modules next to parser module.
+
+        Run when lexical or syntactical rules change.
+
+        Returns none.
+        """
+        class_ = type(self)
+        directory = os.path.dirname(sys.modules[class_.__module__].__file__)
+        lextab = self._get_table_module_name('lextab')
+        lextab_name = lextab.rpartition('.')[2]
+        rules = self._get_rules_namespace(self.lexer_rules_object)
+        lexer = lex.lex(object=rules)
+        lexer.writetab(lextab_name, directory)
+        path = os.path.join(directory, lextab_name + '.py')
+        with open(path, 'a') as file_pointer:
+            signature = self._get_lexer_signature()
+            file_pointer.write(f'_lexsignature = {signature!r}\n')
+        parsetab = self._get_table_module_name('parsetab')
+        path = os.path.join(directory, parsetab.rpartition('.')[2] + '.py')
+        if os.path.exists(path):
+            os.remove(path)
+        yacc.yacc(
+            debug=False,
+            errorlog=yacc.NullLogger(),
+            module=self._get_rules_namespace(self.parser_rules_object),
+            outputdir=directory,
+            tabmodule=parsetab,
+            )
+        for name in (lextab, parsetab):
+            # generated tables are not annotated
+            path = os.path.join(directory, name.rpartition('.')[2] + '.py')
+            with open(path) as file_pointer:
+                string = file_pointer.read()
+            with open(path, 'w') as file_pointer:
+                file_pointer.write('# type: ignore\n' + string)
+            sys.modules.pop(name, None)
+        importlib.invalidate_caches()
+        Parser._prototypes.pop(class_, None)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -119,6 +259,8 @@ class Parser(AbjadObject):
         """
         Gets parser's PLY Lexer instance.
         """
+        if self._lexer is None:
+            self._lexer = self._make_lexer()
         return self._lexer
 
     @abc.abstractproperty
@@ -171,6 +313,8 @@ class Parser(AbjadObject):
         """
         Gets parser's PLY LRParser instance.
         """
+        if self._parser is None:
+            self._parser = self._make_parser()
         return self._parser
 
     @abc.abstractproperty
@@ -179,16 +323,3 @@ class Parser(AbjadObject):
         Gets object containing the parser's syntactical rule definitions.
         """
         raise NotImplementedError
-
-    @property
-    def pickle_path(self):
-        """
-        Gets output path for the parser's pickled parsing tables.
-        """
-        if self.output_path is None:
-            return None
-        file_name = 'parse_tables_{}_{}.pkl'.format(
-            type(self).__name__,
-            '-'.join(str(x) for x in sys.version_info),
-            )
-        return os.path.join(self.output_path, file_name)
@@ -0,0 +1,31 @@
+import abjad
+
+
+def test_abctools_Parser_parser_01():
+    """
+    Builds lexer and parser on first use.
+    """
+
+    parser = abjad.rhythmtreetools.RhythmTreeParser()
+    assert parser._lexer is None
+    assert parser._parser is None
+    assert parser('(1 (1 1))')[0].rtm_format == '(1 (1 1))'
+    assert parser._lexer is not None
+    assert parser._parser is not None
+
+
+def test_abctools_Parser_parser_02():
+    """
+    Parsers of same class share tables but bind rules to own instance.
+    """
+
+    parser_1 = abjad.lilypondparsertools.ReducedLyParser()
+    parser_2 = abjad.lilypondparsertools.ReducedLyParser()
+    assert parser_1.parser.action is parser_2.parser.action
+    assert parser_1.parser.goto is parser_2.parser.goto
+    production_1 = parser_1.parser.productions[1]
+    production_2 = parser_2.parser.productions[1]
+    assert production_1.callable.__self__ is parser_1
+    assert production_2.callable.__self__ is parser_2
+    assert parser_1.lexer is not parser_2.lexer
+    assert format(parser_1("c'4 d'4")) == format(parser_2("c'4 d'4"))
@@ -97,6 +97,8 @@ class Expression(AbjadValueObject):
         '_template',
         )
 
+    _compiled_statements: dict = {}
+
     _private_attributes_to_copy = []  # type: List[str]
 
     _publish_storage_format = True
@@ -556,6 +558,23 @@ class Expression(AbjadValueObject):
             previous_callback = callback
         return string
 
+    def _compile_statement(self, statement, argument_count, cache=True):
+        module_names = tuple(self.module_names or ())
+        if self.qualified_method_name is not None:
+            module_names += (self.qualified_method_name.split('.')[0],)
+        key = (statement, argument_count, module_names)
+        function = Expression._compiled_statements.get(key)
+        if function is None:
+            parameters = [f'__argument_{i}' for i in range(argument_count)]
+            parameters = ', '.join(parameters)
+            globals_ = self._make_globals()
+            function = eval(f'lambda {parameters}: {statement}', globals_)
+            if cache:
+                if 1024 <= len(Expression._compiled_statements):
+                    Expression._compiled_statements.clear()
+                Expression._compiled_statements[key] = function
+        return function
+
     def _evaluate(self, *arguments, **keywords):
         import abjad
         assert self.evaluation_template
@@ -578,19 +597,20 @@ class Expression(AbjadValueObject):
                 arguments,
                 )
             raise Exception(message)
-        globals_ = self._make_globals()
         statement = self.evaluation_template
         strings = []
+        cache = True
         if self.is_initializer:
             for i, argument in enumerate(arguments):
                 if argument is None:
                     continue
                 string = '__argument_{i}'
                 string = string.format(i=i)
-                globals_[string] = argument
                 strings.append(string)
             keywords_ = self.keywords or {}
             keywords_.update(keywords)
+            # keyword values are spelled out in statement; do not cache them
+            cache = not keywords_
             for key, value in keywords_.items():
                 value = self._to_evaluable_string(value)
                 string = '{key}={value}'
@@ -608,10 +628,8 @@ class Expression(AbjadValueObject):
                 statement = statement.replace('{}', '')
             else:
                 strings = []
-                __argument_0 = arguments[0]
                 for i, argument in enumerate(arguments):
                     string = '__argument_' + str(i)
-                    globals_[string] = argument
                     strings.append(string)
                 try:
                     statement = statement.format(*strings)
@@ -620,32 +638,31 @@ class Expression(AbjadValueObject):
                     message = message.format(statement, exception.args[0])
                     raise type(exception)(message)
         try:
-            result = eval(statement, globals_)
+            function = self._compile_statement(
+                statement,
+                len(arguments),
+                cache=cache,
+                )
+            result = function(*arguments)
         except Exception as exception:
             message = 'evaluable statement {!r} raises {!r}.'
             message = message.format(statement, exception.args[0])
             raise type(exception)(message)
         if self.force_return:
-            result = __argument_0
+            result = arguments[0]
         return result
 
     def _evaluate_group_by(self, *arguments):
         assert len(arguments) == 1, repr(arguments)
-        globals_ = self._make_globals()
-        assert '__argument_0' not in globals_
         __argument_0 = arguments[0]
         class_ = type(__argument_0)
         map_operand = self.map_operand
         if map_operand is None:
             def map_operand(argument):
                 return True
-        globals_['__argument_0'] = __argument_0
-        globals_['class_'] = class_
-        globals_['map_operand'] = map_operand
-        globals_['itertools'] = itertools
         statement = 'itertools.groupby(__argument_0, map_operand)'
         try:
-            pairs = eval(statement, globals_)
+            pairs = itertools.groupby(__argument_0, map_operand)
         except (NameError, SyntaxError, TypeError) as e:
             message = '{!r} raises {!r}.'
             message = message.format(statement, e)
@@ -666,17 +683,12 @@ class Expression(AbjadValueObject):
     def _evaluate_map(self, *arguments):
         assert len(arguments) == 1, repr(arguments)
         assert self.map_operand is not None
-        globals_ = self._make_globals()
-        assert '__argument_0' not in globals_
         __argument_0 = arguments[0]
         class_ = type(__argument_0)
         map_operand = self.map_operand
-        globals_['__argument_0'] = __argument_0
-        globals_['class_'] = class_
-        globals_['map_operand'] = map_operand
         statement = '[map_operand(_) for _ in __argument_0]'
         try:
-            result = eval(statement, globals_)
+            result = [map_operand(_) for _ in __argument_0]
         except (NameError, SyntaxError, TypeError) as e:
             message = '{!r} raises {!r}.'
             message = message.format(statement, e)
@@ -140,6 +140,7 @@ class Pattern(AbjadValueObject):
         '_payload',
         '_period',
         '_template',
+        '_vectors',
         )
 
     _name_to_operator = {
@@ -182,6 +183,7 @@ class Pattern(AbjadValueObject):
         self._payload = payload
         self._period = period
         self._template = template
+        self._vectors = {}
 
     ### SPECIAL METHODS ###
 
@@ -627,6 +629,48 @@ class Pattern(AbjadValueObject):
             return True
         return False
 
+    def _get_bits(self, total_length, rotation):
+        mask = (1 << total_length) - 1
+        if not self.patterns:
+            bits = 0
+            if not self.indices:
+                pass
+            elif self.period is None:
+                for index in self.indices:
+                    if index < 0:
+                        index = total_length - abs(index)
+                    if 0 <= index < total_length:
+                        bits |= 1 << index
+            else:
+                residues = set()
+                for index in self.indices:
+                    if index < 0:
+                        index = total_length - abs(index)
+                    index %= self.period
+                    if index < total_length:
+                        residues.add(index)
+                rotation = rotation or 0
+                string = ''.join(
+                    '1' if (_ + rotation) % self.period in residues else '0'
+                    for _ in range(self.period)
+                    )
+                string *= total_length // self.period + 1
+                string = string[:total_length]
+                if string:
+                    bits = int(string[::-1], 2)
+            if self.inverted:
+                bits ^= mask
+            return bits
+        bits = self.patterns[0]._get_bits(total_length, rotation)
+        if 1 < len(self.patterns):
+            operator_ = self._name_to_operator[self.operator]
+            for pattern in self.patterns[1:]:
+                bits_ = pattern._get_bits(total_length, rotation)
+                bits = operator_(bits, bits_)
+        if self.inverted:
+            bits ^= mask
+        return bits
+
     def _get_format_specification(self):
         import abjad
         if self.template is None:
@@ -655,6 +699,23 @@ class Pattern(AbjadValueObject):
             del frame
         return template
 
+    def _get_vector(self, total_length, rotation=None):
+        vectors = getattr(self, '_vectors', None)
+        if vectors is None:
+            vectors = self._vectors = {}
+        key = (total_length, rotation or 0)
+        vector = vectors.get(key)
+        if vector is None:
+            # string of zeroes and ones with one character per index
+            vector = ''
+            if total_length:
+                bits = self._get_bits(total_length, rotation)
+                vector = format(bits, 'b').zfill(total_length)[::-1]
+            if 1024 <= len(vectors):
+                vectors.clear()
+            vectors[key] = vector
+        return vector
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1313,11 +1374,8 @@ class Pattern(AbjadValueObject):
         Returns list of ones and zeroes.
         """
         total_length = total_length or len(self)
-        boolean_vector = []
-        for index in range(total_length):
-            result = self.matches_index(index, total_length)
-            boolean_vector.append(int(result))
-        return boolean_vector
+        vector = self._get_vector(total_length)
+        return [int(_) for _ in vector]
 
     def get_matching_items(self, sequence):
         """
@@ -1354,9 +1412,10 @@ class Pattern(AbjadValueObject):
         import abjad
         assert isinstance(sequence, collections.Iterable), repr(sequence)
         length = len(sequence)
+        vector = self._get_vector(length)
         items = []
         for i in range(length):
-            if self.matches_index(i, length):
+            if vector[i] == '1':
                 item = sequence[i]
                 items.append(item)
         return abjad.sequence(items=items)
@@ -2264,6 +2323,18 @@ class Pattern(AbjadValueObject):
 
         Returns true or false.
         """
+        if -total_length <= index < total_length:
+            vectors = getattr(self, '_vectors', {})
+            key = (total_length, rotation or 0)
+            # compiles vector when same length and rotation recur
+            if key in vectors:
+                vector = vectors[key]
+                if vector is None:
+                    vector = self._get_vector(total_length, rotation=rotation)
+                return vector[index] == '1'
+            if 1024 <= len(vectors):
+                vectors.clear()
+            vectors[key] = None
         if not self.patterns:
             assert 0 <= total_length
             if 0 <= index:
@@ -4520,11 +4520,8 @@ class Sequence(abctools.AbjadValueObject, collections.Sequence):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe())
-        length = len(self)
-        items = []
-        for i, item in enumerate(self):
-            if pattern.matches_index(i, length):
-                items.append(item)
+        vector = pattern.get_boolean_vector(len(self))
+        items = [item for item, bit in zip(self, vector) if bit]
         return type(self)(items=items)
 
     @Signature(
@@ -0,0 +1,59 @@
+import abjad
+import platform
+import pytest
+
+
+def test_datastructuretools_Expression___call___01():
+    """
+    Equal expressions share compiled statements.
+    """
+
+    abjad.Expression._compiled_statements.clear()
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.TimeSignature((2, 4)), staff[0])
+    expression = abjad.select().leaves().group_by_measure()
+    result = expression(staff)
+    count = len(abjad.Expression._compiled_statements)
+
+    assert 0 < count
+    assert result == abjad.select([staff[:2], staff[2:]])
+
+    expression = abjad.select().leaves().group_by_measure()
+    result = expression(staff)
+
+    assert len(abjad.Expression._compiled_statements) == count
+    assert result == abjad.select([staff[:2], staff[2:]])
+
+
+def test_datastructuretools_Expression___call___02():
+    """
+    Errors name evaluable statement.
+    """
+
+    expression = abjad.Expression(evaluation_template='int({})')
+
+    assert expression('7') == 7
+
+    with pytest.raises(ValueError) as exception_info:
+        expression('x')
+
+    assert "'int(__argument_0)'" in str(exception_info.value)
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_datastructuretools_Expression___call___03():
+    """
+    3.0 (eval per call):        137 function calls, 190 microseconds
+    3.0 (compiled statements):  131 function calls,  50 microseconds
+    """
+
+    expression = abjad.sequence().reverse().flatten()
+    expression([1, [2, 3]])
+
+    result = abjad.IOManager.count_function_calls(
+        'expression([1, [2, 3]])', locals())
+
+    assert result <= 131
@@ -0,0 +1,35 @@
+import abjad
+
+
+def test_datastructuretools_Pattern_matches_index_01():
+    """
+    Compiled vector agrees with first, uncompiled evaluation.
+    """
+
+    pattern = abjad.index([0, -1], period=3) ^ abjad.index([2, 4, -3])
+    pattern = ~(pattern | abjad.index_last(2))
+
+    for rotation in (None, 1, -2):
+        for total_length in (0, 1, 5, 8):
+            for index in range(-total_length - 2, total_length + 2):
+                first = pattern.matches_index(
+                    index, total_length, rotation=rotation)
+                second = pattern.matches_index(
+                    index, total_length, rotation=rotation)
+                assert first is second
+
+
+def test_datastructuretools_Pattern_matches_index_02():
+    """
+    Matches indices of long sequence from one compiled vector.
+    """
+
+    pattern = abjad.index([0, 3], period=5) & abjad.index_first(10**5 - 2)
+    matches = [
+        i for i in range(10**5)
+        if pattern.matches_index(i, 10**5, rotation=1)
+        ]
+
+    assert len(matches) == 2 * 10**5 // 5 - 1
+    assert matches[:4] == [2, 4, 7, 9]
+    assert matches[-1] == 99997
@@ -151,59 +151,57 @@ class Block(AbjadObject):
 
     ### PRIVATE METHODS ###
 
-    def _format_item(self, item, depth=1):
+    def _format_item(self, item, depth=1, stream=False):
         indent = LilyPondFormatManager.indent * depth
-        result = []
         if isinstance(item, (list, tuple)):
-            result.append(indent + '{')
+            yield indent + '{'
             depth_ = depth + 1
             for x in item:
-                pieces = self._format_item(x, depth=depth_)
-                result.extend(pieces)
-            result.append(indent + '}')
+                yield from self._format_item(x, depth=depth_, stream=stream)
+            yield indent + '}'
         elif isinstance(item, str):
-            string = indent + item
-            result.append(string)
+            yield indent + item
+        elif stream and '_iterate_format_pieces' in dir(item):
+            for piece in item._iterate_format_pieces():
+                yield indent + piece
         elif '_get_format_pieces' in dir(item):
             try:
                 pieces = item._get_format_pieces()
             except TypeError:
                 pieces = item._get_format_pieces()
-            pieces = (indent + item for item in pieces)
-            result.extend(pieces)
-        return result
+            for piece in pieces:
+                yield indent + piece
 
     def _get_format_pieces(self):
+        return list(self._iterate_format_pieces(stream=False))
+
+    def _iterate_format_pieces(self, stream=True):
         import abjad
         indent = LilyPondFormatManager.indent
-        result = []
         if (not self._get_formatted_user_attributes() and
             not getattr(self, 'contexts', None) and
             not getattr(self, 'context_blocks', None) and
             not len(self.items)):
-            if self.name == 'score':
-                return ''
-            string = '{} {{}}'.format(self._escaped_name)
-            result.append(string)
-            return result
-        string = '{} {{'.format(self._escaped_name)
-        result.append(string)
+            if self.name != 'score':
+                yield '{} {{}}'.format(self._escaped_name)
+            return
+        yield '{} {{'.format(self._escaped_name)
         for item in self.items:
             if isinstance(item, abjad.ContextBlock):
                 continue
             if isinstance(item, (abjad.Leaf, abjad.Markup)):
                 item = [item]
-            result.extend(self._format_item(item))
-        formatted_attributes = self._get_formatted_user_attributes()
-        formatted_attributes = [indent + _ for _ in formatted_attributes]
-        result.extend(formatted_attributes)
+            yield from self._format_item(item, stream=stream)
+        for string in self._get_formatted_user_attributes():
+            yield indent + string
         formatted_context_blocks = getattr(
             self, '_formatted_context_blocks', [])
-        formatted_context_blocks = [
-            indent + _ for _ in formatted_context_blocks]
-        result.extend(formatted_context_blocks)
-        result.append('}')
-        return result
+        for string in formatted_context_blocks:
+            yield indent + string
+        yield '}'
+
+    def _iterate_lilypond_format(self):
+        return self._iterate_format_pieces()
 
     def _get_format_specification(self):
         import abjad
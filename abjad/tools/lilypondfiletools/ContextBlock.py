@@ -121,6 +121,9 @@ class ContextBlock(Block):
         result.append('}')
         return result
 
+    def _iterate_format_pieces(self, stream=True):
+        return iter(self._get_format_pieces())
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1,6 +1,7 @@
 import collections
 import copy
 import inspect
+import itertools
 import pathlib
 from abjad.tools.abctools.AbjadObject import AbjadObject
 from abjad.tools.indicatortools.LilyPondLiteral import LilyPondLiteral
@@ -482,6 +483,13 @@ class LilyPondFile(AbjadObject):
     ### PRIVATE METHODS ###
 
     def _get_format_pieces(self):
+        result = self._get_formatted_preamble()
+        result.extend(self._get_formatted_blocks())
+        return result
+
+    ### PRIVATE METHODS ###
+
+    def _get_formatted_preamble(self):
         result = []
         if self.date_time_token is not None:
             string = f'% {self.date_time_token}'
@@ -502,14 +510,13 @@ class LilyPondFile(AbjadObject):
             result.append(string)
         result.extend(self._get_formatted_includes())
         result.extend(self._get_formatted_scheme_settings())
-        result.extend(self._get_formatted_blocks())
         return result
 
-    ### PRIVATE METHODS ###
-
-    def _get_formatted_blocks(self):
+    def _get_formatted_blocks(self, items=None):
         result = []
-        for item in self.items:
+        if items is None:
+            items = self.items
+        for item in items:
             if ('_get_lilypond_format' in dir(item) and
                 not isinstance(item, str)):
                 try:
@@ -571,6 +578,36 @@ class LilyPondFile(AbjadObject):
     def _get_lilypond_format(self):
         return '\n\n'.join(self._get_format_pieces())
 
+    def _iterate_lilypond_format(self):
+        """
+        Yields pieces of LilyPond format one block item at a time.
+
+        Joining pieces with newlines gives LilyPond format.
+        """
+        needs_separator = False
+        for string in self._get_formatted_preamble():
+            if needs_separator:
+                yield ''
+            yield string
+            needs_separator = True
+        for item in self.items:
+            if ('_iterate_lilypond_format' in dir(item) and
+                not isinstance(item, str)):
+                pieces = item._iterate_lilypond_format()
+                first_pieces = list(itertools.islice(pieces, 2))
+                # skips items whose formatted string is empty
+                if first_pieces in ([], ['']):
+                    continue
+                pieces = itertools.chain(first_pieces, pieces)
+            else:
+                pieces = self._get_formatted_blocks([item])
+                if not pieces:
+                    continue
+            if needs_separator:
+                yield ''
+            yield from pieces
+            needs_separator = True
+
     @staticmethod
     def _make_global_context_block(
         font_size=3,
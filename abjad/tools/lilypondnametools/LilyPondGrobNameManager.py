@@ -64,18 +64,12 @@ class LilyPondGrobNameManager(LilyPondNameManager):
                 message = '{type_name!r} object has no attribute: {name!r}.'
                 raise AttributeError(message)
         elif camel_name in contexts:
-            try:
-                return vars(self)['_' + name]
-            except KeyError:
-                context = LilyPondGrobNameManager()
-                vars(self)['_' + name] = context
-                return context
+            return self._get_client_manager(
+                '_' + name,
+                LilyPondGrobNameManager,
+                )
         elif camel_name in grob_interfaces:
-            try:
-                return vars(self)[name]
-            except KeyError:
-                vars(self)[name] = LilyPondNameManager()
-                return vars(self)[name]
+            return self._get_client_manager(name)
         else:
             try:
                 return vars(self)[name]
@@ -89,7 +83,7 @@ class LilyPondGrobNameManager(LilyPondNameManager):
         Sets attribute ``attribute`` of grob name manager to ``value``.
         """
         # make sure attribute name is valid grob name before setting value
-        object.__setattr__(self, attribute, value)
+        LilyPondNameManager.__setattr__(self, attribute, value)
 
     ### PRIVATE METHODS ###
 
@@ -1,7 +1,15 @@
 import copy
 
 
-class LilyPondNameManager(object):
+class _LilyPondNameManagerClient(object):
+
+    # client is kept out of vars() so it is neither formatted nor copied
+    __slots__ = (
+        '_client',
+        )
+
+
+class LilyPondNameManager(_LilyPondNameManagerClient):
     """
     LilyPond name manager.
 
@@ -10,6 +18,13 @@ class LilyPondNameManager(object):
 
     ### SPECIAL METHODS ###
 
+    def __delattr__(self, attribute) -> None:
+        """
+        Deletes attribute ``attribute`` of LilyPond name manager.
+        """
+        object.__delattr__(self, attribute)
+        self._format_client_later()
+
     def __eq__(self, argument) -> bool:
         """
         Is true when `argument` is a LilyPond name manager with attribute
@@ -45,6 +60,14 @@ class LilyPondNameManager(object):
         body_string = ''.join(pairs)
         return f'{type(self).__name__}({body_string})'
 
+    def __setattr__(self, attribute, value) -> None:
+        """
+        Sets attribute ``attribute`` of LilyPond name manager to ``value``.
+        """
+        object.__setattr__(self, attribute, value)
+        if attribute != '_client':
+            self._format_client_later()
+
     def __setstate__(self, state) -> None:
         """
         Sets object state.
@@ -54,5 +77,34 @@ class LilyPondNameManager(object):
 
     ### PRIVATE METHODS ###
 
+    def _format_client_later(self):
+        from abjad.tools.scoretools.Component import Component
+        from abjad.tools.scoretools.NoteHead import NoteHead
+        from abjad.tools.systemtools.Wrapper import Wrapper
+        if Component._formatting:
+            return
+        client = getattr(self, '_client', None)
+        if client is None:
+            return
+        if isinstance(client, (LilyPondNameManager, NoteHead)):
+            client._format_client_later()
+        elif hasattr(client, '_format_later'):
+            client._format_later()
+        else:
+            # indicators do not know components to which they attach
+            wrapper = Wrapper._get_indicator_wrapper(client)
+            if wrapper is not None:
+                wrapper._update_component_format_later()
+
     def _get_attribute_pairs(self):
         return list(sorted(vars(self).items()))
+
+    def _get_client_manager(self, name, class_=None):
+        try:
+            manager = vars(self)[name]
+        except KeyError:
+            class_ = class_ or LilyPondNameManager
+            manager = class_()
+            vars(self)[name] = manager
+        manager._client = self
+        return manager
@@ -60,12 +60,7 @@ class LilyPondSettingNameManager(LilyPondNameManager):
                 message = '{type_name!r} object has no attribute: {name!r}.'
                 raise AttributeError(message)
         elif camel_name in contexts:
-            try:
-                return vars(self)['_' + name]
-            except KeyError:
-                context = LilyPondNameManager()
-                vars(self)['_' + name] = context
-                return context
+            return self._get_client_manager('_' + name)
         else:
             try:
                 return vars(self)[name]
@@ -110,11 +110,7 @@ class LilyPondTweakManager(LilyPondNameManager):
                 message = '{type_name!r} object has no attribute: {name!r}.'
                 raise AttributeError(message)
         elif camel_name in grob_interfaces:
-            try:
-                return vars(self)[name]
-            except KeyError:
-                vars(self)[name] = LilyPondNameManager()
-                return vars(self)[name]
+            return self._get_client_manager(name)
         else:
             try:
                 return vars(self)[name]
@@ -195,6 +191,7 @@ class LilyPondTweakManager(LilyPondNameManager):
         if argument._lilypond_tweak_manager is None:
             argument._lilypond_tweak_manager = LilyPondTweakManager()
         manager = argument._lilypond_tweak_manager
+        manager._client = argument
         for tweak in tweaks:
             if len(tweak) == 2:
                 attribute, value = tweak
@@ -359,7 +359,7 @@ class LilyPondParser(abctools.Parser):
         self._lexdef = lilypondparsertools.LilyPondLexicalDefinition(self)
         self._syndef = lilypondparsertools.LilyPondSyntacticalDefinition(self)
 
-        # build PLY parser and lexer
+        # PLY parser and lexer build on first call
         abctools.Parser.__init__(self, debug=debug)
 
         self._reset_parser_variables()
@@ -372,17 +372,18 @@ class LilyPondParser(abctools.Parser):
 
         Returns Abjad components.
         """
+        parser, lexer = self.parser, self.lexer
         self._reset_parser_variables()
         if self._debug:
-            result = self._parser._lilypond_patch_parse_debug(
+            result = parser._lilypond_patch_parse_debug(
                 input_string,
-                lexer=self._lexer,
+                lexer=lexer,
                 debug=self._logger,
                 )
         else:
-            result = self._parser._lilypond_patch_parse(
+            result = parser._lilypond_patch_parse(
                 input_string,
-                lexer=self._lexer,
+                lexer=lexer,
                 )
         if isinstance(result, scoretools.Container):
             self._apply_spanners(result)
@@ -651,9 +652,12 @@ class LilyPondParser(abctools.Parser):
             pass
         context.is_simultaneous = music.is_simultaneous
         # add children
-        while len(music):
-            component = music.pop(0)
-            context.append(component)
+        if not isinstance(music, scoretools.Context):
+            context._take_components(music)
+        else:
+            while len(music):
+                component = music.pop(0)
+                context.append(component)
         for wrapper in music._wrappers:
             attach(wrapper, context)
         return context
@@ -662,7 +666,7 @@ class LilyPondParser(abctools.Parser):
         # indicator sorting could be rewritten into a single list using tuplets
         # with t[0] being 'forward' or 'backward' and t[1] being the indicator
         # as this better preserves attachment order. Not clear if we need it.
-        container = scoretools.Container()
+        components = []
         previous_leaf = None
         apply_forward = []
         apply_backward = []
@@ -682,7 +686,7 @@ class LilyPondParser(abctools.Parser):
                 apply_forward[:] = []
                 apply_backward[:] = []
                 previous_leaf = x
-                container.append(x)
+                components.append(x)
             else:
                 if isinstance(x, (
                     indicatortools.BarLine,
@@ -695,6 +699,13 @@ class LilyPondParser(abctools.Parser):
                     apply_backward.append(x)
                 else:
                     apply_forward.append(x)
+        # add components in one step when none has parent
+        container = scoretools.Container()
+        if all(_._parent is None for _ in components):
+            container._append_orphan_components(components)
+        else:
+            for component in components:
+                container.append(component)
         # attach remaining events to last leaf
         # or to the container itself if there were no leaves
         if previous_leaf:
@@ -854,7 +865,8 @@ class LilyPondParser(abctools.Parser):
             pass
         self._scope_stack = [{}]
         self._chord_pitch_orders = {}
-        self._lexer.push_state('notes')
+        if self._lexer is not None:
+            self._lexer.push_state('notes')
         self._default_duration = lilypondparsertools.LilyPondDuration(
             abjad.Duration(1, 4), None)
         self._last_chord = None
@@ -8,6 +8,7 @@ from .LilyPondGrammarGenerator import LilyPondGrammarGenerator
 from .LilyPondLexicalDefinition import LilyPondLexicalDefinition
 from ._parse import _parse
 from ._parse_debug import _parse_debug
+from ._parse_leaf import _parse_leaf
 from .LilyPondParser import LilyPondParser
 from .LilyPondSyntacticalDefinition import LilyPondSyntacticalDefinition
 from .ReducedLyParser import ReducedLyParser
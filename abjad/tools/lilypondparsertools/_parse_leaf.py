@@ -0,0 +1,103 @@
+import re
+
+
+_duration_pattern = re.compile(r'(?:(?P<number>\d+)(?P<dots>\.*))?\s*\Z')
+
+_head_pattern = re.compile(
+    r"(?P<name>[a-z]+)(?P<octave>'+|,+)?(?P<forced>!*)(?P<cautionary>\?*)"
+    )
+
+_leaf_pattern = re.compile(
+    r"""
+    \s*
+    (?:
+        <(?P<chord>[^<>]*)>
+    |
+        (?P<head>[a-z]+(?:'+|,+)?!*\?*)
+    )
+    """,
+    re.VERBOSE,
+    )
+
+_duration_numbers = ('1', '2', '4', '8', '16', '32', '64', '128')
+
+
+def _parse_leaf(string):
+    r"""
+    Parses single-leaf LilyPond ``string`` with English note names.
+
+    Tokenizes notes, chords, rests and skips with written duration and
+    forced or cautionary accidentals directly; passes all other strings to
+    full LilyPond parser.
+
+    Returns leaf.
+    """
+    import abjad
+    leaf = _parse_simple_leaf(string)
+    if leaf is None:
+        parsed = abjad.parse(f'{{ {string} }}')
+        assert len(parsed) == 1 and isinstance(parsed[0], abjad.Leaf)
+        leaf = parsed[0]
+    return leaf
+
+
+def _parse_simple_leaf(string):
+    import abjad
+    match = _leaf_pattern.match(string)
+    if match is None:
+        return None
+    duration_match = _duration_pattern.match(string, match.end())
+    if duration_match is None:
+        return None
+    number, dots = duration_match.group('number', 'dots')
+    if number is None:
+        duration = abjad.Duration(1, 4)
+    elif number in _duration_numbers:
+        duration = abjad.Duration.from_lilypond_duration_string(number + dots)
+    else:
+        return None
+    head = match.group('head')
+    if head is not None:
+        if head in ('r', 's'):
+            if head == 'r':
+                return abjad.Rest(duration)
+            return abjad.Skip(duration)
+        arguments = _parse_note_head(head)
+        if arguments is None:
+            return None
+        written_pitch, is_forced, is_cautionary = arguments
+        leaf = abjad.Note(written_pitch, duration)
+        leaf.note_head.is_forced = is_forced
+        leaf.note_head.is_cautionary = is_cautionary
+        return leaf
+    heads = match.group('chord').split()
+    if not heads:
+        return None
+    leaf = abjad.Chord([], duration)
+    for head in heads:
+        arguments = _parse_note_head(head)
+        if arguments is None:
+            return None
+        written_pitch, is_forced, is_cautionary = arguments
+        note_head = abjad.NoteHead(
+            written_pitch=written_pitch,
+            is_cautionary=is_cautionary,
+            is_forced=is_forced,
+            )
+        leaf.note_heads.append(note_head)
+    return leaf
+
+
+def _parse_note_head(string):
+    import abjad
+    match = _head_pattern.fullmatch(string)
+    if match is None:
+        return None
+    name, octave, forced, cautionary = match.group(
+        'name', 'octave', 'forced', 'cautionary')
+    # drum names and anything else LilyPond lexes as words go to full parser
+    pitch_class = abjad.ly.language_pitch_names['english'].get(name)
+    if pitch_class is None:
+        return None
+    written_pitch = abjad.NamedPitch(str(pitch_class) + (octave or ''))
+    return written_pitch, bool(forced), bool(cautionary)
@@ -0,0 +1,80 @@
+# type: ignore
+
+# _parsetab_ReducedLyParser.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'startAPOSTROPHE BRACE_L BRACE_R BRACKET_L BRACKET_R CARAT_L CARAT_R COMMA DOT FRACTION INTEGER_N INTEGER_P PAREN_L PAREN_R PIPE PITCHNAME RESTNAME TILDE\n        apostrophes : APOSTROPHE\n        \n        apostrophes : apostrophes APOSTROPHE\n        \n        beam : BRACKET_L\n        \n        beam : BRACKET_R\n        \n        chord_body : chord_pitches\n        \n        chord_body : chord_pitches positive_leaf_duration\n        \n        chord_pitches : CARAT_L pitches CARAT_R\n        \n        commas : COMMA\n        \n        commas : commas COMMA\n        \n        component : container\n        \n        component : fixed_duration_container\n        \n        component : leaf\n        \n        component : tuplet\n        \n        component_list :\n        \n        component_list : component_list component\n        container : BRACE_L component_list BRACE_R\n        \n        dots :\n        \n        dots : dots DOT\n        \n        fixed_duration_container : BRACE_L FRACTION BRACE_R\n        \n        leaf : leaf_body post_events\n        \n        leaf_body : chord_body\n        \n        leaf_body : note_body\n        \n        leaf_body : rest_body\n        \n        measure : PIPE FRACTION component_list PIPE\n        \n        negative_leaf_duration : INTEGER_N dots\n        \n        note_body : pitch\n        \n        note_body : pitch positive_leaf_duration\n        \n        note_body : positive_leaf_duration\n        \n        pitch : PITCHNAME\n        \n        pitch : PITCHNAME apostrophes\n        \n        pitch : PITCHNAME commas\n        \n        pitches : pitch\n        \n        pitches : pitches pitch\n        \n        positive_leaf_duration : INTEGER_P dots\n        \n        post_event : beam\n        \n        post_event : slur\n        \n        post_event : tie\n        \n        post_events :\n        \n        post_events : post_events post_event\n        \n        rest_body : RESTNAME\n        \n        rest_body : RESTNAME positive_leaf_duration\n        \n        rest_body : negative_leaf_duration\n        \n        slur : PAREN_L\n        \n        slur : PAREN_R\n        \n        start :\n        \n        start : start component\n        \n        start : start measure\n        \n        tie : TILDE\n        \n        tuplet : FRACTION container\n        '
+    
+_lr_action_items = {'PIPE':([0,1,2,3,4,5,6,7,11,12,13,14,15,16,17,18,19,21,22,23,24,25,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,56,57,58,59,],[-45,8,-46,-47,-10,-11,-12,-13,-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,-14,-49,-20,-6,-27,-41,-30,-31,-1,-8,-34,-25,59,-16,-15,-19,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,-24,]),'BRACE_L':([0,1,2,3,4,5,6,7,9,10,11,12,13,14,15,16,17,18,19,21,22,23,24,25,26,27,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,56,57,58,59,],[-45,10,-46,-47,-10,-11,-12,-13,26,-14,-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,-14,-49,-14,10,-20,-6,-27,-41,-30,-31,-1,-8,-34,-25,10,-16,-15,-19,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,-24,]),'FRACTION':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,15,16,17,18,19,21,22,23,24,25,26,27,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,56,57,58,59,],[-45,9,-46,-47,-10,-11,-12,-13,24,28,-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,-14,-49,-14,9,-20,-6,-27,-41,-30,-31,-1,-8,-34,-25,9,-16,-15,-19,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,-24,]),'RESTNAME':([0,1,2,3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,21,22,23,24,25,26,27,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,56,57,58,59,],[-45,18,-46,-47,-10,-11,-12,-13,-14,-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,-14,-49,-14,18,-20,-6,-27,-41,-30,-31,-1,-8,-34,-25,18,-16,-15,-19,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,-24,]),'CARAT_L':([0,1,2,3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,21,22,23,24,25,26,27,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,56,57,58,59,],[-45,20,-46,-47,-10,-11,-12,-13,-14,-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,-14,-49,-14,20,-20,-6,-27,-41,-30,-31,-1,-8,-34,-25,20,-16,-15,-19,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,-24,]),'PITCHNAME':([0,1,2,3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,],[-45,21,-46,-47,-10,-11,-12,-13,-14,-38,-21,-22,-23,-5,-28,-26,-40,-42,21,-29,-17,-17,-14,-49,-14,21,-20,-6,-27,-41,21,-32,-30,-31,-1,-8,-34,-25,21,-16,-15,-19,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-33,-2,-9,-18,-24,]),'INTEGER_P':([0,1,2,3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,21,22,23,24,25,26,27,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,56,57,58,59,],[-45,22,-46,-47,-10,-11,-12,-13,-14,-38,-21,-22,-23,22,-28,22,22,-42,-29,-17,-17,-14,-49,-14,22,-20,-6,-27,-41,-30,-31,-1,-8,-34,-25,22,-16,-15,-19,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,-24,]),'INTEGER_N':([0,1,2,3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,21,22,23,24,25,26,27,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,56,57,58,59,],[-45,23,-46,-47,-10,-11,-12,-13,-14,-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,-14,-49,-14,23,-20,-6,-27,-41,-30,-31,-1,-8,-34,-25,23,-16,-15,-19,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,-24,]),'$end':([0,1,2,3,4,5,6,7,11,12,13,14,15,16,17,18,19,21,22,23,25,29,30,31,32,35,36,37,38,39,40,42,44,45,46,47,48,49,50,51,52,53,54,56,57,58,59,],[-45,0,-46,-47,-10,-11,-12,-13,-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,-49,-20,-6,-27,-41,-30,-31,-1,-8,-34,-25,-16,-19,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,-24,]),'BRACE_R':([4,5,6,7,10,11,12,13,14,15,16,17,18,19,21,22,23,25,26,27,28,29,30,31,32,35,36,37,38,39,40,42,43,44,45,46,47,48,49,50,51,52,53,54,56,57,58,],[-10,-11,-12,-13,-14,-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,-49,-14,42,44,-20,-6,-27,-41,-30,-31,-1,-8,-34,-25,-16,-15,-19,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,]),'BRACKET_L':([11,12,13,14,15,16,17,18,19,21,22,23,29,30,31,32,35,36,37,38,39,40,45,46,47,48,49,50,51,52,53,54,56,57,58,],[-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,49,-6,-27,-41,-30,-31,-1,-8,-34,-25,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,]),'BRACKET_R':([11,12,13,14,15,16,17,18,19,21,22,23,29,30,31,32,35,36,37,38,39,40,45,46,47,48,49,50,51,52,53,54,56,57,58,],[-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,50,-6,-27,-41,-30,-31,-1,-8,-34,-25,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,]),'PAREN_L':([11,12,13,14,15,16,17,18,19,21,22,23,29,30,31,32,35,36,37,38,39,40,45,46,47,48,49,50,51,52,53,54,56,57,58,],[-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,51,-6,-27,-41,-30,-31,-1,-8,-34,-25,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,]),'PAREN_R':([11,12,13,14,15,16,17,18,19,21,22,23,29,30,31,32,35,36,37,38,39,40,45,46,47,48,49,50,51,52,53,54,56,57,58,],[-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,52,-6,-27,-41,-30,-31,-1,-8,-34,-25,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,]),'TILDE':([11,12,13,14,15,16,17,18,19,21,22,23,29,30,31,32,35,36,37,38,39,40,45,46,47,48,49,50,51,52,53,54,56,57,58,],[-38,-21,-22,-23,-5,-28,-26,-40,-42,-29,-17,-17,53,-6,-27,-41,-30,-31,-1,-8,-34,-25,-39,-35,-36,-37,-3,-4,-43,-44,-48,-7,-2,-9,-18,]),'CARAT_R':([21,33,34,35,36,37,38,55,56,57,],[-29,54,-32,-30,-31,-1,-8,-33,-2,-9,]),'APOSTROPHE':([21,35,37,56,],[37,56,-1,-2,]),'COMMA':([21,36,38,57,],[38,57,-8,-9,]),'DOT':([22,23,39,40,58,],[-17,-17,58,58,-18,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'component':([1,27,41,],[2,43,43,]),'measure':([1,],[3,]),'container':([1,9,27,41,],[4,25,4,4,]),'fixed_duration_container':([1,27,41,],[5,5,5,]),'leaf':([1,27,41,],[6,6,6,]),'tuplet':([1,27,41,],[7,7,7,]),'leaf_body':([1,27,41,],[11,11,11,]),'chord_body':([1,27,41,],[12,12,12,]),'note_body':([1,27,41,],[13,13,13,]),'rest_body':([1,27,41,],[14,14,14,]),'chord_pitches':([1,27,41,],[15,15,15,]),'positive_leaf_duration':([1,15,17,18,27,41,],[16,30,31,32,16,16,]),'pitch':([1,20,27,33,41,],[17,34,17,55,17,]),'negative_leaf_duration':([1,27,41,],[19,19,19,]),'component_list':([10,24,26,],[27,41,27,]),'post_events':([11,],[29,]),'pitches':([20,],[33,]),'apostrophes':([21,],[35,]),'commas':([21,],[36,]),'dots':([22,23,],[39,40,]),'post_event':([29,],[45,]),'beam':([29,],[46,]),'slur':([29,],[47,]),'tie':([29,],[48,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('apostrophes -> APOSTROPHE','apostrophes',1,'p_apostrophes__APOSTROPHE','ReducedLyParser.py',258),
+  ('apostrophes -> apostrophes APOSTROPHE','apostrophes',2,'p_apostrophes__apostrophes__APOSTROPHE','ReducedLyParser.py',264),
+  ('beam -> BRACKET_L','beam',1,'p_beam__BRACKET_L','ReducedLyParser.py',270),
+  ('beam -> BRACKET_R','beam',1,'p_beam__BRACKET_R','ReducedLyParser.py',277),
+  ('chord_body -> chord_pitches','chord_body',1,'p_chord_body__chord_pitches','ReducedLyParser.py',284),
+  ('chord_body -> chord_pitches positive_leaf_duration','chord_body',2,'p_chord_body__chord_pitches__positive_leaf_duration','ReducedLyParser.py',290),
+  ('chord_pitches -> CARAT_L pitches CARAT_R','chord_pitches',3,'p_chord_pitches__CARAT_L__pitches__CARAT_R','ReducedLyParser.py',296),
+  ('commas -> COMMA','commas',1,'p_commas__COMMA','ReducedLyParser.py',302),
+  ('commas -> commas COMMA','commas',2,'p_commas__commas__commas','ReducedLyParser.py',308),
+  ('component -> container','component',1,'p_component__container','ReducedLyParser.py',314),
+  ('component -> fixed_duration_container','component',1,'p_component__fixed_duration_container','ReducedLyParser.py',320),
+  ('component -> leaf','component',1,'p_component__leaf','ReducedLyParser.py',326),
+  ('component -> tuplet','component',1,'p_component__tuplet','ReducedLyParser.py',332),
+  ('component_list -> <empty>','component_list',0,'p_component_list__EMPTY','ReducedLyParser.py',338),
+  ('component_list -> component_list component','component_list',2,'p_component_list__component_list__component','ReducedLyParser.py',344),
+  ('container -> BRACE_L component_list BRACE_R','container',3,'p_container__BRACE_L__component_list__BRACE_R','ReducedLyParser.py',349),
+  ('dots -> <empty>','dots',0,'p_dots__EMPTY','ReducedLyParser.py',357),
+  ('dots -> dots DOT','dots',2,'p_dots__dots__DOT','ReducedLyParser.py',363),
+  ('fixed_duration_container -> BRACE_L FRACTION BRACE_R','fixed_duration_container',3,'p_fixed_duration_container__BRACE_L__FRACTION__BRACE_R','ReducedLyParser.py',375),
+  ('leaf -> leaf_body post_events','leaf',2,'p_leaf__leaf_body__post_events','ReducedLyParser.py',381),
+  ('leaf_body -> chord_body','leaf_body',1,'p_leaf_body__chord_body','ReducedLyParser.py',390),
+  ('leaf_body -> note_body','leaf_body',1,'p_leaf_body__note_body','ReducedLyParser.py',396),
+  ('leaf_body -> rest_body','leaf_body',1,'p_leaf_body__rest_body','ReducedLyParser.py',402),
+  ('measure -> PIPE FRACTION component_list PIPE','measure',4,'p_measure__PIPE__FRACTION__component_list__PIPE','ReducedLyParser.py',408),
+  ('negative_leaf_duration -> INTEGER_N dots','negative_leaf_duration',2,'p_negative_leaf_duration__INTEGER_N__dots','ReducedLyParser.py',417),
+  ('note_body -> pitch','note_body',1,'p_note_body__pitch','ReducedLyParser.py',428),
+  ('note_body -> pitch positive_leaf_duration','note_body',2,'p_note_body__pitch__positive_leaf_duration','ReducedLyParser.py',434),
+  ('note_body -> positive_leaf_duration','note_body',1,'p_note_body__positive_leaf_duration','ReducedLyParser.py',440),
+  ('pitch -> PITCHNAME','pitch',1,'p_pitch__PITCHNAME','ReducedLyParser.py',446),
+  ('pitch -> PITCHNAME apostrophes','pitch',2,'p_pitch__PITCHNAME__apostrophes','ReducedLyParser.py',452),
+  ('pitch -> PITCHNAME commas','pitch',2,'p_pitch__PITCHNAME__commas','ReducedLyParser.py',458),
+  ('pitches -> pitch','pitches',1,'p_pitches__pitch','ReducedLyParser.py',464),
+  ('pitches -> pitches pitch','pitches',2,'p_pitches__pitches__pitch','ReducedLyParser.py',470),
+  ('positive_leaf_duration -> INTEGER_P dots','positive_leaf_duration',2,'p_positive_leaf_duration__INTEGER_P__dots','ReducedLyParser.py',476),
+  ('post_event -> beam','post_event',1,'p_post_event__beam','ReducedLyParser.py',487),
+  ('post_event -> slur','post_event',1,'p_post_event__slur','ReducedLyParser.py',493),
+  ('post_event -> tie','post_event',1,'p_post_event__tie','ReducedLyParser.py',499),
+  ('post_events -> <empty>','post_events',0,'p_post_events__EMPTY','ReducedLyParser.py',505),
+  ('post_events -> post_events post_event','post_events',2,'p_post_events__post_events__post_event','ReducedLyParser.py',511),
+  ('rest_body -> RESTNAME','rest_body',1,'p_rest_body__RESTNAME','ReducedLyParser.py',522),
+  ('rest_body -> RESTNAME positive_leaf_duration','rest_body',2,'p_rest_body__RESTNAME__positive_leaf_duration','ReducedLyParser.py',528),
+  ('rest_body -> negative_leaf_duration','rest_body',1,'p_rest_body__negative_leaf_duration','ReducedLyParser.py',534),
+  ('slur -> PAREN_L','slur',1,'p_slur__PAREN_L','ReducedLyParser.py',540),
+  ('slur -> PAREN_R','slur',1,'p_slur__PAREN_R','ReducedLyParser.py',547),
+  ('start -> <empty>','start',0,'p_start__EMPTY','ReducedLyParser.py',554),
+  ('start -> start component','start',2,'p_start__start__component','ReducedLyParser.py',561),
+  ('start -> start measure','start',2,'p_start__start__measure','ReducedLyParser.py',568),
+  ('tie -> TILDE','tie',1,'p_tie__TILDE','ReducedLyParser.py',575),
+  ('tuplet -> FRACTION container','tuplet',2,'p_tuplet__FRACTION__container','ReducedLyParser.py',582),
+]
@@ -0,0 +1,57 @@
+# type: ignore
+
+# _parsetab_SchemeParser.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programAMPERSAND ASTERISK BOOLEAN CARAT COLON DECIMAL DOLLAR EQUALS EXCLAMATION HASH HEXADECIMAL IDENTIFIER INTEGER L_CARAT L_PAREN MINUS PERCENT PERIOD PLUS QUESTION QUOTE R_CARAT R_PAREN SLASH STRING TILDE UNDERSCORE\n        program : forms\n        \n        forms :\n        \n        forms : forms form\n        \n        form : expression\n        \n        variable : IDENTIFIER\n        \n        expression : variable\n        \n        expression : QUOTE datum\n        \n        expression : constant\n        \n        constant : boolean\n        \n        constant : number\n        \n        constant : string\n        \n        datum : constant\n        \n        datum : symbol\n        \n        datum : list\n        \n        datum : vector\n        \n        data :\n        \n        data : data datum\n        \n        boolean : BOOLEAN\n        \n        number : DECIMAL\n        \n        number : HEXADECIMAL\n        \n        number : INTEGER\n        \n        string : STRING\n        \n        symbol : IDENTIFIER\n        \n        vector : HASH L_PAREN data R_PAREN\n        \n        list : L_PAREN data R_PAREN\n        \n        list : L_PAREN data datum PERIOD datum R_PAREN\n        '
+    
+_lr_action_items = {'QUOTE':([0,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,27,31,34,],[-2,6,-3,-4,-6,-8,-5,-9,-10,-11,-18,-19,-20,-21,-22,-7,-12,-13,-14,-15,-23,-25,-24,-26,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,30,31,32,34,],[-2,8,-3,-4,-6,22,-8,-5,-9,-10,-11,-18,-19,-20,-21,-22,-7,-12,-13,-14,-15,-23,-16,22,-16,-25,-17,22,22,-24,-17,-26,]),'BOOLEAN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,30,31,32,34,],[-2,12,-3,-4,-6,12,-8,-5,-9,-10,-11,-18,-19,-20,-21,-22,-7,-12,-13,-14,-15,-23,-16,12,-16,-25,-17,12,12,-24,-17,-26,]),'DECIMAL':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,30,31,32,34,],[-2,13,-3,-4,-6,13,-8,-5,-9,-10,-11,-18,-19,-20,-21,-22,-7,-12,-13,-14,-15,-23,-16,13,-16,-25,-17,13,13,-24,-17,-26,]),'HEXADECIMAL':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,30,31,32,34,],[-2,14,-3,-4,-6,14,-8,-5,-9,-10,-11,-18,-19,-20,-21,-22,-7,-12,-13,-14,-15,-23,-16,14,-16,-25,-17,14,14,-24,-17,-26,]),'INTEGER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,30,31,32,34,],[-2,15,-3,-4,-6,15,-8,-5,-9,-10,-11,-18,-19,-20,-21,-22,-7,-12,-13,-14,-15,-23,-16,15,-16,-25,-17,15,15,-24,-17,-26,]),'STRING':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,30,31,32,34,],[-2,16,-3,-4,-6,16,-8,-5,-9,-10,-11,-18,-19,-20,-21,-22,-7,-12,-13,-14,-15,-23,-16,16,-16,-25,-17,16,16,-24,-17,-26,]),'$end':([0,1,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,27,31,34,],[-2,0,-1,-3,-4,-6,-8,-5,-9,-10,-11,-18,-19,-20,-21,-22,-7,-12,-13,-14,-15,-23,-25,-24,-26,]),'L_PAREN':([6,9,10,11,12,13,14,15,16,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,],[23,-9,-10,-11,-18,-19,-20,-21,-22,-12,-13,-14,-15,-23,-16,26,23,-16,-25,-17,23,23,-24,-17,-26,]),'HASH':([6,9,10,11,12,13,14,15,16,18,19,20,21,22,23,25,26,27,28,29,30,31,32,34,],[24,-9,-10,-11,-18,-19,-20,-21,-22,-12,-13,-14,-15,-23,-16,24,-16,-25,-17,24,24,-24,-17,-26,]),'PERIOD':([9,10,11,12,13,14,15,16,18,19,20,21,22,27,28,31,34,],[-9,-10,-11,-18,-19,-20,-21,-22,-12,-13,-14,-15,-23,-25,30,-24,-26,]),'R_PAREN':([9,10,11,12,13,14,15,16,18,19,20,21,22,23,25,26,27,28,29,31,32,33,34,],[-9,-10,-11,-18,-19,-20,-21,-22,-12,-13,-14,-15,-23,-16,27,-16,-25,-17,31,-24,-17,34,-26,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'forms':([0,],[2,]),'form':([2,],[3,]),'expression':([2,],[4,]),'variable':([2,],[5,]),'constant':([2,6,25,29,30,],[7,18,18,18,18,]),'boolean':([2,6,25,29,30,],[9,9,9,9,9,]),'number':([2,6,25,29,30,],[10,10,10,10,10,]),'string':([2,6,25,29,30,],[11,11,11,11,11,]),'datum':([6,25,29,30,],[17,28,32,33,]),'symbol':([6,25,29,30,],[19,19,19,19,]),'list':([6,25,29,30,],[20,20,20,20,]),'vector':([6,25,29,30,],[21,21,21,21,]),'data':([23,26,],[25,29,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> forms','program',1,'p_program__forms','SchemeParser.py',268),
+  ('forms -> <empty>','forms',0,'p_forms__EMPTY','SchemeParser.py',275),
+  ('forms -> forms form','forms',2,'p_forms__forms__form','SchemeParser.py',281),
+  ('form -> expression','form',1,'p_form__expression','SchemeParser.py',293),
+  ('variable -> IDENTIFIER','variable',1,'p_variable__IDENTIFIER','SchemeParser.py',329),
+  ('expression -> variable','expression',1,'p_expression__variable','SchemeParser.py',372),
+  ('expression -> QUOTE datum','expression',2,'p_expression__QUOTE__datum','SchemeParser.py',381),
+  ('expression -> constant','expression',1,'p_expression__constant','SchemeParser.py',398),
+  ('constant -> boolean','constant',1,'p_constant__boolean','SchemeParser.py',410),
+  ('constant -> number','constant',1,'p_constant__number','SchemeParser.py',423),
+  ('constant -> string','constant',1,'p_constant__string','SchemeParser.py',436),
+  ('datum -> constant','datum',1,'p_datum__constant','SchemeParser.py',489),
+  ('datum -> symbol','datum',1,'p_datum__symbol','SchemeParser.py',496),
+  ('datum -> list','datum',1,'p_datum__list','SchemeParser.py',515),
+  ('datum -> vector','datum',1,'p_datum__vector','SchemeParser.py',522),
+  ('data -> <empty>','data',0,'p_data__EMPTY','SchemeParser.py',529),
+  ('data -> data datum','data',2,'p_data__data__datum','SchemeParser.py',535),
+  ('boolean -> BOOLEAN','boolean',1,'p_boolean__BOOLEAN','SchemeParser.py',547),
+  ('number -> DECIMAL','number',1,'p_number__DECIMAL','SchemeParser.py',559),
+  ('number -> HEXADECIMAL','number',1,'p_number__HEXADECIMAL','SchemeParser.py',566),
+  ('number -> INTEGER','number',1,'p_number__INTEGER','SchemeParser.py',573),
+  ('string -> STRING','string',1,'p_string__STRING','SchemeParser.py',590),
+  ('symbol -> IDENTIFIER','symbol',1,'p_symbol__IDENTIFIER','SchemeParser.py',607),
+  ('vector -> HASH L_PAREN data R_PAREN','vector',4,'p_vector__HASH__L_PAREN__data__R_PAREN','SchemeParser.py',621),
+  ('list -> L_PAREN data R_PAREN','list',3,'p_list__L_PAREN__data__R_PAREN','SchemeParser.py',634),
+  ('list -> L_PAREN data datum PERIOD datum R_PAREN','list',6,'p_list__L_PAREN__data__datum__PERIOD__datum__R_PAREN','SchemeParser.py',642),
+]
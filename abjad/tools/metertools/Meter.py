@@ -245,6 +245,10 @@ class Meter(AbjadValueObject):
         '_root_node',
         )
 
+    _depthwise_offset_inventories: dict = {}
+
+    _offset_inventories: dict = {}
+
     ### INITIALIZER ###
 
     def __init__(
@@ -729,6 +733,19 @@ class Meter(AbjadValueObject):
             storage_format_kwargs_names=[],
             )
 
+    def _get_offset_inventory(self, prolation):
+        import abjad
+        key = (self.rtm_format, prolation)
+        if key not in Meter._offset_inventories:
+            if 1024 <= len(Meter._offset_inventories):
+                Meter._offset_inventories.clear()
+            inventory = []
+            for offsets in self.depthwise_offset_inventory:
+                offsets = [abjad.Offset(_ * prolation) for _ in offsets]
+                inventory.append(tuple(offsets))
+            Meter._offset_inventories[key] = tuple(inventory)
+        return list(Meter._offset_inventories[key])
+
     @staticmethod
     def _make_gridded_test_rhythm(grid_length, rhythm_number, denominator=16):
         """
@@ -826,105 +843,109 @@ class Meter(AbjadValueObject):
         if not isinstance(meter, abjad.Meter):
             meter = abjad.Meter(meter)
         boundary_depth = boundary_depth or meter.preferred_boundary_depth
-        def recurse(
-            boundary_depth=None,
-            boundary_offsets=None,
-            depth=0,
-            logical_tie=None,
-            ):
+        def get_preprolated_duration(pieces, start_offset, stop_offset):
+            if len(pieces) == 1:
+                duration = (stop_offset - start_offset) * pieces[0][-1]
+                return abjad.Duration(duration)
+            duration = abjad.Duration(0)
+            for piece_start, piece_stop, multiplier in pieces:
+                overlap = min(stop_offset, piece_stop)
+                overlap -= max(start_offset, piece_start)
+                if 0 < overlap:
+                    duration += overlap * multiplier
+            return abjad.Duration(duration)
+        def get_split_offsets(pieces, start_offset, stop_offset, depth=0):
             offsets = abjad.MeterManager.get_offsets_at_depth(
                 depth,
                 offset_inventory,
                 )
-            #print('DEPTH:', depth)
-            logical_tie_duration = logical_tie._get_preprolated_duration()
-            logical_tie_timespan = abjad.inspect(logical_tie).get_timespan()
-            logical_tie_start_offset = logical_tie_timespan.start_offset
-            logical_tie_stop_offset = logical_tie_timespan.stop_offset
-            logical_tie_starts_in_offsets = logical_tie_start_offset in offsets
-            logical_tie_stops_in_offsets = logical_tie_stop_offset in offsets
+            logical_tie_duration = get_preprolated_duration(
+                pieces,
+                start_offset,
+                stop_offset,
+                )
+            logical_tie_starts_in_offsets = start_offset in offsets
+            logical_tie_stops_in_offsets = stop_offset in offsets
             if not abjad.MeterManager.is_acceptable_logical_tie(
                 logical_tie_duration=logical_tie_duration,
                 logical_tie_starts_in_offsets=logical_tie_starts_in_offsets,
                 logical_tie_stops_in_offsets=logical_tie_stops_in_offsets,
                 maximum_dot_count=maximum_dot_count,
                 ):
-                #print('UNACCEPTABLE:', logical_tie, logical_tie_start_offset, logical_tie_stop_offset)
-                #print('\t', ' '.join([str(x) for x in offsets]))
-                split_offset = None
-                offsets = abjad.MeterManager.get_offsets_at_depth(
-                    depth,
-                    offset_inventory,
-                    )
                 # If the logical tie's start aligns, take the latest possible offset.
                 if logical_tie_starts_in_offsets:
                     offsets = reversed(offsets)
-                for offset in offsets:
-                    if logical_tie_start_offset < offset < logical_tie_stop_offset:
-                        split_offset = offset
+                for split_offset in offsets:
+                    if start_offset < split_offset < stop_offset:
                         break
-                #print('\tABS:', split_offset)
-                if split_offset is not None:
-                    split_offset -= logical_tie_start_offset
-                    #print('\tREL:', split_offset)
-                    #print()
-                    shards = abjad.mutate(logical_tie[:]).split(
-                        [split_offset],
-                        repeat_ties=repeat_ties,
-                        )
-                    logical_ties = [abjad.LogicalTie(_) for _ in shards]
-                    for logical_tie in logical_ties:
-                        recurse(
-                            boundary_depth=boundary_depth,
-                            boundary_offsets=boundary_offsets,
-                            depth=depth,
-                            logical_tie=logical_tie,
-                            )
                 else:
-                    #print()
-                    recurse(
-                        boundary_depth=boundary_depth,
-                        boundary_offsets=boundary_offsets,
+                    return get_split_offsets(
+                        pieces,
+                        start_offset,
+                        stop_offset,
                         depth=depth + 1,
-                        logical_tie=logical_tie,
                         )
             elif abjad.MeterManager.is_boundary_crossing_logical_tie(
                 boundary_depth=boundary_depth,
                 boundary_offsets=boundary_offsets,
-                logical_tie_start_offset=logical_tie_start_offset,
-                logical_tie_stop_offset=logical_tie_stop_offset,
+                logical_tie_start_offset=start_offset,
+                logical_tie_stop_offset=stop_offset,
                 ):
-                #print('BOUNDARY CROSSING', logical_tie, logical_tie_start_offset, logical_tie_stop_offset)
                 offsets = boundary_offsets
-                if logical_tie_start_offset in boundary_offsets:
+                if start_offset in boundary_offsets:
                     offsets = reversed(boundary_offsets)
                 split_offset = None
                 for offset in offsets:
-                    if logical_tie_start_offset < offset < logical_tie_stop_offset:
+                    if start_offset < offset < stop_offset:
                         split_offset = offset
                         break
                 assert split_offset is not None
-                #print('\tABS:', split_offset)
-                split_offset -= logical_tie_start_offset
-                #print('\tREL:', split_offset)
-                #print()
-                shards = abjad.mutate(logical_tie[:]).split(
-                    [split_offset],
-                    repeat_ties=repeat_ties,
-                    )
-                logical_ties = [abjad.LogicalTie(shard) for shard in shards]
-                for logical_tie in logical_ties:
-                    recurse(
-                        boundary_depth=boundary_depth,
-                        boundary_offsets=boundary_offsets,
-                        depth=depth,
-                        logical_tie=logical_tie,
-                        )
             else:
-                #print('ACCEPTABLE:', logical_tie, logical_tie_start_offset, logical_tie_stop_offset)
-                #print('\t', ' '.join([str(x) for x in offsets]))
-                #print()
+                return []
+            split_offsets = get_split_offsets(
+                pieces,
+                start_offset,
+                split_offset,
+                depth=depth,
+                )
+            split_offsets.append(split_offset)
+            split_offsets.extend(get_split_offsets(
+                pieces,
+                split_offset,
+                stop_offset,
+                depth=depth,
+                ))
+            return split_offsets
+        def rewrite_logical_tie(logical_tie):
+            # Plan all splits before splitting logical tie once.
+            timespan = abjad.inspect(logical_tie).get_timespan()
+            start_offset = abjad.Offset(timespan.start_offset - first_offset)
+            stop_offset = start_offset
+            pieces = []
+            for leaf in logical_tie:
+                duration = leaf._get_duration()
+                multiplier = leaf._get_preprolated_duration() / duration
+                piece_start = stop_offset
+                if pieces and pieces[-1][-1] == multiplier:
+                    piece_start = pieces.pop()[0]
+                stop_offset += duration
+                pieces.append((piece_start, stop_offset, multiplier))
+            split_offsets = get_split_offsets(
+                pieces,
+                start_offset,
+                stop_offset,
+                )
+            if not split_offsets:
                 logical_tie[:]._fuse()
+                return
+            offsets = [start_offset] + split_offsets
+            durations = [y - x for x, y in zip(offsets, offsets[1:])]
+            shards = abjad.mutate(logical_tie[:]).split(
+                durations,
+                repeat_ties=repeat_ties,
+                )
+            for shard in shards:
+                abjad.LogicalTie(shard)[:]._fuse()
         # Validate arguments.
         assert abjad.select(components).are_contiguous_logical_voice()
         if not isinstance(meter, abjad.Meter):
@@ -943,16 +964,14 @@ class Meter(AbjadValueObject):
             components[-1]).get_timespan().start_offset
         difference = last_start_offset - first_start_offset + initial_offset
         assert difference < meter.implied_time_signature.duration
-        # Build offset inventory, adjusted for initial offset and prolation.
+        # Get offset inventory, adjusted for prolation and measured from
+        # first offset.
         first_offset = abjad.inspect(components[0]).get_timespan().start_offset
         first_offset -= initial_offset
         prolation = abjad.inspect(components[0]).get_parentage(
             include_self=False).prolation
-        offset_inventory = []
-        for offsets in meter.depthwise_offset_inventory:
-            offsets = [(x * prolation) + first_offset for x in offsets]
-            offset_inventory.append(tuple(offsets))
-        # Build boundary offset inventory, if applicable.
+        offset_inventory = meter._get_offset_inventory(prolation)
+        # Get boundary offset inventory, if applicable.
         if boundary_depth is not None:
             boundary_offsets = offset_inventory[boundary_depth]
         else:
@@ -962,13 +981,7 @@ class Meter(AbjadValueObject):
         items = tuple(iterator)
         for item in items:
             if isinstance(item, abjad.LogicalTie):
-                #print('RECURSING:', item)
-                recurse(
-                    boundary_depth=boundary_depth,
-                    boundary_offsets=boundary_offsets,
-                    depth=0,
-                    logical_tie=item,
-                    )
+                rewrite_logical_tie(item)
             elif isinstance(item, abjad.Tuplet) and not rewrite_tuplets:
                 pass
             else:
@@ -1218,6 +1231,9 @@ class Meter(AbjadValueObject):
         Returns dictionary.
         """
         import abjad
+        rtm_format = self.rtm_format
+        if rtm_format in Meter._depthwise_offset_inventories:
+            return Meter._depthwise_offset_inventories[rtm_format]
         inventory = []
         all_offsets = set()
         all_offsets.add(abjad.Offset(self.numerator, self.denominator))
@@ -1225,7 +1241,11 @@ class Meter(AbjadValueObject):
             for node in nodes:
                 all_offsets.add(abjad.Offset(node.start_offset))
             inventory.append(tuple(sorted(all_offsets)))
-        return tuple(inventory)
+        inventory = tuple(inventory)
+        if 1024 <= len(Meter._depthwise_offset_inventories):
+            Meter._depthwise_offset_inventories.clear()
+        Meter._depthwise_offset_inventories[rtm_format] = inventory
+        return inventory
 
     @property
     def duration(self):
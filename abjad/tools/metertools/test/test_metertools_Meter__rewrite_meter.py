@@ -0,0 +1,79 @@
+import abjad
+import pytest
+
+
+def test_metertools_Meter__rewrite_meter_01():
+    """
+    Splits logical tie at all planned offsets at once.
+    """
+
+    container = abjad.Container("r16 c'1 ~ c'8.")
+    meter = abjad.Meter((5, 4))
+    abjad.mutate(container[:]).rewrite_meter(meter, boundary_depth=1)
+
+    assert format(container) == abjad.String.normalize(
+        r"""
+        {
+            r16
+            c'8.
+            ~
+            c'2
+            ~
+            c'2
+        }
+        """
+        )
+
+    assert abjad.inspect(container).is_well_formed()
+
+
+def test_metertools_Meter__rewrite_meter_02():
+    """
+    Same meter rewrites differently prolated components alike.
+    """
+
+    meter = abjad.Meter((6, 8))
+    container = abjad.Container("c'16 d'2 ~ d'16 e'8")
+    tuplet = abjad.Tuplet((2, 3), "c'16 d'2 ~ d'16 e'8")
+    abjad.mutate(container[:]).rewrite_meter(meter)
+    abjad.mutate(tuplet[:]).rewrite_meter(meter)
+
+    assert format(container) == abjad.String.normalize(
+        r"""
+        {
+            c'16
+            d'16
+            ~
+            d'4
+            ~
+            d'4
+            e'8
+        }
+        """
+        )
+
+    durations = [_.written_duration for _ in container]
+    assert [_.written_duration for _ in tuplet] == durations
+
+
+def test_metertools_Meter__rewrite_meter_03():
+    """
+    Deeper offsets found during one rewrite do not leak into cached offset
+    inventory of next rewrite.
+    """
+
+    abjad.Meter._offset_inventories.clear()
+    meter = abjad.Meter((3, 4))
+    container = abjad.Container("c'4 c'4.. c'16")
+    with pytest.raises(IndexError):
+        abjad.mutate(container[:]).rewrite_meter(meter, boundary_depth=2)
+
+    container = abjad.Container("c'16 c'8 c'16 c'2")
+    abjad.mutate(container[:]).rewrite_meter(meter)
+    inventory = meter._get_offset_inventory(abjad.Multiplier(1))
+
+    assert len(inventory) == len(meter.depthwise_offset_inventory)
+
+    container = abjad.Container("c'4 c'4.. c'16")
+    with pytest.raises(IndexError):
+        abjad.mutate(container[:]).rewrite_meter(meter, boundary_depth=2)
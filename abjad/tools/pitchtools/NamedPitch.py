@@ -196,6 +196,8 @@ class NamedPitch(Pitch):
         '_name',
         )
 
+    _interned: dict = {}
+
     ### INITIALIZER ###
 
     def __init__(self, name="c'", *, arrow=None):
@@ -218,7 +220,7 @@ class NamedPitch(Pitch):
             number = getattr(name, 'number', name)
             named_pitch_class = abjad.NamedPitchClass(number)
             octave = number // 12 + 4
-            if named_pitch_class == 'c':
+            if named_pitch_class.name == 'c':
                 rounded = 12 * (octave - 4) + named_pitch_class.number
                 if 0.5 <= abs(number - rounded):
                     octave += 1
@@ -231,7 +233,7 @@ class NamedPitch(Pitch):
             raise ValueError(message)
         assert self._is_pitch_name(name)
         self._name = name
-        if arrow not in (abjad.Up, abjad.Down, None):
+        if arrow is not None and arrow not in (abjad.Up, abjad.Down):
             message = 'arrow must be up, down or none: {!r}.'
             message = message.format(arrow)
             raise TypeError(message)
@@ -478,6 +480,28 @@ class NamedPitch(Pitch):
             storage_format_kwargs_names=['arrow'],
             )
 
+    @classmethod
+    def _intern(class_, argument):
+        import abjad
+        if type(argument) is str:
+            key = (str, argument, None)
+        elif type(argument) in (int, float):
+            # numbers spell according to configured accidental spelling
+            spelling = abjad.abjad_configuration['accidental_spelling']
+            key = (type(argument), argument, spelling)
+        elif type(argument) is class_:
+            key = (class_, argument.name, argument.arrow)
+        else:
+            return class_(argument)
+        # named pitches are never changed after initialization
+        pitch = class_._interned.get(key)
+        if pitch is None:
+            if 4096 <= len(class_._interned):
+                class_._interned.clear()
+            pitch = class_(argument)
+            class_._interned[key] = pitch
+        return pitch
+
     def _get_lilypond_format(self):
         return str(self)
 
@@ -33,6 +33,9 @@ class PitchClassSet(Set):
 
     __slots__ = ()
 
+    # normal orders and prime forms of 12-ET sets indexed by bitmask
+    _tables: dict = {}
+
     ### SPECIAL METHODS ###
 
     def __contains__(self, argument):
@@ -177,7 +180,6 @@ class PitchClassSet(Set):
 
     @staticmethod
     def _get_most_compact_ordering(candidates):
-        import abjad
         widths = []
         for candidate in candidates:
             if candidate[0] < candidate[-1]:
@@ -193,12 +195,7 @@ class PitchClassSet(Set):
         candidates = candidates_
         assert 1 <= len(candidates)
         if len(candidates) == 1:
-            segment = candidates[0]
-            segment = abjad.PitchClassSegment(
-                items=segment,
-                item_class=abjad.NumberedPitchClass,
-                )
-            return segment
+            return tuple(candidates[0])
         for i in range(len(candidates[0]) - 1):
             widths = []
             for candidate in candidates:
@@ -215,19 +212,61 @@ class PitchClassSet(Set):
                     candidates_.append(candidate)
             candidates = candidates_
             if len(candidates) == 1:
-                segment = candidates[0]
-                segment = abjad.PitchClassSegment(
-                    items=segment,
-                    item_class=abjad.NumberedPitchClass,
-                    )
-                return segment
+                return tuple(candidates[0])
         candidates.sort(key=lambda x: x[0])
-        segment = candidates[0]
-        segment = abjad.PitchClassSegment(
-            items=segment,
-            item_class=abjad.NumberedPitchClass,
-            )
-        return segment
+        return tuple(candidates[0])
+
+    def _get_mask(self):
+        import abjad
+        if self.item_class is not abjad.NumberedPitchClass:
+            return None
+        mask = 0
+        for pitch_class in self:
+            number = pitch_class.number
+            if not isinstance(number, int):
+                return None
+            mask |= 1 << number
+        return mask
+
+    @staticmethod
+    def _get_normal_order_numbers(numbers):
+        candidates = []
+        for i in range(len(numbers)):
+            candidate = numbers[i:] + numbers[:i]
+            candidates.append(candidate)
+        return PitchClassSet._get_most_compact_ordering(candidates)
+
+    @staticmethod
+    def _get_tables():
+        tables = PitchClassSet._tables
+        if tables:
+            return tables
+        normal_orders = [()]
+        for mask in range(1, 4096):
+            numbers = [_ for _ in range(12) if mask & (1 << _)]
+            normal_order = PitchClassSet._get_normal_order_numbers(numbers)
+            normal_orders.append(normal_order)
+        prime_forms, transposition_only_prime_forms = [()], [()]
+        for mask in range(1, 4096):
+            normal_order = normal_orders[mask]
+            first = normal_order[0]
+            numbers = tuple((_ - first) % 12 for _ in normal_order)
+            transposition_only_prime_forms.append(numbers)
+            inversion = 0
+            for number in normal_order:
+                inversion |= 1 << ((12 - number) % 12)
+            normal_order = normal_orders[inversion]
+            first = normal_order[0]
+            inversion_numbers = tuple((_ - first) % 12 for _ in normal_order)
+            if numbers < inversion_numbers:
+                prime_forms.append(numbers)
+            else:
+                prime_forms.append(inversion_numbers)
+        tables['normal_orders'] = normal_orders
+        tables['prime_forms'] = prime_forms
+        tables['transposition_only_prime_forms'] = \
+            transposition_only_prime_forms
+        return tables
 
     ### PUBLIC METHODS ###
 
@@ -309,14 +348,18 @@ class PitchClassSet(Set):
                 items=None,
                 item_class=abjad.NumberedPitchClass,
                 )
-        pitch_classes = list(self)
-        pitch_classes.sort()
-        candidates = []
-        for i in range(self.cardinality):
-            candidate = [abjad.NumberedPitch(_) for _ in pitch_classes]
-            candidate = abjad.sequence(candidate).rotate(n=-i)
-            candidates.append(candidate)
-        return self._get_most_compact_ordering(candidates)
+        mask = self._get_mask()
+        if mask is not None:
+            numbers = self._get_tables()['normal_orders'][mask]
+        else:
+            pitch_classes = list(self)
+            pitch_classes.sort()
+            numbers = [abjad.NumberedPitch(_).number for _ in pitch_classes]
+            numbers = self._get_normal_order_numbers(numbers)
+        return abjad.PitchClassSegment(
+            items=numbers,
+            item_class=abjad.NumberedPitchClass,
+            )
 
     def get_prime_form(self, transposition_only=False):
         r'''Gets prime form.
@@ -426,6 +469,16 @@ class PitchClassSet(Set):
         import abjad
         if not len(self):
             return copy.copy(self)
+        mask = self._get_mask()
+        if mask is not None:
+            if transposition_only:
+                table = self._get_tables()['transposition_only_prime_forms']
+            else:
+                table = self._get_tables()['prime_forms']
+            return type(self)(
+                items=table[mask],
+                item_class=abjad.NumberedPitchClass,
+                )
         normal_order = self.get_normal_order()
         if not transposition_only:
             normal_orders = [normal_order]
@@ -1,4 +1,3 @@
-from abjad.tools import mathtools
 from abjad.tools.abctools.AbjadValueObject import AbjadValueObject
 
 
@@ -1098,14 +1097,8 @@ class SetClass(AbjadValueObject):
     @staticmethod
     def _yield_all_pitch_class_sets():
         from abjad.tools import pitchtools
-        def _helper(binary_string):
-            result = zip(binary_string, range(len(binary_string)))
-            result = [string[1] for string in result if string[0] == '1']
-            return result
-        for i in range(4096):
-            string = mathtools.integer_to_binary_string(i).zfill(12)
-            subset = ''.join(list(reversed(string)))
-            subset = _helper(subset)
+        for mask in range(4096):
+            subset = [_ for _ in range(12) if mask & (1 << _)]
             subset = pitchtools.PitchClassSet(
                 subset,
                 item_class=pitchtools.NumberedPitchClass,
@@ -1543,10 +1536,19 @@ class SetClass(AbjadValueObject):
             items=pitch_class_set,
             item_class=abjad.NumberedPitchClass,
             )
-        prime_form = pitch_class_set.get_prime_form(
-            transposition_only=transposition_only,
-            )
-        prime_form = tuple([_.number for _ in sorted(prime_form)])
+        mask = pitch_class_set._get_mask()
+        if mask is not None:
+            tables = pitch_class_set._get_tables()
+            if transposition_only:
+                prime_form = tables['transposition_only_prime_forms'][mask]
+            else:
+                prime_form = tables['prime_forms'][mask]
+            prime_form = tuple(sorted(prime_form))
+        else:
+            prime_form = pitch_class_set.get_prime_form(
+                transposition_only=transposition_only,
+                )
+            prime_form = tuple([_.number for _ in sorted(prime_form)])
         if transposition_only:
             pair = SetClass._prime_form_to_transposition_only_identifier[
                 prime_form]
@@ -0,0 +1,44 @@
+import abjad
+
+
+def test_pitchtools_PitchClassSet_get_prime_form_01():
+    """
+    Looks up prime forms of numbered pitch-class sets in bitmask tables;
+    looks up same prime forms as found for named pitch-class sets.
+    """
+
+    for mask in range(1, 4096, 53):
+        numbers = [_ for _ in range(12) if mask & (1 << _)]
+        numbered_set = abjad.PitchClassSet(
+            numbers,
+            item_class=abjad.NumberedPitchClass,
+            )
+        named_set = abjad.PitchClassSet(
+            numbers,
+            item_class=abjad.NamedPitchClass,
+            )
+        assert numbered_set._get_mask() == mask
+        assert named_set._get_mask() is None
+        for transposition_only in (False, True):
+            prime_form_1 = numbered_set.get_prime_form(transposition_only)
+            prime_form_2 = named_set.get_prime_form(transposition_only)
+            assert prime_form_1 == prime_form_2
+        normal_order_1 = numbered_set.get_normal_order()
+        normal_order_2 = named_set.get_normal_order()
+        assert normal_order_1 == normal_order_2
+
+
+def test_pitchtools_PitchClassSet_get_prime_form_02():
+    """
+    Computes prime forms of quarter-tone pitch-class sets without tables.
+    """
+
+    pitch_class_set = abjad.PitchClassSet([1, 2.5, 9, 11])
+
+    assert pitch_class_set._get_mask() is None
+    assert pitch_class_set.get_normal_order() == abjad.PitchClassSegment(
+        [9, 11, 1, 2.5],
+        )
+    assert pitch_class_set.get_prime_form() == abjad.PitchClassSet(
+        [0, 1.5, 3.5, 5.5],
+        )
@@ -0,0 +1,12 @@
+# type: ignore
+# _lextab_RhythmTreeParser.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('DURATION', 'LPAREN', 'RPAREN'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_DURATION>-?[1-9]\\d*(/[1-9]\\d*)?)|(?P<t_newline>\\n+)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))', [None, ('t_DURATION', 'DURATION'), None, ('t_newline', 'newline'), (None, 'LPAREN'), (None, 'RPAREN')])]}
+_lexstateignore = {'INITIAL': ' \n\t\r'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_lexsignature = 'ed70bcb08da93f9a8a2816857a13e185'
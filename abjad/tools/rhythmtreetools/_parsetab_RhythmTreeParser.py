@@ -0,0 +1,41 @@
+# type: ignore
+
+# _parsetab_RhythmTreeParser.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'toplevelDURATION LPAREN RPAREN\n        container : LPAREN DURATION node_list_closed RPAREN\n        \n        leaf : DURATION\n        \n        node : container\n        \n        node : leaf\n        \n        node_list : node_list node_list_item\n        \n        node_list : node_list_item\n        \n        node_list_closed : LPAREN node_list RPAREN\n        \n        node_list_item : node\n        \n        toplevel :\n        \n        toplevel : toplevel node\n        '
+    
+_lr_action_items = {'LPAREN':([0,1,2,3,4,6,7,8,10,11,12,13,15,],[-9,5,-10,-3,-4,-2,8,5,5,-6,-8,-1,-5,]),'DURATION':([0,1,2,3,4,5,6,8,10,11,12,13,15,],[-9,6,-10,-3,-4,7,-2,6,6,-6,-8,-1,-5,]),'$end':([0,1,2,3,4,6,13,],[-9,0,-10,-3,-4,-2,-1,]),'RPAREN':([3,4,6,9,10,11,12,13,14,15,],[-3,-4,-2,13,14,-6,-8,-1,-7,-5,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'toplevel':([0,],[1,]),'node':([1,8,10,],[2,12,12,]),'container':([1,8,10,],[3,3,3,]),'leaf':([1,8,10,],[4,4,4,]),'node_list_closed':([7,],[9,]),'node_list':([8,],[10,]),'node_list_item':([8,10,],[11,15,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> toplevel","S'",1,None,None,None),
+  ('container -> LPAREN DURATION node_list_closed RPAREN','container',4,'p_container__LPAREN__DURATION__node_list_closed__RPAREN','RhythmTreeParser.py',150),
+  ('leaf -> DURATION','leaf',1,'p_leaf__INTEGER','RhythmTreeParser.py',166),
+  ('node -> container','node',1,'p_node__container','RhythmTreeParser.py',176),
+  ('node -> leaf','node',1,'p_node__leaf','RhythmTreeParser.py',182),
+  ('node_list -> node_list node_list_item','node_list',2,'p_node_list__node_list__node_list_item','RhythmTreeParser.py',188),
+  ('node_list -> node_list_item','node_list',1,'p_node_list__node_list_item','RhythmTreeParser.py',194),
+  ('node_list_closed -> LPAREN node_list RPAREN','node_list_closed',3,'p_node_list_closed__LPAREN__node_list__RPAREN','RhythmTreeParser.py',200),
+  ('node_list_item -> node','node_list_item',1,'p_node_list_item__node','RhythmTreeParser.py',206),
+  ('toplevel -> <empty>','toplevel',0,'p_toplevel__EMPTY','RhythmTreeParser.py',212),
+  ('toplevel -> toplevel node','toplevel',2,'p_toplevel__toplevel__node','RhythmTreeParser.py',218),
+]
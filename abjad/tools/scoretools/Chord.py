@@ -35,10 +35,8 @@ class Chord(Leaf):
         assert len(arguments) in (0, 1, 2)
         self._note_heads = abjad.NoteHeadList(client=self)
         if len(arguments) == 1 and isinstance(arguments[0], str):
-            string = '{{ {} }}'.format(arguments[0])
-            parsed = abjad.parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            arguments = [parsed[0]]
+            parsed = abjad.lilypondparsertools._parse_leaf(arguments[0])
+            arguments = [parsed]
         are_cautionary = []
         are_forced = []
         are_parenthesized = []
@@ -89,7 +87,8 @@ class Chord(Leaf):
                 is_forced = None
             if not is_parenthesized:
                 is_parenthesized = None
-            if written_pitch not in drums:
+            if (not isinstance(written_pitch, str) or
+                written_pitch not in drums):
                 note_head = abjad.NoteHead(
                     written_pitch=written_pitch,
                     is_cautionary=is_cautionary,
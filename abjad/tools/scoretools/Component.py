@@ -1,6 +1,7 @@
 import abc
 import bisect
 import copy
+import itertools
 import uqbar.graphs
 from abjad.enumerations import Down, Right, Up
 from abjad.exceptions import MissingMetronomeMarkError
@@ -16,11 +17,15 @@ class Component(AbjadObject):
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_format_cache',
+        '_format_epoch',
+        '_index_in_parent',
         '_indicators_are_current',
         '_is_forbidden_to_update',
         '_lilypond_grob_name_manager',
         '_lilypond_setting_name_manager',
         '_measure_number',
+        '_measure_numbers_are_current',
         '_offsets_are_current',
         '_offsets_in_seconds_are_current',
         '_parent',
@@ -32,14 +37,24 @@ class Component(AbjadObject):
         '_wrappers',
         )
 
+    # unique across all scores so that moved components never match
+    _format_epochs = itertools.count()
+
+    # format managers read overrides and settings while formatting
+    _formatting = 0
+
     ### INITIALIZER ###
 
     @abc.abstractmethod
     def __init__(self, name=None):
         import abjad
+        self._format_cache = None
+        self._format_epoch = next(Component._format_epochs)
+        self._index_in_parent = None
         self._indicators_are_current = False
         self._is_forbidden_to_update = False
         self._measure_number = None
+        self._measure_numbers_are_current = False
         self._offsets_are_current = False
         self._offsets_in_seconds_are_current = False
         self._lilypond_grob_name_manager = None
@@ -74,13 +89,13 @@ class Component(AbjadObject):
         if getattr(self, '_lilypond_setting_name_manager', None) is not None:
             manager = copy.copy(abjad.setting(self))
             new_component._lilypond_setting_name_manager = manager
-        for wrapper in abjad.inspect(self).annotations():
+        wrappers = [_ for _ in self._wrappers if _.annotation]
+        for wrapper in self._wrappers:
+            if not wrapper.annotation and wrapper.spanner is None:
+                wrappers.append(wrapper)
+        for wrapper in wrappers:
             new_wrapper = copy.copy(wrapper)
-            abjad.attach(new_wrapper, new_component)
-        for wrapper in abjad.inspect(self).wrappers():
-            if wrapper.spanner is None:
-                new_wrapper = copy.copy(wrapper)
-                abjad.attach(new_wrapper, new_component)
+            new_component._bind_copied_wrapper(new_wrapper)
         return new_component
 
     def __format__(self, format_specification=''):
@@ -174,6 +189,19 @@ class Component(AbjadObject):
         node.append(table)
         return node
 
+    def _bind_copied_wrapper(self, wrapper):
+        """
+        Binds ``wrapper`` copied from well-formed component.
+
+        Skips duplicate indicator check; effective context binds at next
+        indicator update.
+
+        Not composer-safe.
+        """
+        wrapper._component = self
+        self._wrappers.append(wrapper)
+        self._indicators_are_current = False
+
     def _cache_named_children(self):
         name_dictionary = {}
         if hasattr(self, '_named_children'):
@@ -223,6 +251,24 @@ class Component(AbjadObject):
         pass
 
     def _format_component(self, pieces=False):
+        if not pieces:
+            epoch = self._get_format_root()._format_epoch
+            if self._format_cache is not None:
+                epoch_, string = self._format_cache
+                if epoch_ == epoch:
+                    return string
+        Component._formatting += 1
+        try:
+            contributions = self._format_component_contributions()
+        finally:
+            Component._formatting -= 1
+        if pieces:
+            return contributions
+        string = '\n'.join(contributions)
+        self._format_cache = (epoch, string)
+        return string
+
+    def _format_component_contributions(self):
         import abjad
         result = []
         bundle = abjad.LilyPondFormatManager.bundle_format_contributions(self)
@@ -238,14 +284,23 @@ class Component(AbjadObject):
         contributions = []
         for contributor, contribution in result:
             contributions.extend(contribution)
-        if pieces:
-            return contributions
-        else:
-            return '\n'.join(contributions)
+        return contributions
 
     def _format_contents_slot(self, bundle):
         pass
 
+    def _format_later(self):
+        """
+        Invalidates cached format of every component in score.
+        """
+        component = self
+        while True:
+            parent = component._get_format_parent()
+            if parent is None:
+                break
+            component = parent
+        component._format_epoch = next(Component._format_epochs)
+
     def _format_open_brackets_slot(self, bundle):
         pass
 
@@ -309,7 +364,9 @@ class Component(AbjadObject):
                 else:
                     return
         self._update_now(indicators=True)
-        candidate_wrappers = {}
+        # each candidate source is a pair of sorted offsets and wrappers
+        # by offset; sources are listed in order of precedence
+        sources, sources_are_current = [], False
         parentage = abjad.inspect(self).get_parentage(
             include_self=True,
             grace_notes=True,
@@ -320,8 +377,6 @@ class Component(AbjadObject):
                 if wrapper.annotation:
                     continue
                 if isinstance(wrapper.indicator, prototype):
-                    #offset = wrapper.start_offset
-                    #candidate_wrappers.setdefault(offset, []).append(wrapper)
                     these_wrappers.append(wrapper)
             # activate indicator takes precendence over inactive indicator
             if (any(_.deactivate is True for _ in these_wrappers) and
@@ -329,27 +384,53 @@ class Component(AbjadObject):
                 these_wrappers = [
                     _ for _ in these_wrappers if _.deactivate is not True
                     ]
-            for wrapper in these_wrappers:
-                offset = wrapper.start_offset
-                candidate_wrappers.setdefault(offset, []).append(wrapper)
+            if these_wrappers:
+                wrappers_by_offset = {}
+                for wrapper in these_wrappers:
+                    offset = wrapper.start_offset
+                    wrappers_by_offset.setdefault(offset, []).append(wrapper)
+                source = (sorted(wrappers_by_offset), wrappers_by_offset)
+                sources.append(source)
             if not isinstance(component, abjad.Context):
                 continue
-            for wrapper in component._dependent_wrappers:
-                if wrapper.annotation:
-                    continue
-                if isinstance(wrapper.indicator, prototype):
-                    offset = wrapper.start_offset
-                    candidate_wrappers.setdefault(offset, []).append(wrapper)
-        if not candidate_wrappers:
+            # cached index is valid only once offsets are current
+            if not sources_are_current:
+                self._update_now(offsets=True)
+                sources_are_current = True
+            source = component._get_dependent_wrapper_index(prototype)
+            if source[0]:
+                sources.append(source)
+        if not sources:
             return
-        all_offsets = sorted(candidate_wrappers)
         start_offset = abjad.inspect(self).get_timespan().start_offset
-        index = bisect.bisect(all_offsets, start_offset) - 1 + int(n)
-        if index < 0:
-            return
-        elif len(candidate_wrappers) <= index:
-            return
-        wrapper = candidate_wrappers[all_offsets[index]][0]
+        n = int(n)
+        if n == 0:
+            wrapper, wrapper_offset = None, None
+            for offsets, wrappers_by_offset in sources:
+                index = bisect.bisect(offsets, start_offset) - 1
+                if index < 0:
+                    continue
+                offset = offsets[index]
+                if wrapper is None or wrapper_offset < offset:
+                    wrapper = wrappers_by_offset[offset][0]
+                    wrapper_offset = offset
+            if wrapper is None:
+                return
+        else:
+            all_offsets = set()
+            for offsets, wrappers_by_offset in sources:
+                all_offsets.update(offsets)
+            all_offsets = sorted(all_offsets)
+            index = bisect.bisect(all_offsets, start_offset) - 1 + n
+            if index < 0:
+                return
+            elif len(all_offsets) <= index:
+                return
+            offset = all_offsets[index]
+            for offsets, wrappers_by_offset in sources:
+                if offset in wrappers_by_offset:
+                    wrapper = wrappers_by_offset[offset][0]
+                    break
         if unwrap:
             return wrapper.indicator
         return wrapper
@@ -392,9 +473,35 @@ class Component(AbjadObject):
             result.extend(contributions)
         return result
 
+    def _get_format_parent(self):
+        # setters may run before component initializer
+        parent = getattr(self, '_parent', None)
+        if parent is not None:
+            return parent
+        # grace containers format with carrier leaf
+        return getattr(self, '_carrier', None)
+
+    def _get_cached_format(self):
+        if self._format_cache is None:
+            return None
+        epoch, string = self._format_cache
+        if epoch == self._get_format_root()._format_epoch:
+            return string
+        return None
+
     def _get_format_pieces(self):
         return self._format_component(pieces=True)
 
+    def _get_format_root(self):
+        component = self
+        while True:
+            parent = component._parent
+            if parent is None:
+                parent = getattr(component, '_carrier', None)
+                if parent is None:
+                    return component
+            component = parent
+
     def _get_format_specification(self):
         import abjad
         values = []
@@ -487,6 +594,12 @@ class Component(AbjadObject):
             return tuple(x for x in markup if x.direction is Down)
         return markup
 
+    def _get_measure_number(self):
+        import abjad
+        update_manager = abjad.UpdateManager()
+        measure_start_offsets = update_manager._get_measure_start_offsets(self)
+        return update_manager._to_measure_number(self, measure_start_offsets)
+
     def _get_next_measure(self):
         import abjad
         if isinstance(self, abjad.Leaf):
@@ -640,6 +753,17 @@ class Component(AbjadObject):
                 break
         return component in temporal_successors
 
+    def _iterate_format_pieces(self):
+        return iter(self._get_format_pieces())
+
+    def _iterate_lilypond_format(self):
+        """
+        Yields pieces of LilyPond format one by one.
+
+        Joining pieces with newlines gives LilyPond format.
+        """
+        yield self._get_lilypond_format()
+
     def _move_indicators(self, recipient_component):
         import abjad
         for wrapper in abjad.inspect(self).wrappers():
@@ -704,8 +828,15 @@ class Component(AbjadObject):
             for wrapper in component._dependent_wrappers[:]:
                 if wrapper.component is self:
                     component._dependent_wrappers.remove(wrapper)
+                    component._dependent_wrapper_index.clear()
         if self._parent is not None:
-            self._parent._components.remove(self)
+            components = self._parent._components
+            index = self._parent.index(self)
+            del components[index]
+            self._parent._reindex_components(index)
+            # next sibling now follows a gap and must be recomputed
+            if index < len(components):
+                components[index]._offsets_are_current = False
         self._parent = None
 
     def _remove_named_children_from_parentage(self, name_dictionary):
@@ -738,10 +869,16 @@ class Component(AbjadObject):
         """
         named_children = self._cache_named_children()
         self._remove_named_children_from_parentage(named_children)
+        contents = getattr(self, '_components', None)
+        if contents:
+            prolation = self._get_parentage(include_self=False).prolation
         self._remove_from_parent()
         self._parent = new_parent
         self._restore_named_children_to_parentage(named_children)
         self._update_later(offsets=True)
+        if contents:
+            if prolation != self._get_parentage(include_self=False).prolation:
+                self._update_descendants_later()
 
     def _splice(
         self,
@@ -781,6 +918,7 @@ class Component(AbjadObject):
                     for component in reversed(components):
                         component._set_parent(parent)
                         parent._components.insert(start + 1, component)
+                    parent._reindex_components(start)
                 else:
                     after = stop + 1
                     parent.__setitem__(slice(after, after), components)
@@ -811,18 +949,28 @@ class Component(AbjadObject):
                     for component in reversed(components):
                         component._set_parent(parent)
                         parent._components.insert(start, component)
+                    parent._reindex_components(start)
                 else:
                     parent.__setitem__(slice(start, start), components)
             return components + [self]
 
+    def _update_descendants_later(self):
+        for component in self._get_descendants(include_self=False):
+            component._offsets_are_current = False
+
     def _update_later(self, offsets=False, offsets_in_seconds=False):
         import abjad
         assert offsets or offsets_in_seconds
-        for component in abjad.inspect(self).get_parentage(include_self=True):
+        for component in abjad.inspect(self).get_parentage(
+            include_self=True,
+            grace_notes=True,
+            ):
             if offsets:
                 component._offsets_are_current = False
             elif offsets_in_seconds:
                 component._offsets_in_seconds_are_current = False
+        # component is now score root
+        component._format_epoch = next(Component._format_epochs)
 
     def _update_measure_numbers(self):
         import abjad
@@ -834,6 +982,7 @@ class Component(AbjadObject):
         offsets=False,
         offsets_in_seconds=False,
         indicators=False,
+        measure_numbers=False,
         ):
         import abjad
         update_manager = abjad.UpdateManager()
@@ -842,4 +991,5 @@ class Component(AbjadObject):
             offsets=offsets,
             offsets_in_seconds=offsets_in_seconds,
             indicators=indicators,
+            measure_numbers=measure_numbers,
             )
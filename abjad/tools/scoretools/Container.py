@@ -462,10 +462,44 @@ class Container(Component):
         for component in argument:
             if not isinstance(component, Component):
                 return False
-            if not inspect(component).get_parentage().is_orphan:
+            if component._parent is not None:
                 return False
         return True
 
+    def _append_orphan_components(self, components):
+        """
+        Appends orphan ``components`` with one offset update instead of one
+        update per component.
+
+        Skips spanner and logical voice checks.
+
+        Not composer-safe.
+        """
+        components = list(components)
+        named_children: dict = {}
+        has_contents = False
+        for component in components:
+            assert component._parent is None, repr(component)
+            for name, children in component._cache_named_children().items():
+                named_children.setdefault(name, []).extend(children)
+            if getattr(component, '_components', None):
+                has_contents = True
+            component._parent = self
+            component._offsets_are_current = False
+        start = len(self._components)
+        self._components.extend(components)
+        self._reindex_components(start)
+        if named_children:
+            for parent in self._get_parentage():
+                for name, children in named_children.items():
+                    parent._named_children.setdefault(name, []).extend(
+                        children)
+        self._update_later(offsets=True)
+        # descendants were timed under orphan prolation of one
+        if has_contents and self._get_parentage().prolation != 1:
+            for component in components:
+                component._update_descendants_later()
+
     def _append_without_withdrawing_from_crossing_spanners(self, component):
         """
         Not composer-safe.
@@ -491,12 +525,14 @@ class Container(Component):
 
     def _copy_with_children(self):
         new_container = self.__copy__()
+        new_components = []
         for component in self:
             if isinstance(component, Container):
                 new_component = component._copy_with_children()
             else:
                 new_component = component.__copy__()
-            new_container.append(new_component)
+            new_components.append(new_component)
+        new_container._append_orphan_components(new_components)
         return new_container
 
     def _eject_contents(self):
@@ -556,6 +592,14 @@ class Container(Component):
         result = [indent + _ for _ in result]
         return result
 
+    def _format_content_lines(self):
+        import abjad
+        indent = abjad.LilyPondFormatManager.indent
+        for component in self.components:
+            for piece in component._iterate_lilypond_format():
+                for line in piece.split('\n'):
+                    yield indent + line
+
     def _format_contents_slot(self, bundle):
         result = []
         result.append(
@@ -764,6 +808,7 @@ class Container(Component):
         return spanners_receipt
 
     def _initialize_components(self, components):
+        import abjad
         if (isinstance(components, collections.Iterable) and
             not isinstance(components, str)):
             components_ = []
@@ -781,13 +826,24 @@ class Container(Component):
                     message = f'must be component: {component!r}.'
                     raise Exception(component)
         if self._all_are_orphan_components(components):
-            self._components = list(components)
-            self[:]._set_parents(self)
+            if len(set(id(_) for _ in components)) == len(components):
+                self._components = []
+                self._append_orphan_components(components)
+            else:
+                # repeated component keeps last position only
+                self._components = list(components)
+                self[:]._set_parents(self)
+                self._reindex_components()
         elif isinstance(components, str):
             parsed = self._parse_string(components)
             self._components = []
             self.is_simultaneous = parsed.is_simultaneous
             if (
+                parsed._parent is None and
+                not isinstance(parsed, abjad.Context)
+                ):
+                self._take_components(parsed)
+            elif (
                 parsed.is_simultaneous or
                 not select(parsed[:]).are_contiguous_logical_voice()
                 ):
@@ -815,6 +871,38 @@ class Container(Component):
             yield node
         return recurse(self)
 
+    def _iterate_format_pieces(self):
+        import abjad
+        abjad.Component._formatting += 1
+        try:
+            bundle = abjad.LilyPondFormatManager.bundle_format_contributions(
+                self)
+            before, after = [], []
+            before.extend(self._format_absolute_before_slot(bundle))
+            before.extend(self._format_before_slot(bundle))
+            before.extend(self._format_open_brackets_slot(bundle))
+            before.extend(self._format_opening_slot(bundle))
+            after.extend(self._format_closing_slot(bundle))
+            after.extend(self._format_close_brackets_slot(bundle))
+            after.extend(self._format_after_slot(bundle))
+            after.extend(self._format_absolute_after_slot(bundle))
+        finally:
+            abjad.Component._formatting -= 1
+        for contributor, contribution in before:
+            yield from contribution
+        yield from self._format_content_lines()
+        for contributor, contribution in after:
+            yield from contribution
+
+    def _iterate_lilypond_format(self):
+        self._update_now(indicators=True)
+        string = self._get_cached_format()
+        if string is not None:
+            yield string
+        else:
+            # streams contents without caching formatted string
+            yield from self._iterate_format_pieces()
+
     def _iterate_top_down(self):
         def recurse(node):
             yield node
@@ -870,6 +958,11 @@ class Container(Component):
             assert isinstance(parsed, Container)
         return parsed
 
+    def _reindex_components(self, start=0):
+        components = self._components
+        for i in range(start, len(components)):
+            components[i]._index_in_parent = i
+
     @staticmethod
     def _remove_powers_of_two(n):
         assert isinstance(n, int), repr(n)
@@ -948,6 +1041,8 @@ class Container(Component):
         self._components.__setitem__(slice(start, start), argument)
         for component in argument:
             component._set_parent(self)
+        # removals from self reindex from removal; argument moved left at most
+        self._reindex_components(max(0, start - len(argument)))
         for spanner, index in spanners_receipt:
             for component in reversed(argument):
                 # attach spanners only to leaves
@@ -1016,6 +1111,7 @@ class Container(Component):
             parent._components.__setitem__(slice(start, stop + 1), nonempty_halves)
             for part in nonempty_halves:
                 part._set_parent(parent)
+            parent._reindex_components(start)
         else:
             left._set_parent(None)
             right._set_parent(None)
@@ -1234,6 +1330,29 @@ class Container(Component):
         # return list-wrapped halves of container
         return [left_container], [right_container]
 
+    def _take_components(self, container):
+        """
+        Moves all components of orphan ``container`` to end of self with
+        one offset update and one pass of effective context updates.
+
+        Leaves ``container`` empty.
+
+        Not composer-safe.
+        """
+        import abjad
+        assert container._parent is None, repr(container)
+        assert not isinstance(container, abjad.Context), repr(container)
+        components = container._components
+        container._components = []
+        container._named_children.clear()
+        container._update_later(offsets=True)
+        for component in components:
+            component._parent = None
+        self._append_orphan_components(components)
+        for component in abjad.iterate(components).components():
+            for wrapper in component._wrappers:
+                wrapper._update_effective_context()
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1271,6 +1390,7 @@ class Container(Component):
     def identifier(self, argument):
         assert isinstance(argument, (str, type(None))), repr(argument)
         self._identifier: typing.Optional[str] = argument
+        self._format_later()
 
     @property
     def is_simultaneous(self) -> typing.Optional[bool]:
@@ -1363,6 +1483,7 @@ class Container(Component):
             raise ValueError(message)
         self._is_simultaneous = argument
         self._update_later(offsets=True)
+        self._update_descendants_later()
 
     @property
     def name(self) -> typing.Optional[str]:
@@ -1431,6 +1552,7 @@ class Container(Component):
                 else:
                     named_children[argument].append(self)
         self._name = argument
+        self._format_later()
 
     ### PUBLIC METHODS ###
 
@@ -1562,6 +1684,11 @@ class Container(Component):
             3
 
         """
+        if getattr(component, '_parent', None) is self:
+            i = component._index_in_parent
+            if i is not None and i < len(self._components):
+                if self._components[i] is component:
+                    return i
         for i, element in enumerate(self.components):
             if element is component:
                 return i
@@ -1700,6 +1827,7 @@ class Container(Component):
         assert isinstance(component, Component)
         component._set_parent(self)
         self._components.insert(i, component)
+        self._reindex_components()
         previous_leaf = component._get_leaf(-1)
         if previous_leaf:
             for spanner in inspect(previous_leaf).get_spanners():
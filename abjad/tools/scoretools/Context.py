@@ -1,3 +1,4 @@
+import bisect
 import copy
 from .Container import Container
 
@@ -32,6 +33,7 @@ class Context(Container):
     __slots__ = (
         '_lilypond_type',
         '_consists_commands',
+        '_dependent_wrapper_index',
         '_dependent_wrappers',
         '_remove_commands',
         )
@@ -71,6 +73,7 @@ class Context(Container):
         name=None,
         ):
         self._consists_commands = []
+        self._dependent_wrapper_index = {}
         self._dependent_wrappers = []
         self._remove_commands = []
         self.lilypond_type = lilypond_type
@@ -220,6 +223,47 @@ class Context(Container):
             result.append(string)
         return result
 
+    def _add_to_dependent_wrapper_index(self, wrapper):
+        """
+        Adds newly appended dependent ``wrapper`` to cached index.
+
+        Call only when offsets are current.
+        """
+        if wrapper.annotation:
+            return
+        for prototype, index in self._dependent_wrapper_index.items():
+            if not isinstance(wrapper.indicator, prototype):
+                continue
+            offsets, wrappers_by_offset = index
+            offset = wrapper.start_offset
+            if offset not in wrappers_by_offset:
+                bisect.insort(offsets, offset)
+            wrappers_by_offset.setdefault(offset, []).append(wrapper)
+
+    def _get_dependent_wrapper_index(self, prototype):
+        """
+        Gets sorted start offsets of dependent wrappers matching
+        ``prototype`` together with dictionary of wrappers by start offset.
+
+        Index is cached per prototype and cleared whenever dependent
+        wrappers change or offsets of context contents are updated.
+        """
+        try:
+            return self._dependent_wrapper_index[prototype]
+        except KeyError:
+            pass
+        wrappers_by_offset = {}
+        for wrapper in self._dependent_wrappers:
+            if wrapper.annotation:
+                continue
+            if isinstance(wrapper.indicator, prototype):
+                offset = wrapper.start_offset
+                wrappers_by_offset.setdefault(offset, []).append(wrapper)
+        offsets = sorted(wrappers_by_offset)
+        index = (offsets, wrappers_by_offset)
+        self._dependent_wrapper_index[prototype] = index
+        return index
+
     def _get_format_pieces(self):
         return self._format_component(pieces=True)
 
@@ -303,6 +347,7 @@ class Context(Container):
         else:
             argument = str(argument)
         self._lilypond_type = argument
+        self._format_later()
 
     @property
     def lilypond_context(self):
@@ -172,11 +172,13 @@ class GraceContainer(Container):
             raise TypeError(message)
         leaf._grace_container = self
         self._carrier = leaf
+        leaf._update_later(offsets=True)
 
     def _detach(self):
         if self._carrier is not None:
             carrier = self._carrier
             carrier._grace_container = None
+            carrier._update_later(offsets=True)
             self._carrier = None
         return self
 
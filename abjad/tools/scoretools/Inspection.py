@@ -972,6 +972,36 @@ class Inspection(abctools.AbjadObject):
                 direction=direction,
                 )
 
+    def get_measure_number(self):
+        """
+        Gets measure number.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4 g'2 a'2 b'4 c''4")
+            >>> abjad.attach(abjad.TimeSignature((2, 4)), staff[0])
+            >>> abjad.attach(abjad.TimeSignature((3, 4)), staff[4])
+            >>> abjad.show(staff) # doctest: +SKIP
+
+            >>> for leaf in staff:
+            ...     leaf, abjad.inspect(leaf).get_measure_number()
+            ...
+            (Note("c'4"), 1)
+            (Note("d'4"), 1)
+            (Note("e'4"), 2)
+            (Note("f'4"), 2)
+            (Note("g'2"), 3)
+            (Note("a'2"), 3)
+            (Note("b'4"), 4)
+            (Note("c''4"), 4)
+
+        Counts measures from time signatures; defaults to 4/4.
+
+        Returns positive integer.
+        """
+        if hasattr(self.client, '_get_measure_number'):
+            return self.client._get_measure_number()
+
     def get_parentage(self, include_self=True, grace_notes=False):
         r"""
         Gets parentage.
@@ -1689,6 +1719,7 @@ class Inspection(abctools.AbjadObject):
         check_empty_containers=True,
         check_misdurated_measures=True,
         check_misfilled_measures=True,
+        check_misindexed_components=True,
         check_mismatched_enchained_hairpins=True,
         check_mispitched_ties=True,
         check_misrepresented_flags=True,
@@ -1870,6 +1901,7 @@ class Inspection(abctools.AbjadObject):
         check_empty_containers=True,
         check_misdurated_measures=True,
         check_misfilled_measures=True,
+        check_misindexed_components=True,
         check_mismatched_enchained_hairpins=True,
         check_mispitched_ties=True,
         check_misrepresented_flags=True,
@@ -1918,6 +1950,7 @@ class Inspection(abctools.AbjadObject):
             0 /	1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	5 misindexed components
             0 /	0 mismatched enchained hairpins
             0 /	0 mispitched ties
             0 /	4 misrepresented flags
@@ -1956,6 +1989,7 @@ class Inspection(abctools.AbjadObject):
             0 /	1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	5 misindexed components
             0 /	0 mismatched enchained hairpins
             0 /	0 mispitched ties
             0 /	4 misrepresented flags
@@ -935,6 +935,89 @@ class Iteration(abctools.AbjadObject):
                         ):
                         yield component
 
+    def effective(self, prototype=None, grace_notes=None, reverse=False):
+        r"""
+        Iterates leaves together with effective indicators.
+
+        ..  container:: example
+
+            Iterates effective clefs:
+
+            ..  container:: example
+
+                >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+                >>> abjad.attach(abjad.Clef('alto'), staff[0])
+                >>> abjad.attach(abjad.Clef('bass'), staff[2])
+                >>> abjad.show(staff) # doctest: +SKIP
+
+                ..  docs::
+
+                    >>> abjad.f(staff)
+                    \new Staff
+                    {
+                        \clef "alto"
+                        c'4
+                        d'4
+                        \clef "bass"
+                        e'4
+                        f'4
+                    }
+
+            ..  container:: example
+
+                >>> for pair in abjad.iterate(staff).effective(abjad.Clef):
+                ...     pair
+                ...
+                (Note("c'4"), Clef('alto'))
+                (Note("d'4"), Clef('alto'))
+                (Note("e'4"), Clef('bass'))
+                (Note("f'4"), Clef('bass'))
+
+        ..  container:: example
+
+            Iterates effective dynamics in reverse:
+
+            ..  container:: example
+
+                >>> voice = abjad.Voice("c'4 d'4 e'4 f'4")
+                >>> abjad.attach(abjad.Dynamic('p'), voice[1])
+                >>> abjad.show(voice) # doctest: +SKIP
+
+                ..  docs::
+
+                    >>> abjad.f(voice)
+                    \new Voice
+                    {
+                        c'4
+                        d'4
+                        \p
+                        e'4
+                        f'4
+                    }
+
+            ..  container:: example
+
+                >>> for pair in abjad.iterate(voice).effective(
+                ...     abjad.Dynamic,
+                ...     reverse=True,
+                ...     ):
+                ...     pair
+                ...
+                (Note("f'4"), Dynamic('p'))
+                (Note("e'4"), Dynamic('p'))
+                (Note("d'4"), Dynamic('p'))
+                (Note("c'4"), None)
+
+        Streams leaves in one pass; each lookup bisects cached per-context
+        indices of start offsets instead of rescanning context indicators.
+
+        Returns generator of (leaf, indicator) pairs.
+        """
+        leaves = self.leaves(grace_notes=grace_notes, reverse=reverse)
+        for leaf in leaves:
+            indicator = leaf._get_effective(prototype)
+            yield leaf, indicator
+
     def leaf_pairs(self):
         r"""
         Iterates leaf pairs.
@@ -2433,80 +2516,7 @@ class Iteration(abctools.AbjadObject):
         Returns generator.
         '''
         import abjad
-        def _buffer_components_starting_with(component, buffer, stop_offsets):
-            buffer.append(component)
-            stop_offset = abjad.inspect(component).get_timespan().stop_offset
-            stop_offsets.append(stop_offset)
-            if isinstance(component, abjad.Container):
-                if component.is_simultaneous:
-                    for component_ in component:
-                        _buffer_components_starting_with(
-                            component_,
-                            buffer,
-                            stop_offsets,
-                            )
-                elif component:
-                    _buffer_components_starting_with(
-                        component[0],
-                        buffer,
-                        stop_offsets,
-                        )
-        def _iterate_vertical_moments(argument):
-            governors = (argument,)
-            current_offset, stop_offsets, buffer = abjad.Offset(0), [], []
-            _buffer_components_starting_with(argument, buffer, stop_offsets)
-            while buffer:
-                vertical_moment = abjad.VerticalMoment()
-                offset = abjad.Offset(current_offset)
-                components = list(buffer)
-                components.sort(
-                    key=lambda _: abjad.inspect(_).get_parentage().score_index
-                    )
-                vertical_moment._offset = offset
-                vertical_moment._governors = governors
-                vertical_moment._components = components
-                yield vertical_moment
-                current_offset, stop_offsets = min(stop_offsets), []
-                _update_buffer(current_offset, buffer, stop_offsets)
-        def _next_in_parent(component):
-            assert isinstance(component, abjad.Component), repr(component)
-            selection = abjad.select(component)
-            result = selection._get_parent_and_start_stop_indices()
-            parent, start, stop = result
-            assert start == stop
-            if parent is None:
-                raise StopIteration
-            if parent.is_simultaneous:
-                raise StopIteration
-            try:
-                return parent[start + 1]
-            except IndexError:
-                raise StopIteration
-        def _update_buffer(current_offset, buffer, stop_offsets):
-            for component in buffer[:]:
-                offset = abjad.inspect(component).get_timespan().stop_offset
-                if offset <= current_offset:
-                    buffer.remove(component)
-                    try:
-                        next_component = _next_in_parent(component)
-                        _buffer_components_starting_with(
-                            next_component,
-                            buffer,
-                            stop_offsets,
-                            )
-                    except StopIteration:
-                        pass
-                else:
-                    stop_offsets.append(offset)
-        if not reverse:
-            for x in _iterate_vertical_moments(self.client):
-                yield x
-        else:
-            moments_in_governor = []
-            for component in self.components():
-                offset = abjad.inspect(component).get_timespan().start_offset
-                if offset not in moments_in_governor:
-                    moments_in_governor.append(offset)
-            moments_in_governor.sort()
-            for moment_in_governor in reversed(moments_in_governor):
-                yield self.client._get_vertical_moment_at(moment_in_governor)
+        return abjad.VerticalMoment._iterate_vertical_moments(
+            self.client,
+            reverse=reverse,
+            )
@@ -3911,7 +3911,10 @@ class Label(abctools.AbjadObject):
             prototype = prototype()
         assert isinstance(prototype, abjad.SetClass), repr(prototype)
         for selection in self._client:
-            pitch_class_set = abjad.PitchClassSet.from_selection(selection)
+            pitch_class_set = abjad.PitchClassSet.from_selection(
+                selection,
+                item_class=abjad.NumberedPitchClass,
+                )
             if not pitch_class_set:
                 continue
             set_class = abjad.SetClass.from_pitch_class_set(
@@ -91,6 +91,7 @@ class Leaf(Component):
         if id(spanner) in [id(_) for _ in self._spanners]:
             return
         self._spanners.append(spanner)
+        self._format_later()
 
     def _as_graphviz_node(self):
         lilypond_format = self._get_compact_representation()
@@ -394,6 +395,7 @@ class Leaf(Component):
             raise Exception(f'{self!s} has no {spanner}.')
         spanners = [_ for _ in self._spanners if id(_) != id(spanner)]
         self._spanners = spanners
+        self._format_later()
 
     def _report_format_contributions(self):
         manager = LilyPondFormatManager
@@ -710,3 +712,4 @@ class Leaf(Component):
             message = message.format(rational)
             raise AssignabilityError(message)
         self._written_duration = rational
+        self._update_later(offsets=True)
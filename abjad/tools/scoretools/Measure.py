@@ -49,7 +49,7 @@ class Measure(Container):
         self._automatically_adjust_time_signature = False
         time_signature = time_signature or abjad.TimeSignature((4, 4))
         time_signature = abjad.TimeSignature(time_signature)
-        self.implicit_scaling = bool(implicit_scaling)
+        self._implicit_scaling = bool(implicit_scaling)
         Container.__init__(self, components, identifier=identifier)
         self._always_format_time_signature = False
         self._measure_number = None
@@ -300,28 +300,13 @@ class Measure(Container):
         else:
             return abjad.TimeSignature(duration)
 
+    def _format_content_lines(self):
+        lines = Container._format_content_lines(self)
+        return self._scale_content_lines(lines)
+
     def _format_content_pieces(self):
-        import abjad
-        result = []
-        if (self.has_non_power_of_two_denominator and
-            type(self) is Measure and
-            self.implicit_scaling):
-            indent = abjad.LilyPondFormatManager.indent
-            string = "{}\\scaleDurations #'({} . {}) {{"
-            string = string.format(
-                indent,
-                self.implied_prolation.numerator,
-                self.implied_prolation.denominator,
-                )
-            result.append(string)
-            pieces = Container._format_content_pieces(self)
-            pieces = [indent + _ for _ in pieces]
-            result.extend(pieces)
-            result.append(indent + '}')
-        else:
-            result.extend(
-                Container._format_content_pieces(self))
-        return result
+        pieces = Container._format_content_pieces(self)
+        return list(self._scale_content_lines(pieces))
 
     def _format_opening_slot(self, bundle):
         result = []
@@ -398,6 +383,29 @@ class Measure(Container):
         contents_multiplier = abjad.Multiplier(*pair)
         self._scale_contents(contents_multiplier)
 
+    def _iterate_lilypond_format(self):
+        self._check_duration()
+        yield from Container._iterate_lilypond_format(self)
+
+    def _scale_content_lines(self, lines):
+        import abjad
+        if (self.has_non_power_of_two_denominator and
+            type(self) is Measure and
+            self.implicit_scaling):
+            indent = abjad.LilyPondFormatManager.indent
+            string = "{}\\scaleDurations #'({} . {}) {{"
+            string = string.format(
+                indent,
+                self.implied_prolation.numerator,
+                self.implied_prolation.denominator,
+                )
+            yield string
+            for line in lines:
+                yield indent + line
+            yield indent + '}'
+        else:
+            yield from lines
+
     def _scale_denominator(self, factor):
         import abjad
         # save old time signature duration
@@ -442,6 +450,7 @@ class Measure(Container):
     def always_format_time_signature(self, argument):
         assert isinstance(argument, bool)
         self._always_format_time_signature = argument
+        self._format_later()
 
     @property
     def automatically_adjust_time_signature(self):
@@ -468,6 +477,7 @@ class Measure(Container):
     def automatically_adjust_time_signature(self, argument):
         assert isinstance(argument, bool)
         self._automatically_adjust_time_signature = argument
+        self._format_later()
 
     @property
     def has_non_power_of_two_denominator(self):
@@ -541,6 +551,8 @@ class Measure(Container):
     def implicit_scaling(self, argument):
         assert isinstance(argument, bool)
         self._implicit_scaling = argument
+        self._update_later(offsets=True)
+        self._update_descendants_later()
 
     @property
     def implied_prolation(self):
@@ -698,7 +710,7 @@ class Measure(Container):
 
         Returns positive integer.
         """
-        self._update_now(offsets=True)
+        self._update_now(measure_numbers=True)
         return self._measure_number
 
     @property
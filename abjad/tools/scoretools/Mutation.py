@@ -730,6 +730,7 @@ class Mutation(abctools.AbjadObject):
             context = wrapper._find_correct_effective_context()
             if context is not None:
                 context._dependent_wrappers.append(wrapper)
+                context._dependent_wrapper_index.clear()
 
     # TODO: fix bug in function that causes tied notes to become untied
     def replace_measure_contents(self, new_contents):
@@ -3608,8 +3609,10 @@ class Mutation(abctools.AbjadObject):
             raise Exception(message)
         container._components = list(selection)
         container[:]._set_parents(container)
+        container._reindex_components()
         if parent is not None:
             parent._components.insert(start, container)
+            parent._reindex_components(start)
             container._set_parent(parent)
         for component in selection:
             for wrapper in component._wrappers:
@@ -37,10 +37,8 @@ class Note(Leaf):
         from abjad.ly import drums
         assert len(arguments) in (0, 1, 2)
         if len(arguments) == 1 and isinstance(arguments[0], str):
-            string = '{{ {} }}'.format(arguments[0])
-            parsed = abjad.parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            arguments = [parsed[0]]
+            parsed = abjad.lilypondparsertools._parse_leaf(arguments[0])
+            arguments = [parsed]
         is_cautionary = False
         is_forced = False
         is_parenthesized = False
@@ -70,7 +68,8 @@ class Note(Leaf):
             raise ValueError(message.format(arguments))
         Leaf.__init__(self, written_duration)
         if written_pitch is not None:
-            if written_pitch not in drums:
+            if (not isinstance(written_pitch, str) or
+                written_pitch not in drums):
                 self.note_head = NoteHead(
                     written_pitch=written_pitch,
                     is_cautionary=is_cautionary,
@@ -174,10 +173,12 @@ class Note(Leaf):
         if isinstance(argument, type(None)):
             self._note_head = None
         elif isinstance(argument, NoteHead):
+            argument._client = self
             self._note_head = argument
         else:
             note_head = NoteHead(client=self, written_pitch=argument)
             self._note_head = note_head
+        self._format_later()
 
     @property
     def written_duration(self) -> Duration:
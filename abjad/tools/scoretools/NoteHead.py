@@ -190,6 +190,11 @@ class NoteHead(AbjadObject):
 
     ### PRIVATE METHODS ###
 
+    def _format_client_later(self):
+        import abjad
+        if isinstance(self._client, abjad.Component):
+            self._client._format_later()
+
     def _get_format_specification(self):
         arguments = [repr(str(self))]
         arguments.extend(self.tweaks._get_attribute_pairs())
@@ -328,6 +333,7 @@ class NoteHead(AbjadObject):
             assert isinstance(argument[1], str), repr(argument)
             assert isinstance(argument[2], str), repr(argument)
         self._alternative = argument
+        self._format_client_later()
 
     @property
     def client(self):
@@ -377,6 +383,7 @@ class NoteHead(AbjadObject):
         if argument is not None:
             argument = bool(argument)
         self._is_cautionary = argument
+        self._format_client_later()
 
     @property
     def is_forced(self) -> bool:
@@ -411,6 +418,7 @@ class NoteHead(AbjadObject):
         if argument is not None:
             argument = bool(argument)
         self._is_forced = argument
+        self._format_client_later()
 
     @property
     def is_parenthesized(self) -> bool:
@@ -447,6 +455,7 @@ class NoteHead(AbjadObject):
         if argument is not None:
             argument = bool(argument)
         self._is_parenthesized = argument
+        self._format_client_later()
 
     @property
     def named_pitch(self) -> NamedPitch:
@@ -502,7 +511,8 @@ class NoteHead(AbjadObject):
 
     @written_pitch.setter
     def written_pitch(self, argument):
-        written_pitch = NamedPitch(argument)
+        written_pitch = NamedPitch._intern(argument)
         self._written_pitch = written_pitch
         if self.alternative is not None:
             self.alternative[0].written_pitch = written_pitch
+        self._format_client_later()
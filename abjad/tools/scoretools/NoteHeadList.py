@@ -75,8 +75,10 @@ class NoteHeadList(TypedList):
 
     def _on_insertion(self, item):
         item._client = self.client
+        item._format_client_later()
 
     def _on_removal(self, item):
+        item._format_client_later()
         item._client = None
 
     ### PRIVATE PROPERTIES ##
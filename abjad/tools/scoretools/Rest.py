@@ -33,10 +33,8 @@ class Rest(Leaf):
         import abjad
         original_input = written_duration
         if isinstance(written_duration, str):
-            string = f'{{ {written_duration} }}'
-            parsed = abjad.parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            written_duration = parsed[0]
+            parsed = abjad.lilypondparsertools._parse_leaf(written_duration)
+            written_duration = parsed
         if isinstance(written_duration, Leaf):
             written_duration = written_duration.written_duration
         elif written_duration is None:
@@ -595,42 +595,41 @@ class Selection(AbjadValueObject, collections.Sequence):
                 new_component = component.__copy__()
             new_components.append(new_component)
         new_components = type(self)(new_components)
+        # old and new components correspond one-to-one in score order
+        old_components = list(iterate(self).components())
+        new_components_ = list(iterate(new_components).components())
+        assert len(old_components) == len(new_components_)
+        component_to_index = {}
+        for i, component in enumerate(old_components):
+            component_to_index[id(component)] = i
         # find spanners and piecewise indicators
-        spanner_to_pairs = abjad.OrderedDict()
-        for i, component in enumerate(iterate(self).components()):
-            for spanner in abjad_inspect(component).get_spanners():
-                pairs = spanner_to_pairs.setdefault(spanner, [])
-                wrappers = []
-                for wrapper in abjad_inspect(component).wrappers():
-                    if wrapper.spanner is spanner:
+        spanners, spanner_to_wrappers = [], {}
+        for component in old_components:
+            for spanner in getattr(component, '_spanners', ()):
+                if id(spanner) not in spanner_to_wrappers:
+                    spanners.append(spanner)
+                    spanner_to_wrappers[id(spanner)] = []
+            for wrapper in component._wrappers:
+                if wrapper.spanner is not None:
+                    wrappers = spanner_to_wrappers.get(id(wrapper.spanner))
+                    if wrappers is not None:
                         wrappers.append(wrapper)
-                if wrappers:
-                    for wrapper in wrappers:
-                        pairs.append((i, wrapper))
-                else:
-                    pairs.append((i, None))
-        # copy spanners
-        new_spanner_to_pairs = abjad.OrderedDict()
-        for spanner, pairs in spanner_to_pairs.items():
+        # copy spanners without attach-time checks
+        for spanner in spanners:
             new_spanner = copy.copy(spanner)
-            new_spanner_to_pairs[new_spanner] = pairs
-        # make reversed map
-        index_to_pairs = abjad.OrderedDict()
-        for new_spanner, pairs in new_spanner_to_pairs.items():
-            for (i, wrapper) in pairs:
-                pairs = index_to_pairs.setdefault(i, [])
-                pair = (new_spanner, wrapper)
-                pairs.append(pair)
-        # add new components to new spanners
-        new_components_ = iterate(new_components).components()
-        for i, new_component in enumerate(new_components_):
-            for pair in index_to_pairs.get(i, []):
-                new_spanner, wrapper = pair
-                if new_component not in new_spanner:
-                    new_spanner._append(new_component)
-                if wrapper is not None:
-                    wrapper = copy.copy(wrapper)
-                    new_spanner.attach(wrapper, new_component)
+            for leaf in spanner.leaves:
+                i = component_to_index.get(id(leaf))
+                if i is None:
+                    continue
+                new_leaf = new_components_[i]
+                new_leaf._append_spanner(new_spanner)
+                new_spanner._leaves.append(new_leaf)
+            for wrapper in spanner_to_wrappers[id(spanner)]:
+                i = component_to_index[id(wrapper.component)]
+                new_wrapper = copy.copy(wrapper)
+                new_wrapper._spanner = new_spanner
+                new_components_[i]._bind_copied_wrapper(new_wrapper)
+                new_spanner._wrappers.append(new_wrapper)
         return new_components
 
     def _fuse(self):
@@ -892,6 +891,7 @@ class Selection(AbjadValueObject, collections.Sequence):
             components.extend(getattr(component, 'components', ()))
         container._components.extend(components)
         container[:]._set_parents(container)
+        container._reindex_components()
 
     def _give_dominant_spanners(self, recipients):
         """
@@ -921,6 +921,7 @@ class Selection(AbjadValueObject, collections.Sequence):
         parent, start, stop = self._get_parent_and_start_stop_indices()
         if parent is not None:
             parent._components.__setitem__(slice(start, start), [container])
+            parent._reindex_components(start)
             container._set_parent(parent)
             self._set_parents(None)
 
@@ -1083,7 +1084,7 @@ class Selection(AbjadValueObject, collections.Sequence):
             spanner_components = crossing_spanner.leaves[:]
             for component in components_including_children:
                 if component in spanner_components:
-                    crossing_spanner._leaves.remove(component)
+                    crossing_spanner._remove_leaf(component)
                     component._remove_spanner(crossing_spanner)
 
     ### PUBLIC PROPERTIES ###
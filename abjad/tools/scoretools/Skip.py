@@ -31,10 +31,7 @@ class Skip(Leaf):
         input_leaf = None
         written_duration = None
         if len(arguments) == 1 and isinstance(arguments[0], str):
-            string = f'{{ {arguments[0]} }}'
-            parsed = abjad.parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            input_leaf = parsed[0]
+            input_leaf = abjad.lilypondparsertools._parse_leaf(arguments[0])
             written_duration = input_leaf.written_duration
         elif len(arguments) == 1 and isinstance(arguments[0], Leaf):
             written_duration = arguments[0].written_duration
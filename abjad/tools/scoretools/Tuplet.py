@@ -395,6 +395,7 @@ class Tuplet(Container):
         elif not isinstance(argument, type(None)):
             raise TypeError(argument)
         self._denominator = argument
+        self._format_later()
 
     @property
     def force_fraction(self) -> typing.Optional[bool]:
@@ -575,6 +576,7 @@ class Tuplet(Container):
     def force_fraction(self, argument):
         if isinstance(argument, (bool, type(None))):
             self._force_fraction = argument
+            self._format_later()
         else:
             message = f'force fraction must be boolean (not {argument!r}).'
             raise TypeError(message)
@@ -653,6 +655,7 @@ class Tuplet(Container):
     def hide(self, argument):
         assert isinstance(argument, (bool, type(None))), repr(argument)
         self._hide = argument
+        self._format_later()
 
     @property
     def implied_prolation(self) -> Multiplier:
@@ -736,6 +739,8 @@ class Tuplet(Container):
             raise ValueError(message)
         if 0 < rational:
             self._multiplier = rational
+            self._update_later(offsets=True)
+            self._update_descendants_later()
         else:
             message = f'tuplet multiplier must be positive: {argument!r}.'
             raise ValueError(message)
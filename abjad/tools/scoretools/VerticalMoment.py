@@ -1,4 +1,5 @@
 import collections
+import math
 from abjad.tools import abctools
 
 
@@ -146,15 +147,11 @@ class VerticalMoment(abctools.AbjadObject):
         while lo < hi:
             mid = (lo + hi) // 2
             start_offset = abjad.inspect(container[mid]).get_timespan().start_offset
-            stop_offset = abjad.inspect(container[mid]).get_timespan().stop_offset
-            if start_offset <= offset < stop_offset:
+            # zero-duration components precede sibling starting at offset
+            if start_offset <= offset:
                 lo = mid + 1
-            # if container[mid] is of nonzero duration
-            elif start_offset < stop_offset:
-                hi = mid
-            # container[mid] is of zero duration so we skip it
             else:
-                lo = mid + 1
+                hi = mid
         return lo - 1
 
     @staticmethod
@@ -189,6 +186,78 @@ class VerticalMoment(abctools.AbjadObject):
         import abjad
         return abjad.FormatSpecification(client=self)
 
+    @staticmethod
+    def _iterate_vertical_moments(argument, reverse=False):
+        """
+        Sweeps table of start and stop events in ``argument``.
+
+        Scales offsets to integers over common denominator before sorting.
+        """
+        import abjad
+        assert isinstance(argument, abjad.Component), repr(argument)
+        argument._update_now(offsets=True)
+        components, timespans, stack = [], [], [argument]
+        # depth-first order is score index order
+        while stack:
+            component = stack.pop()
+            components.append(component)
+            timespans.append(component._timespan)
+            if isinstance(component, abjad.Container):
+                stack.extend(reversed(component._components))
+        denominator = 1
+        for timespan in timespans:
+            for offset in (timespan.start_offset, timespan.stop_offset):
+                gcd = math.gcd(denominator, offset.denominator)
+                denominator = denominator // gcd * offset.denominator
+        events, offsets = [], {}
+        for rank, timespan in enumerate(timespans):
+            for kind, offset in enumerate(
+                (timespan.start_offset, timespan.stop_offset)):
+                key = offset.numerator * (denominator // offset.denominator)
+                offsets[key] = offset
+                events.append((key, kind, rank))
+        events.sort()
+        governors = (argument,)
+        start_offset, stop_offset = events[0][0], events[-1][0]
+        active = {}
+        if not reverse:
+            keys = set(_[0] for _ in events if _[1] == 1)
+            keys = [_ for _ in keys if start_offset < _ < stop_offset]
+            keys = [start_offset] + sorted(keys)
+            i = 0
+            for key in keys:
+                while i < len(events) and events[i][0] <= key:
+                    rank = events[i][2]
+                    if events[i][1] == 0:
+                        active[rank] = components[rank]
+                    else:
+                        del active[rank]
+                    i += 1
+                vertical_moment = abjad.VerticalMoment()
+                vertical_moment._offset = abjad.Offset(offsets[key])
+                vertical_moment._governors = governors
+                vertical_moment._components = [
+                    active[_] for _ in sorted(active)]
+                yield vertical_moment
+        else:
+            keys = set(_[0] for _ in events if _[1] == 0)
+            keys = sorted(keys, reverse=True)
+            i = len(events) - 1
+            for key in keys:
+                while 0 <= i and key < events[i][0]:
+                    rank = events[i][2]
+                    if events[i][1] == 1:
+                        active[rank] = components[rank]
+                    else:
+                        del active[rank]
+                    i -= 1
+                vertical_moment = abjad.VerticalMoment()
+                vertical_moment._offset = abjad.Offset(offsets[key])
+                vertical_moment._governors = governors
+                vertical_moment._components = tuple(
+                    active[_] for _ in sorted(active))
+                yield vertical_moment
+
     @staticmethod
     def _recurse(component, offset):
         import abjad
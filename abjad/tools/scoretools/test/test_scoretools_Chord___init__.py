@@ -243,3 +243,15 @@ def test_scoretools_Chord___init___21():
     chord = abjad.Chord("<sn? bd! tamb>4")
 
     assert format(chord) == '<bassdrum! snare? tambourine>4'
+
+
+def test_scoretools_Chord___init___22():
+    """
+    Initialize chord from single-leaf string with leaf tokenizer and full
+    LilyPond parser alike.
+    """
+
+    for string in ("<c'! e'? g'>8.", "<  cs, bf''  >", "c'16"):
+        chord = abjad.Chord(string)
+        parsed = abjad.Chord(abjad.parse(f'{{ {string} }}')[0])
+        assert format(chord) == format(parsed)
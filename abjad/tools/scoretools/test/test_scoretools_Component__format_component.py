@@ -0,0 +1,211 @@
+import abjad
+
+
+def test_scoretools_Component__format_component_01():
+    """
+    Formats unmodified score from cache.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Slur(), staff[:])
+    string = format(staff)
+
+    assert all(_._format_cache is not None for _ in staff)
+    assert format(staff) is string
+
+
+def test_scoretools_Component__format_component_02():
+    """
+    Attaching and detaching indicators invalidates cached format.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    format(staff)
+    articulation = abjad.Articulation('accent')
+    abjad.attach(articulation, staff[1])
+
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            c'8
+            d'8
+            -\accent
+            e'8
+            f'8
+        }
+        """
+        )
+
+    abjad.detach(articulation, staff[1])
+
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            c'8
+            d'8
+            e'8
+            f'8
+        }
+        """
+        )
+
+
+def test_scoretools_Component__format_component_03():
+    """
+    Overrides, settings, tweaks and pitch changes invalidate cached format.
+    """
+
+    staff = abjad.Staff("c'8 <d' f'>8 e'8 f'8")
+    format(staff)
+    abjad.override(staff[0]).note_head.color = 'red'
+    assert 'red' in format(staff)
+    abjad.setting(staff).instrument_name = abjad.Markup('Flute')
+    assert 'Flute' in format(staff)
+    abjad.tweak(staff[1].note_heads[0]).color = 'blue'
+    assert 'blue' in format(staff)
+    staff[2].written_pitch = "ef'"
+    assert "ef'8" in format(staff)
+    staff[3].note_head.written_pitch = "g'"
+
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        \with
+        {
+            instrumentName = \markup { Flute }
+        }
+        {
+            \once \override NoteHead.color = #red
+            c'8
+            <
+                \tweak color #blue
+                d'
+                f'
+            >8
+            ef'8
+            g'8
+        }
+        """
+        )
+
+
+def test_scoretools_Component__format_component_04():
+    """
+    Structural changes invalidate cached format of old and new score.
+    """
+
+    staff_1 = abjad.Staff("c'8 d'8")
+    staff_2 = abjad.Staff("e'8 f'8")
+    format(staff_1)
+    format(staff_2)
+    staff_2.append(staff_1[0])
+
+    assert format(staff_1) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            d'8
+        }
+        """
+        )
+
+    assert format(staff_2) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            e'8
+            f'8
+            c'8
+        }
+        """
+        )
+
+
+def test_scoretools_Component__format_component_05():
+    """
+    Tweaking attached indicator invalidates cached format.
+    """
+
+    staff = abjad.Staff("c'8 d'8")
+    markup = abjad.Markup('hi', direction=abjad.Up)
+    abjad.attach(markup, staff[0])
+    format(staff)
+    abjad.tweak(markup).color = 'red'
+
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            c'8
+            - \tweak color #red
+            ^ \markup { hi }
+            d'8
+        }
+        """
+        )
+
+
+def test_scoretools_Component__format_component_06():
+    """
+    Writing to held override, setting and tweak managers invalidates cached
+    format.
+    """
+
+    staff = abjad.Staff("c'8 d'8 <e' g'>8")
+    manager = abjad.override(staff[0])
+    note_head = abjad.override(staff[1]).note_head
+    setting = abjad.setting(staff)
+    tweaks = abjad.tweak(staff[2].note_heads[0])
+    format(staff)
+    manager.stem.color = 'blue'
+    note_head.color = 'red'
+    setting.instrument_name = abjad.Markup('Flute')
+    tweaks.color = 'green'
+
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        \with
+        {
+            instrumentName = \markup { Flute }
+        }
+        {
+            \once \override Stem.color = #blue
+            c'8
+            \once \override NoteHead.color = #red
+            d'8
+            <
+                \tweak color #green
+                e'
+                g'
+            >8
+        }
+        """
+        )
+
+
+def test_scoretools_Component__format_component_07():
+    """
+    Writing to tweak manager held before attach invalidates cached format.
+    """
+
+    staff = abjad.Staff("c'8 d'8")
+    markup = abjad.Markup('hi', direction=abjad.Up)
+    tweaks = abjad.tweak(markup)
+    abjad.attach(markup, staff[0])
+    format(staff)
+    tweaks.color = 'red'
+
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            c'8
+            - \tweak color #red
+            ^ \markup { hi }
+            d'8
+        }
+        """
+        )
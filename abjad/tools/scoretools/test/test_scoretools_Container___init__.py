@@ -84,3 +84,65 @@ def test_scoretools_Container___init___04():
         }
         """
         )
+
+
+def test_scoretools_Container___init___05():
+    """
+    Initialize container with string; named contexts remain addressable.
+    """
+
+    container = abjad.Container(
+        r'''\context Staff = "Violin" { c'4 d'4 } e'4'''
+        )
+    staff = container['Violin']
+
+    assert isinstance(staff, abjad.Staff)
+    assert staff._parent is container
+    assert staff[0]._parent is staff
+    assert abjad.inspect(container).is_well_formed()
+
+
+def test_scoretools_Container___init___06():
+    """
+    Initialize container with string; offsets reflect tuplet prolation and
+    indicators know their effective context.
+    """
+
+    staff = abjad.Staff(r"\clef bass c4 \times 2/3 { d8 e8 f8 }")
+    leaves = abjad.select(staff).leaves()
+    offsets = [abjad.inspect(_).get_timespan().start_offset for _ in leaves]
+    clef = abjad.inspect(leaves[-1]).get_effective(abjad.Clef)
+
+    assert offsets == [
+        abjad.Offset(0),
+        abjad.Offset(1, 4),
+        abjad.Offset(1, 3),
+        abjad.Offset(5, 12),
+        ]
+    assert clef == abjad.Clef('bass')
+    assert abjad.inspect(staff).is_well_formed()
+
+
+def test_scoretools_Container___init___07():
+    """
+    Initialize container with repeated component; component keeps last
+    position only.
+    """
+
+    tuplet = abjad.Tuplet((2, 3), "c'8 d'8 e'8")
+    note = abjad.Note("f'4")
+    container = abjad.Container([tuplet, note, tuplet])
+
+    assert format(container) == abjad.String.normalize(
+        r"""
+        {
+            f'4
+            \times 2/3 {
+                c'8
+                d'8
+                e'8
+            }
+        }
+        """
+        )
+    assert abjad.inspect(container).is_well_formed()
@@ -12,3 +12,35 @@ def test_scoretools_Container_index_01():
     assert container.index(container[1]) == 1
     assert container.index(container[2]) == 2
     assert container.index(container[3]) == 3
+
+
+def test_scoretools_Container_index_02():
+    """
+    Indices follow insertion, deletion, popping and wrapping.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8 g'8 a'8")
+    note = abjad.Note("b'8")
+    staff.insert(0, note)
+    del(staff[2])
+    staff.pop(3)
+    abjad.mutate(staff[1:3]).wrap(abjad.Tuplet((2, 3), []))
+    staff.insert(1, abjad.Rest('r8'), fracture_spanners=True)
+
+    assert [staff.index(_) for _ in staff] == [0, 1, 2, 3, 4]
+    assert [staff[2].index(_) for _ in staff[2]] == [0, 1]
+    assert abjad.inspect(staff).is_well_formed()
+
+
+def test_scoretools_Container_index_03():
+    """
+    Moving component to end of container reindexes container.
+    """
+
+    container = abjad.Container("c'4 d'4 e'4 f'4")
+    note = container[0]
+    container.append(note)
+
+    assert container.index(note) == 3
+    assert [container.index(_) for _ in container] == [0, 1, 2, 3]
+    assert abjad.inspect(container).is_well_formed()
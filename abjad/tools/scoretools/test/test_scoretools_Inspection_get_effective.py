@@ -0,0 +1,58 @@
+import abjad
+
+
+def test_scoretools_Inspection_get_effective_01():
+    """
+    Effective clef updates after inserting leaves in front of clef.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('bass'), staff[2])
+    assert abjad.inspect(staff[1]).get_effective(abjad.Clef) is None
+    assert abjad.inspect(staff[2]).get_effective(abjad.Clef) == abjad.Clef('bass')
+
+    staff.insert(0, abjad.Note("c'4"))
+
+    assert abjad.inspect(staff[2]).get_effective(abjad.Clef) is None
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == abjad.Clef('bass')
+    assert abjad.inspect(staff[0]).get_effective(abjad.Clef, n=1) == abjad.Clef('bass')
+
+
+def test_scoretools_Inspection_get_effective_02():
+    """
+    Effective clef updates after attach and detach.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('alto'), staff[0])
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == abjad.Clef('alto')
+
+    abjad.attach(abjad.Clef('bass'), staff[2])
+    assert abjad.inspect(staff[1]).get_effective(abjad.Clef) == abjad.Clef('alto')
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == abjad.Clef('bass')
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef, n=-1) == abjad.Clef('alto')
+
+    abjad.detach(abjad.Clef, staff[2])
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == abjad.Clef('alto')
+
+
+def test_scoretools_Inspection_get_effective_03():
+    """
+    Effective clef is shared across voices in same staff.
+    """
+
+    voice_1 = abjad.Voice("c''8 d''8 e''8 f''8")
+    voice_2 = abjad.Voice("c'4 d'4")
+    staff = abjad.Staff([voice_1, voice_2], is_simultaneous=True)
+    abjad.attach(abjad.Clef('treble'), voice_1[0])
+    abjad.attach(abjad.Clef('bass'), voice_2[1])
+
+    clefs = [abjad.inspect(_).get_effective(abjad.Clef) for _ in voice_1]
+    assert clefs == [
+        abjad.Clef('treble'),
+        abjad.Clef('treble'),
+        abjad.Clef('bass'),
+        abjad.Clef('bass'),
+        ]
+    assert abjad.inspect(staff).get_effective(abjad.Clef) == \
+        abjad.Clef('treble')
@@ -0,0 +1,33 @@
+import abjad
+
+
+def test_scoretools_Inspection_get_measure_number_01():
+    """
+    Measure numbers follow time signatures attached after first lookup.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4")
+    assert abjad.inspect(staff[-1]).get_measure_number() == 2
+
+    abjad.attach(abjad.TimeSignature((2, 4)), staff[0])
+    numbers = [abjad.inspect(_).get_measure_number() for _ in staff]
+    assert numbers == [1, 1, 2, 2, 3, 3]
+
+    staff.insert(0, abjad.Note("b4"))
+    numbers = [abjad.inspect(_).get_measure_number() for _ in staff]
+    assert numbers == [1, 2, 2, 3, 3, 4, 4]
+
+
+def test_scoretools_Inspection_get_measure_number_02():
+    """
+    Agrees with measure grouping.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'2 f'4 g'4 a'4 b'4 c''1")
+    abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+    groups = abjad.select(staff[:]).group_by_measure()
+
+    for i, group in enumerate(groups):
+        for leaf in group:
+            assert abjad.inspect(leaf).get_measure_number() == i + 1
+    assert len(groups) == 3
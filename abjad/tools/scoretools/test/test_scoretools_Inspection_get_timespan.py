@@ -342,3 +342,125 @@ def test_scoretools_Inspection_get_timespan_26():
     assert start_offset == abjad.Offset(0)
     start_offset = abjad.inspect(staff[1]).get_timespan(in_seconds=True).start_offset
     assert start_offset == abjad.Offset(5, 4)
+
+
+def test_scoretools_Inspection_get_timespan_27():
+    """
+    Offsets update after deleting from previously inspected staff.
+    """
+
+    score = abjad.Score([
+        abjad.Staff("c'8 d'8 e'8 f'8"),
+        abjad.Staff("c'4 d'4"),
+        ])
+    assert abjad.inspect(score[0][-1]).get_timespan() == abjad.Timespan(
+        (3, 8), (1, 2))
+
+    del(score[0][0])
+
+    for i, x in enumerate(score[0]):
+        assert abjad.inspect(x).get_timespan().start_offset == i * abjad.Offset(1, 8)
+    assert abjad.inspect(score[0]).get_timespan().stop_offset == abjad.Offset(3, 8)
+    assert abjad.inspect(score[1][1]).get_timespan().start_offset == abjad.Offset(1, 4)
+
+
+def test_scoretools_Inspection_get_timespan_28():
+    """
+    Offsets update after changing written duration of inspected leaf.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    assert abjad.inspect(staff[-1]).get_timespan().start_offset == abjad.Offset(3, 8)
+
+    staff[0].written_duration = abjad.Duration(1, 4)
+
+    for i, x in enumerate(staff[1:]):
+        start_offset = abjad.inspect(x).get_timespan().start_offset
+        assert start_offset == abjad.Offset(1, 4) + i * abjad.Offset(1, 8)
+
+
+def test_scoretools_Inspection_get_timespan_29():
+    """
+    Offsets update after changing tuplet multiplier.
+    """
+
+    staff = abjad.Staff([abjad.Tuplet((2, 3), "c'8 d'8 e'8"), abjad.Note("f'4")])
+    assert abjad.inspect(staff[-1]).get_timespan().start_offset == abjad.Offset(1, 4)
+
+    staff[0].multiplier = abjad.Multiplier(4, 3)
+
+    assert abjad.inspect(staff[0][1]).get_timespan() == abjad.Timespan(
+        (1, 6), (1, 3))
+    assert abjad.inspect(staff[-1]).get_timespan().start_offset == abjad.Offset(1, 2)
+
+
+def test_scoretools_Inspection_get_timespan_30():
+    """
+    Offsets update after moving inspected container into tuplet.
+    """
+
+    container = abjad.Container("c'8 d'8 e'8")
+    staff = abjad.Staff([container, abjad.Tuplet((2, 3), [])])
+    assert abjad.inspect(container[-1]).get_timespan().stop_offset == abjad.Offset(3, 8)
+
+    staff[-1].append(container)
+
+    assert abjad.inspect(container).get_timespan() == abjad.Timespan(0, (1, 4))
+    for i, x in enumerate(container):
+        assert abjad.inspect(x).get_timespan().start_offset == i * abjad.Offset(1, 12)
+
+
+def test_scoretools_Inspection_get_timespan_31():
+    """
+    Offsets update after making container simultaneous.
+    """
+
+    container = abjad.Container([abjad.Voice("c'8 d'8"), abjad.Voice("e'4")])
+    staff = abjad.Staff([container, abjad.Note("f'4")])
+    assert abjad.inspect(staff[-1]).get_timespan().start_offset == abjad.Offset(1, 2)
+
+    container.is_simultaneous = True
+
+    assert abjad.inspect(container[1]).get_timespan().start_offset == 0
+    assert abjad.inspect(staff[-1]).get_timespan().start_offset == abjad.Offset(1, 4)
+
+
+def test_scoretools_Inspection_get_timespan_32():
+    """
+    Grace note offsets update after attaching grace container to inspected
+    leaf.
+    """
+
+    staff = abjad.Staff("c'4 d'4")
+    assert abjad.inspect(staff[1]).get_timespan().start_offset == abjad.Offset(1, 4)
+
+    grace_container = abjad.GraceContainer("e'16 f'16")
+    abjad.attach(grace_container, staff[1])
+
+    start_offset = abjad.inspect(grace_container[0]).get_timespan().start_offset
+    assert start_offset == abjad.Offset((1, 4), grace_displacement=(-1, 8))
+
+
+def test_scoretools_Inspection_get_timespan_33():
+    """
+    Offsets of score never updated before come from offset table; leaves
+    that meet in time share one offset.
+    """
+
+    voice_1 = abjad.Voice("c'8 \\times 2/3 { d'8 e'8 f'8 } g'4")
+    voice_2 = abjad.Voice("c'4. d'8")
+    staff = abjad.Staff([voice_1, voice_2])
+    staff.is_simultaneous = True
+    score = abjad.Score([staff, abjad.Staff("c'2 d'2")])
+
+    assert abjad.inspect(score).get_timespan() == abjad.Timespan(0, 1)
+    assert abjad.inspect(voice_1[1]).get_timespan() == abjad.Timespan(
+        abjad.Offset(1, 8), abjad.Offset(3, 8))
+    assert abjad.inspect(voice_1[1][2]).get_timespan() == abjad.Timespan(
+        abjad.Offset(7, 24), abjad.Offset(3, 8))
+    assert abjad.inspect(voice_2).get_timespan() == abjad.Timespan(
+        0, abjad.Offset(1, 2))
+
+    stop_offset = abjad.inspect(voice_1[1]).get_timespan().stop_offset
+    start_offset = abjad.inspect(voice_2[1]).get_timespan().start_offset
+    assert stop_offset is start_offset
@@ -142,3 +142,15 @@ def test_scoretools_Inspection_get_vertical_moment_at_02():
 
     moment = abjad.inspect(score).get_vertical_moment_at((99, 8))
     assert moment.leaves == ()
+
+
+def test_scoretools_Inspection_get_vertical_moment_at_03():
+    """
+    Finds leaf after several leaves that stop before offset.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8 g'8 a'8")
+
+    for i, note in enumerate(staff):
+        moment = abjad.inspect(staff).get_vertical_moment_at((i, 8))
+        assert moment.leaves == (note,)
@@ -0,0 +1,32 @@
+import abjad
+
+
+def test_scoretools_Iteration_effective_01():
+
+    score = abjad.Score([
+        abjad.Staff("c'8 d'8 e'8 f'8"),
+        abjad.Staff("c4 d4"),
+        ])
+    abjad.attach(abjad.Clef('alto'), score[0][1])
+    abjad.attach(abjad.Clef('bass'), score[1][0])
+
+    pairs = list(abjad.iterate(score).effective(abjad.Clef))
+
+    assert pairs == [
+        (score[0][0], None),
+        (score[0][1], abjad.Clef('alto')),
+        (score[0][2], abjad.Clef('alto')),
+        (score[0][3], abjad.Clef('alto')),
+        (score[1][0], abjad.Clef('bass')),
+        (score[1][1], abjad.Clef('bass')),
+        ]
+
+
+def test_scoretools_Iteration_effective_02():
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('alto'), staff[0])
+    abjad.attach(abjad.Clef('bass'), staff[2])
+
+    for leaf, clef in abjad.iterate(staff).effective(abjad.Clef):
+        assert clef == abjad.inspect(leaf).get_effective(abjad.Clef)
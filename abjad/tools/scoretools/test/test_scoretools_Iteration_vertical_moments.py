@@ -0,0 +1,49 @@
+import abjad
+
+
+def test_scoretools_Iteration_vertical_moments_01():
+    """
+    Iterates same vertical moments as found at offsets one by one.
+    """
+
+    score = abjad.Score([
+        abjad.Staff(r"\times 2/3 { c'8 d'8 e'8 } f'4. g'16 a'16 r4"),
+        abjad.Staff("c'4 d'8. e'16 f'2"),
+        abjad.Staff(r"c'8 \times 4/5 { d'16 e'16 f'16 g'16 a'16 } b'2 c''8"),
+        ])
+
+    moments = list(abjad.iterate(score).vertical_moments())
+    offsets = [_.offset for _ in moments]
+    assert offsets == sorted(set(offsets))
+    assert offsets[0] == 0
+    for moment in moments:
+        expected = abjad.inspect(score).get_vertical_moment_at(moment.offset)
+        assert list(moment.components) == list(expected.components)
+
+    moments = list(abjad.iterate(score).vertical_moments(reverse=True))
+    assert [_.offset for _ in moments] == list(reversed(offsets))
+    for moment in moments:
+        expected = abjad.inspect(score).get_vertical_moment_at(moment.offset)
+        assert list(moment.components) == list(expected.components)
+
+
+def test_scoretools_Iteration_vertical_moments_02():
+    """
+    Iterates vertical moments of tuplet from tuplet start offset.
+    """
+
+    staff = abjad.Staff(r"c'4 \times 2/3 { d'8 e'8 f'8 }")
+    tuplet = staff[1]
+
+    moments = list(abjad.iterate(tuplet).vertical_moments())
+
+    assert [_.offset for _ in moments] == [
+        abjad.Offset(1, 4),
+        abjad.Offset(1, 3),
+        abjad.Offset(5, 12),
+        ]
+    assert [_.components for _ in moments] == [
+        [tuplet, tuplet[0]],
+        [tuplet, tuplet[1]],
+        [tuplet, tuplet[2]],
+        ]
@@ -517,3 +517,31 @@ def test_scoretools_Mutation_copy_08():
         """
         )
     assert abjad.inspect(staff).is_well_formed()
+
+
+def test_scoretools_Mutation_copy_09():
+    """
+    Copies indicators, piecewise indicators and spanners without sharing
+    them with original; copied contexted indicators are effective in copy.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('bass'), staff[0])
+    spanner = abjad.TextSpanner()
+    abjad.attach(spanner, staff[:])
+    spanner.attach(abjad.Markup('pont.'), staff[0])
+    abjad.attach(abjad.Beam(), staff[1:3])
+    new_staff = abjad.mutate(staff).copy()
+
+    assert format(new_staff) == format(staff)
+    assert abjad.inspect(new_staff).is_well_formed()
+    clef = abjad.inspect(new_staff[-1]).get_effective(abjad.Clef)
+    assert clef == abjad.Clef('bass')
+    assert clef is not abjad.inspect(staff[0]).get_indicator(abjad.Clef)
+    new_spanner = abjad.inspect(new_staff[0]).get_spanner(abjad.TextSpanner)
+    assert new_spanner is not spanner
+    assert list(new_spanner.leaves) == list(new_staff)
+    assert new_spanner._wrappers[0].component is new_staff[0]
+    beam = abjad.inspect(new_staff[1]).get_spanner(abjad.Beam)
+    assert list(beam.leaves) == list(new_staff[1:3])
+    assert not abjad.inspect(new_staff[0]).get_spanners(abjad.Beam)
@@ -52,4 +52,26 @@ def test_scoretools_NoteHead_written_pitch_04():
 
     assert n1.written_pitch == abjad.NamedPitch(14)
     assert n2.written_pitch == abjad.NamedPitch(14)
-    assert n1.written_pitch is not n2.written_pitch
+
+    n1.written_pitch = 16
+
+    assert n1.written_pitch == abjad.NamedPitch(16)
+    assert n2.written_pitch == abjad.NamedPitch(14)
+
+
+def test_scoretools_NoteHead_written_pitch_05():
+    """
+    Note-heads share interned written pitches; arrows are kept.
+    """
+
+    notes = [abjad.Note(_, (1, 4)) for _ in [0, 2, 0, 2]]
+
+    assert notes[0].written_pitch is notes[2].written_pitch
+    assert notes[1].written_pitch is notes[3].written_pitch
+    assert notes[0].written_pitch is not notes[1].written_pitch
+
+    notes[0].written_pitch = abjad.NamedPitch("c'", arrow=abjad.Up)
+
+    assert notes[0].written_pitch.arrow == abjad.Up
+    assert notes[2].written_pitch.arrow is None
+    assert notes[0].written_pitch is not notes[2].written_pitch
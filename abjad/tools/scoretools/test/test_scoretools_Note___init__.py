@@ -251,3 +251,33 @@ def test_scoretools_Note___init___19():
     note = abjad.Note('sn4')
 
     assert format(note) == 'snare4'
+
+
+def test_scoretools_Note___init___20():
+    """
+    Initializes note from single-leaf string with leaf tokenizer and
+    full LilyPond parser alike.
+    """
+
+    for string in ("cs''!8.", "bf,?16", "dqs'", "e'!?1"):
+        note = abjad.Note(string)
+        parsed = abjad.parse(f'{{ {string} }}')[0]
+        assert format(note) == format(parsed)
+        assert note.note_head.is_forced == parsed.note_head.is_forced
+        assert note.note_head.is_cautionary == parsed.note_head.is_cautionary
+
+
+def test_scoretools_Note___init___21():
+    """
+    Initializes note from string with post-events through full LilyPond
+    parser.
+    """
+
+    note = abjad.Note("c'4 -\\accent")
+
+    assert format(note) == abjad.String.normalize(
+        r"""
+        c'4
+        -\accent
+        """
+        )
@@ -224,3 +224,15 @@ def test_scoretools_Rest___init___13():
         )
 
     assert abjad.inspect(rest).is_well_formed()
+
+
+def test_scoretools_Rest___init___14():
+    """
+    Initializes rest from single-leaf strings.
+    """
+
+    assert format(abjad.Rest('r8..')) == 'r8..'
+    assert format(abjad.Rest('s2')) == 'r2'
+    assert format(abjad.Rest("<c' e'>16")) == 'r16'
+    assert format(abjad.Rest('r')) == 'r4'
+    assert format(abjad.Rest('r4*1/2')) == 'r4'
@@ -18,6 +18,7 @@ def test_scoretools_Selection__set_component_parents_01():
     assert selection[0] not in voice_1
 
     voice_1._components.extend(selection)
+    voice_1._reindex_components()
 
     "Selection now in container voice_1."
 
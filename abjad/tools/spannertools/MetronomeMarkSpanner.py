@@ -2210,7 +2210,12 @@ class MetronomeMarkSpanner(Spanner):
             current_metric_modulation_wrapper,
             current_tempo_trend_wrapper,
             )
-        previous_wrappers = self._get_previous_piecewise_wrappers(leaf)
+        indicators = own_indicators + (last_leaf_metronome_mark,)
+        # leaves without indicators format without looking back
+        if any(_ is not None for _ in indicators):
+            previous_wrappers = self._get_previous_piecewise_wrappers(leaf)
+        else:
+            previous_wrappers = (None, None, None)
         previous_metronome_mark_wrapper = previous_wrappers[0]
         if previous_metronome_mark_wrapper is not None:
             previous_metronome_mark = previous_metronome_mark_wrapper.indicator
@@ -2227,7 +2232,6 @@ class MetronomeMarkSpanner(Spanner):
             previous_tempo_trend_wrapper,
             previous_tempo_trend,
             )
-        indicators = own_indicators + (last_leaf_metronome_mark,)
         return {
             'current_metronome_mark': current_metronome_mark,
             'current_metric_modulation': current_metric_modulation,
@@ -2461,6 +2465,13 @@ class MetronomeMarkSpanner(Spanner):
         prototype = MetronomeMark
         if inspect(self[-1]).get_piecewise(self, prototype, None) is None:
             return False
+        # only first leaf or leaf with indicator can precede last leaf markup
+        if leaf is self[-1]:
+            return False
+        if leaf is not self[0]:
+            wrappers = self._get_piecewise_wrappers(leaf)
+            if all(_ is None for _ in wrappers):
+                return False
         prototype = (
             Accelerando,
             MetricModulation,
@@ -40,6 +40,7 @@ class Spanner(AbjadObject):
         '_ignore_attachment_test',
         '_ignore_before_attach',
         '_leak',
+        '_leaf_positions',
         '_leaves',
         '_left_broken',
         '_lilypond_setting_name_manager',
@@ -68,6 +69,7 @@ class Spanner(AbjadObject):
         if leak is not None:
             leak = bool(leak)
         self._leak = leak
+        self._leaf_positions: typing.Optional[typing.Dict[int, int]] = None
         self._leaves: typing.List[Leaf] = []
         self._left_broken = None
         self._lilypond_setting_name_manager = None
@@ -82,11 +84,7 @@ class Spanner(AbjadObject):
         """
         Is true when spanner contains ``argument``.
         """
-        for leaf in self.leaves:
-            if leaf is argument:
-                return True
-        else:
-            return False
+        return id(argument) in self._get_leaf_positions()
 
     #def __copy__(self, *arguments) -> 'Spanner':
     def __copy__(self, *arguments):
@@ -108,9 +106,9 @@ class Spanner(AbjadObject):
         Gets leaf or selection identified by ``argument``.
         """
         if isinstance(argument, slice):
-            leaves = self.leaves.__getitem__(argument)
+            leaves = self._leaves.__getitem__(argument)
             return select(leaves)
-        return self.leaves.__getitem__(argument)
+        return self._leaves.__getitem__(argument)
 
     def __getnewargs__(self) -> typing.Tuple:
         """
@@ -128,6 +126,8 @@ class Spanner(AbjadObject):
         for class_ in type(self).__mro__:
             for slot in getattr(class_, '__slots__', ()):
                 state[slot] = getattr(self, slot, None)
+        # positions are keyed to leaf identities of this session
+        state['_leaf_positions'] = None
         return state
 
     def __iter__(self) -> typing.Iterator:
@@ -140,7 +140,7 @@ class Spanner(AbjadObject):
         """
         Gets number of leaves in spanner.
         """
-        return len(self.leaves)
+        return len(self._leaves)
 
     def __lt__(self, argument) -> bool:
         """
@@ -174,6 +174,8 @@ class Spanner(AbjadObject):
             if not leaves.are_contiguous_logical_voice():
                 raise Exception(type(self), leaves)
         leaf._append_spanner(self)
+        if self._leaf_positions is not None:
+            self._leaf_positions[id(leaf)] = len(self._leaves)
         self._leaves.append(leaf)
 
     def _append_left(self, leaf):
@@ -182,6 +184,7 @@ class Spanner(AbjadObject):
         assert leaves.are_contiguous_logical_voice()
         leaf._append_spanner(self)
         self._leaves.insert(0, leaf)
+        self._leaf_positions = None
 
     def _at_least_two_leaves(self, argument):
         leaves = select(argument).leaves()
@@ -290,8 +293,7 @@ class Spanner(AbjadObject):
         self._leaves = my_leaf
         for leaf in leaves:
             assert leaf in self
-        for leaf in leaves:
-            result._leaves.append(leaf)
+        result._leaves.extend(leaves)
         result._unblock_all_leaves()
         return result
 
@@ -326,6 +328,10 @@ class Spanner(AbjadObject):
     def _format_before_leaf(self, leaf):
         return []
 
+    def _format_later(self):
+        if self._leaves:
+            self._leaves[0]._format_later()
+
     def _format_right_of_leaf(self, leaf):
         return []
 
@@ -445,16 +451,23 @@ class Spanner(AbjadObject):
         bundle = self._get_basic_lilypond_format_bundle(leaf)
         return bundle
 
+    def _get_leaf_positions(self):
+        if self._leaf_positions is None:
+            self._leaf_positions = {
+                id(leaf): i for i, leaf in enumerate(self._leaves)
+                }
+        return self._leaf_positions
+
     def _get_my_first_leaf(self):
-        if self.leaves:
-            return self.leaves[0]
+        if self._leaves:
+            return self._leaves[0]
 
     def _get_my_last_leaf(self):
-        if self.leaves:
-            return self.leaves[-1]
+        if self._leaves:
+            return self._leaves[-1]
 
     def _get_my_nth_leaf(self, n):
-        return self.leaves[n]
+        return self._leaves[n]
 
     def _get_piecewise_indicator(self, leaf, prototype=None):
         indicators = self._get_piecewise_indicators(leaf, prototype)
@@ -502,7 +515,10 @@ class Spanner(AbjadObject):
         return bool(indicators)
 
     def _index(self, leaf):
-        return self._leaves.index(leaf)
+        try:
+            return self._get_leaf_positions()[id(leaf)]
+        except KeyError:
+            raise ValueError(f'{leaf!r} not in spanner.')
 
     def _insert(self, i, leaf):
         """
@@ -512,6 +528,7 @@ class Spanner(AbjadObject):
             raise Exception(f'spanners attach only to leaves: {leaf!s}.')
         leaf._append_spanner(self)
         self._leaves.insert(i, leaf)
+        self._leaf_positions = None
 
     def _is_exterior_leaf(self, leaf):
         """
@@ -528,14 +545,14 @@ class Spanner(AbjadObject):
             return False
 
     def _is_interior_leaf(self, leaf):
-        if leaf not in self.leaves:
+        if leaf not in self:
             return False
-        if len(self.leaves) < 3:
+        if len(self) < 3:
             return False
-        leaf_count = len(self.leaves)
+        leaf_count = len(self)
         first_index = 0
         last_index = leaf_count - 1
-        leaf_index = list(self.leaves).index(leaf)
+        leaf_index = self._index(leaf)
         if first_index < leaf_index < last_index:
             return True
         return False
@@ -556,12 +573,12 @@ class Spanner(AbjadObject):
         """
         Not composer-safe.
         """
-        for i, leaf_ in enumerate(self.leaves):
-            if leaf_ is leaf:
-                self._leaves.pop(i)
-                break
+        i = self._index(leaf)
+        self._leaves.pop(i)
+        if i == len(self._leaves):
+            del self._leaf_positions[id(leaf)]
         else:
-            raise ValueError(f'{leaf!r} not in spanner.')
+            self._leaf_positions = None
 
     def _sever_all_leaves(self):
         """
@@ -650,7 +667,7 @@ class Spanner(AbjadObject):
         """
         Gets index of ``leaf`` in spanner.
         """
-        return self.leaves.index(leaf)
+        return self._index(leaf)
         
     def start_command(self) -> typing.List[str]:
         """
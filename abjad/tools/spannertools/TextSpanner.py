@@ -632,6 +632,18 @@ class TextSpanner(Spanner):
     def _should_format_last_leaf_markup(self, component):
         if inspect(self[-1]).get_piecewise(self, Markup, None) is None:
             return
+        # only first leaf or leaf with indicator can precede last leaf markup
+        if component is self[-1]:
+            return False
+        if component is not self[0]:
+            markup = inspect(component).get_piecewise(self, Markup, None)
+            line_segment = inspect(component).get_piecewise(
+                self,
+                LineSegment,
+                None,
+                )
+            if markup is None and line_segment is None:
+                return False
         leaf = None
         for leaf in reversed(self[:-1]):
             markup = inspect(leaf).get_piecewise(self, Markup, None)
@@ -0,0 +1,61 @@
+import abjad
+import copy
+import pickle
+
+
+def test_spannertools_Spanner_index_01():
+    """
+    Index follows leaves appended, inserted and removed.
+    """
+
+    voice = abjad.Voice("c'8 d'8 e'8 f'8 g'8")
+    beam = abjad.Beam()
+    abjad.attach(beam, voice[1:3])
+
+    assert [beam.index(_) for _ in voice[1:3]] == [0, 1]
+    assert voice[0] not in beam
+
+    beam._append(voice[3])
+    beam._append_left(voice[0])
+    beam._insert(5, voice[4])
+
+    assert [beam.index(_) for _ in voice] == [0, 1, 2, 3, 4]
+
+    beam._remove_leaf(voice[4])
+    beam._remove_leaf(voice[1])
+
+    assert [beam.index(_) for _ in beam] == [0, 1, 2]
+    assert beam.leaves == abjad.select([voice[0], voice[2], voice[3]])
+    assert voice[1] not in beam
+    assert voice[4] not in beam
+
+
+def test_spannertools_Spanner_index_02():
+    """
+    Fractured spanners index their own leaves.
+    """
+
+    voice = abjad.Voice("c'8 d'8 e'8 f'8")
+    beam = abjad.Beam()
+    abjad.attach(beam, voice[:])
+    original, left, right = beam._fracture(1, direction=abjad.Right)
+
+    assert [left.index(_) for _ in voice[:2]] == [0, 1]
+    assert [right.index(_) for _ in voice[2:]] == [0, 1]
+    assert voice[2] not in left
+    assert voice[0] not in right
+
+
+def test_spannertools_Spanner_index_03():
+    """
+    Copied and pickled spanners index their own leaves.
+    """
+
+    voice = abjad.Voice("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Slur(), voice[:])
+
+    for new_voice in (copy.deepcopy(voice), pickle.loads(pickle.dumps(voice))):
+        slur = abjad.inspect(new_voice[0]).get_spanner(abjad.Slur)
+        assert [slur.index(_) for _ in new_voice] == [0, 1, 2, 3]
+        assert voice[0] not in slur
+        assert format(new_voice) == format(voice)
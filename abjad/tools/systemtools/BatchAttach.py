@@ -0,0 +1,137 @@
+from abjad.tools.abctools.ContextManager import ContextManager
+
+
+class BatchAttach(ContextManager):
+    r"""
+    A context manager for batching attach operations.
+
+    ..  container:: example
+
+        Defers duplicate-indicator checks and effective-context binding of
+        indicators attached in the body of the context manager to a single
+        pass on exit:
+
+        >>> staff = abjad.Staff()
+        >>> with abjad.BatchAttach():
+        ...     for i in range(4):
+        ...         note = abjad.Note("c'8")
+        ...         staff.append(note)
+        ...         dynamic = abjad.Dynamic('p' if i % 2 else 'f')
+        ...         abjad.attach(dynamic, note)
+        ...
+
+        >>> abjad.show(staff) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> abjad.f(staff)
+            \new Staff {
+                c'8
+                \f
+                c'8
+                \p
+                c'8
+                \f
+                c'8
+                \p
+            }
+
+        >>> abjad.inspect(staff[1]).get_effective(abjad.Dynamic)
+        Dynamic('p')
+
+    ..  container:: example
+
+        Raises persistent indicator error on exit, just as attach does outside
+        the context manager. Indicators attached before the offending
+        indicator remain attached:
+
+        >>> staff = abjad.Staff("c'4 d' e' f'")
+        >>> with abjad.BatchAttach():
+        ...     abjad.attach(abjad.Clef('alto'), staff[0])
+        ...     abjad.attach(abjad.Clef('bass'), staff[0])
+        ...
+        Traceback (most recent call last):
+            ...
+        abjad...PersistentIndicatorError: Can not attach ...
+
+        >>> abjad.inspect(staff[0]).get_indicators(abjad.Clef)
+        (Clef('alto'),)
+
+    Effective indicators are not current in the body of the context manager.
+
+    Nested context managers join the outermost context manager.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Context managers'
+
+    __slots__ = (
+        '_wrappers',
+        )
+
+    _current_batch = None
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        self._wrappers = []
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        """
+        Enters context manager.
+
+        Returns context manager.
+        """
+        if BatchAttach._current_batch is None:
+            BatchAttach._current_batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exits context manager.
+
+        Checks duplicate indicators and binds effective contexts of batched
+        indicators in the order they were attached.
+
+        Returns none.
+        """
+        if BatchAttach._current_batch is not self:
+            return
+        BatchAttach._current_batch = None
+        wrappers, self._wrappers = self._wrappers, []
+        self._flush(wrappers, check=exc_type is None)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _flush(wrappers, check=True):
+        import abjad
+        # detach batched wrappers still attached to their components
+        wrappers_ = []
+        for wrapper in wrappers:
+            if wrapper.component is None:
+                continue
+            component_wrappers = wrapper.component._wrappers
+            for i, _ in enumerate(component_wrappers):
+                if _ is wrapper:
+                    del component_wrappers[i]
+                    wrappers_.append(wrapper)
+                    break
+        # update score once without batched wrappers
+        for wrapper in wrappers_:
+            wrapper.component._update_now(offsets=True, indicators=True)
+        # then reattach one at a time as unbatched attach does
+        for i, wrapper in enumerate(wrappers_):
+            component = wrapper.component
+            if check:
+                try:
+                    wrapper._warn_duplicate_indicator(component)
+                except abjad.PersistentIndicatorError:
+                    for wrapper_ in wrappers_[i:]:
+                        wrapper_._component = None
+                    raise
+            component._wrappers.append(wrapper)
+            wrapper._update_effective_context(offsets_are_current=True)
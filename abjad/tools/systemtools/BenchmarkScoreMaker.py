@@ -21,8 +21,103 @@ class BenchmarkScoreMaker(AbjadObject):
 
     __slots__ = ()
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _make_timespan_list(count):
+        import abjad
+        import random
+        random_ = random.Random(0)
+        timespans = []
+        for i in range(count):
+            start_offset = random_.randint(0, 4 * count)
+            stop_offset = start_offset + random_.randint(1, 8)
+            timespan = abjad.AnnotatedTimespan(
+                start_offset,
+                stop_offset,
+                annotation=i,
+                )
+            timespans.append(timespan)
+        timespans = abjad.TimespanList(timespans)
+        timespans.sort()
+        for method_name in (
+            'compute_logical_and',
+            'compute_logical_or',
+            'compute_logical_xor',
+            ):
+            getattr(abjad.TimespanList(timespans), method_name)()
+        timespans.partition()
+        timespans.explode()
+        return timespans
+
     ### PUBLIC METHODS ###
 
+    def make_batch_attach_score_01(self):
+        """
+        Make 4-staff score by appending 50 notes to each staff and attaching
+        a dynamic to each note immediately after it is appended.
+
+        3.0 (unbatched attach):         2,900,410 function calls
+        3.0 (batched attach):             421,210 function calls
+
+        """
+        import abjad
+        score = abjad.Score()
+        for i in range(4):
+            score.append(abjad.Staff())
+        with abjad.BatchAttach():
+            for staff in score:
+                for i in range(50):
+                    note = abjad.Note(0, (1, 16))
+                    staff.append(note)
+                    dynamic = abjad.Dynamic('p' if i % 2 else 'f')
+                    abjad.attach(dynamic, note)
+        return score
+
+    def make_batch_attach_score_02(self):
+        """
+        Make 4-staff score by appending 100 notes to each staff and attaching
+        a dynamic to each note immediately after it is appended.
+
+        3.0 (unbatched attach):        10,557,560 function calls
+        3.0 (batched attach):             838,410 function calls
+
+        """
+        import abjad
+        score = abjad.Score()
+        for i in range(4):
+            score.append(abjad.Staff())
+        with abjad.BatchAttach():
+            for staff in score:
+                for i in range(100):
+                    note = abjad.Note(0, (1, 16))
+                    staff.append(note)
+                    dynamic = abjad.Dynamic('p' if i % 2 else 'f')
+                    abjad.attach(dynamic, note)
+        return score
+
+    def make_batch_attach_score_03(self):
+        """
+        Make 4-staff score by appending 200 notes to each staff and attaching
+        a dynamic to each note immediately after it is appended.
+
+        3.0 (unbatched attach):        40,151,860 function calls
+        3.0 (batched attach):           1,672,810 function calls
+
+        """
+        import abjad
+        score = abjad.Score()
+        for i in range(4):
+            score.append(abjad.Staff())
+        with abjad.BatchAttach():
+            for staff in score:
+                for i in range(200):
+                    note = abjad.Note(0, (1, 16))
+                    staff.append(note)
+                    dynamic = abjad.Dynamic('p' if i % 2 else 'f')
+                    abjad.attach(dynamic, note)
+        return score
+
     def make_bound_hairpin_score_01(self):
         """
         Make 200-note voice with p-to-f bound crescendo spanner
@@ -158,6 +253,150 @@ class BenchmarkScoreMaker(AbjadObject):
             abjad.attach(crescendo, part)
         return voice
 
+    def make_leaf_string_score_01(self):
+        """
+        Make 200-leaf voice with notes, chords and rests initialized from
+        single-leaf LilyPond strings.
+
+        3.0 (full LilyPond parser):       576,224 function calls
+        3.0 (leaf tokenizer):             233,424 function calls
+
+        """
+        import abjad
+        leaves = []
+        for i in range(50):
+            leaves.append(abjad.Note("cs''8."))
+            leaves.append(abjad.Chord("<c' e' g'>16"))
+            leaves.append(abjad.Rest("r8"))
+            leaves.append(abjad.Note("d'!4"))
+        return abjad.Voice(leaves)
+
+    def make_mutate_then_inspect_score_01(self):
+        """
+        Make 4-staff score by appending 50 notes to each staff and getting
+        the timespan of each note immediately after it is appended.
+
+        3.0 (full-score offset update):       12,742,440 function calls
+        3.0 (incremental offset update):         387,851 function calls
+
+        """
+        import abjad
+        score = abjad.Score()
+        for i in range(4):
+            score.append(abjad.Staff())
+        for staff in score:
+            for i in range(50):
+                note = abjad.Note(0, (1, 16))
+                staff.append(note)
+                abjad.inspect(note).get_timespan()
+        return score
+
+    def make_mutate_then_inspect_score_02(self):
+        """
+        Make 4-staff score by appending 100 notes to each staff and getting
+        the timespan of each note immediately after it is appended.
+
+        3.0 (full-score offset update):       49,286,740 function calls
+        3.0 (incremental offset update):         772,451 function calls
+
+        """
+        import abjad
+        score = abjad.Score()
+        for i in range(4):
+            score.append(abjad.Staff())
+        for staff in score:
+            for i in range(100):
+                note = abjad.Note(0, (1, 16))
+                staff.append(note)
+                abjad.inspect(note).get_timespan()
+        return score
+
+    def make_mutate_then_inspect_score_03(self):
+        """
+        Make 4-staff score by appending 200 notes to each staff and getting
+        the timespan of each note immediately after it is appended.
+
+        3.0 (full-score offset update):      193,790,340 function calls
+        3.0 (incremental offset update):       1,541,651 function calls
+
+        """
+        import abjad
+        score = abjad.Score()
+        for i in range(4):
+            score.append(abjad.Staff())
+        for staff in score:
+            for i in range(200):
+                note = abjad.Note(0, (1, 16))
+                staff.append(note)
+                abjad.inspect(note).get_timespan()
+        return score
+
+    def make_reformat_score_01(self):
+        """
+        Make 4-staff score with 50 notes per staff, dynamic and slur on
+        every 4th note, to be formatted more than once.
+
+        3.0 (uncached) first LilyPond format:        271,393 function calls
+        3.0 (cached) first LilyPond format:          272,008 function calls
+
+        3.0 (uncached) second LilyPond format:       256,702 function calls
+        3.0 (cached) second LilyPond format:              48 function calls
+
+        """
+        import abjad
+        score = abjad.Score()
+        for i in range(4):
+            staff = abjad.Staff(50 * abjad.Note("c'16"))
+            for j in range(0, 50, 4):
+                abjad.attach(abjad.Dynamic('f'), staff[j])
+                abjad.attach(abjad.Slur(), staff[j:j + 4])
+            score.append(staff)
+        return score
+
+    def make_reformat_score_02(self):
+        """
+        Make 4-staff score with 100 notes per staff, dynamic and slur on
+        every 4th note, to be formatted more than once.
+
+        3.0 (uncached) first LilyPond format:        538,332 function calls
+        3.0 (cached) first LilyPond format:          539,547 function calls
+
+        3.0 (uncached) second LilyPond format:       509,622 function calls
+        3.0 (cached) second LilyPond format:              48 function calls
+
+        """
+        import abjad
+        score = abjad.Score()
+        for i in range(4):
+            staff = abjad.Staff(100 * abjad.Note("c'16"))
+            for j in range(0, 100, 4):
+                abjad.attach(abjad.Dynamic('f'), staff[j])
+                abjad.attach(abjad.Slur(), staff[j:j + 4])
+            score.append(staff)
+        return score
+
+    def make_reformat_score_03(self):
+        """
+        Make 4-staff score with 200 notes per staff, dynamic and slur on
+        every 4th note, to be formatted more than once.
+
+        3.0 (uncached) first LilyPond format:      1,074,932 function calls
+        3.0 (cached) first LilyPond format:        1,077,347 function calls
+
+        3.0 (uncached) second LilyPond format:     1,017,822 function calls
+        3.0 (cached) second LilyPond format:              48 function calls
+
+        """
+        import abjad
+        score = abjad.Score()
+        for i in range(4):
+            staff = abjad.Staff(200 * abjad.Note("c'16"))
+            for j in range(0, 200, 4):
+                abjad.attach(abjad.Dynamic('f'), staff[j])
+                abjad.attach(abjad.Slur(), staff[j:j + 4])
+            score.append(staff)
+        return score
+
     def make_score_00(self):
         """
         Make 200-note voice (with nothing else).
@@ -428,3 +667,129 @@ class BenchmarkScoreMaker(AbjadObject):
             beam = abjad.Beam()
             abjad.attach(beam, part)
         return voice
+
+    def make_spanner_score_10(self):
+        """
+        Make 200-note voice with one hairpin spanner on all notes.
+
+        3.0 (leaf list scans) LilyPond format:      1,174,097 function calls
+        3.0 (leaf position index) LilyPond format:    202,283 function calls
+
+        """
+        import abjad
+        voice = abjad.Voice(200 * abjad.Note("c'16"))
+        hairpin = abjad.Hairpin('p < f')
+        abjad.attach(hairpin, voice[:])
+        return voice
+
+    def make_spanner_score_11(self):
+        """
+        Make 400-note voice with one hairpin spanner on all notes.
+
+        3.0 (leaf list scans) LilyPond format:      4,267,586 function calls
+        3.0 (leaf position index) LilyPond format:    403,972 function calls
+
+        """
+        import abjad
+        voice = abjad.Voice(400 * abjad.Note("c'16"))
+        hairpin = abjad.Hairpin('p < f')
+        abjad.attach(hairpin, voice[:])
+        return voice
+
+    def make_spanner_score_12(self):
+        """
+        Make 800-note voice with one hairpin spanner on all notes.
+
+        3.0 (leaf list scans) LilyPond format:     16,214,786 function calls
+        3.0 (leaf position index) LilyPond format:    807,572 function calls
+
+        """
+        import abjad
+        voice = abjad.Voice(800 * abjad.Note("c'16"))
+        hairpin = abjad.Hairpin('p < f')
+        abjad.attach(hairpin, voice[:])
+        return voice
+
+    def make_startup_score_01(self):
+        """
+        Make note, staff and meter from strings; run as first parse in newly
+        started Python session.
+
+        3.0 (tables built at first parse):        61,757 function calls
+        3.0 (tables read from modules):           52,923 function calls
+
+        3.0 (second parse):                       15,996 function calls
+
+        """
+        import abjad
+        abjad.Note("c'4")
+        staff = abjad.Staff(r"\clef bass c4 ^ \markup { \italic x } d4 e4 f4")
+        abjad.Meter((4, 4))
+        return staff
+
+    def make_string_score_01(self):
+        """
+        Make 200-note staff with slurs and dynamics from one LilyPond string.
+
+        3.0 (per-component append):         579,671 function calls
+        3.0 (bulk append):                  273,693 function calls
+
+        """
+        import abjad
+        string = " ".join(["c'8 ( d'8 ) e'8 \\f f'8"] * 50)
+        return abjad.Staff(string)
+
+    def make_string_score_02(self):
+        """
+        Make 400-note staff with slurs and dynamics from one LilyPond string.
+
+        3.0 (per-component append):       1,156,004 function calls
+        3.0 (bulk append):                  543,702 function calls
+
+        """
+        import abjad
+        string = " ".join(["c'8 ( d'8 ) e'8 \\f f'8"] * 100)
+        return abjad.Staff(string)
+
+    def make_string_score_03(self):
+        """
+        Make 800-note staff with slurs and dynamics from one LilyPond string.
+
+        3.0 (per-component append):       2,310,904 function calls
+        3.0 (bulk append):                1,086,702 function calls
+
+        """
+        import abjad
+        string = " ".join(["c'8 ( d'8 ) e'8 \\f f'8"] * 200)
+        return abjad.Staff(string)
+
+    def make_timespan_list_01(self):
+        """
+        Make 1,000 random annotated timespans; compute logical AND, OR and
+        XOR, partition and explode.
+
+        3.0 (pairwise):                63,559,153 function calls
+        3.0 (sweep line):               2,115,326 function calls
+
+        """
+        return self._make_timespan_list(1000)
+
+    def make_timespan_list_02(self):
+        """
+        Make 10,000 random annotated timespans; compute logical AND, OR and
+        XOR, partition and explode.
+
+        3.0 (sweep line):              22,835,154 function calls
+
+        """
+        return self._make_timespan_list(10000)
+
+    def make_timespan_list_03(self):
+        """
+        Make 100,000 random annotated timespans; compute logical AND, OR and
+        XOR, partition and explode.
+
+        3.0 (sweep line):             243,411,843 function calls
+
+        """
+        return self._make_timespan_list(100000)
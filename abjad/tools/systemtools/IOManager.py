@@ -3,6 +3,7 @@ import os
 import pathlib
 import platform
 import re
+import shlex
 import shutil
 import subprocess
 import sys
@@ -38,6 +39,52 @@ class IOManager(AbjadObject):
             input(message)
             os.makedirs(directory)
 
+    @staticmethod
+    def _get_lilypond_output_file_paths(ly_path, flags=None):
+        """
+        Gets paths of files LilyPond outputs when run on ``ly_path`` with
+        ``flags``.
+
+        Returns dictionary of existing paths keyed to each extension
+        LilyPond is expected to write.
+        """
+        ly_path = str(ly_path)
+        extensions = []
+        arguments = shlex.split(flags or '')
+        for i, argument in enumerate(arguments):
+            if argument in ('--pdf', '--png', '--ps', '--svg'):
+                extensions.append(argument[2:])
+            elif argument.startswith('--formats='):
+                extensions.extend(argument[10:].split(','))
+            elif argument == '-f' and i + 1 < len(arguments):
+                extensions.extend(arguments[i + 1].split(','))
+            elif argument == '-dbackend=svg' and not extensions:
+                extensions.append('svg')
+        if not extensions:
+            extensions.append('pdf')
+        # postscript is removed after LilyPond runs
+        extensions = [_ for _ in extensions if _ != 'ps']
+        with open(ly_path, 'rb') as file_pointer:
+            if rb'\midi' in file_pointer.read():
+                extensions.append('midi')
+        directory, ly_file_name = os.path.split(ly_path)
+        directory = directory or os.curdir
+        prefix = re.escape(os.path.splitext(ly_file_name)[0])
+        result = {}
+        for extension in sorted(set(extensions)):
+            # multipage and multiscore output is numbered
+            if extension == 'midi':
+                pattern = prefix + r'(-\d+)?\.midi?'
+            else:
+                pattern = prefix + r'(-page\d+|-\d+)?\.' + extension
+            pattern = re.compile(pattern + '$')
+            result[extension] = sorted(
+                os.path.join(directory, _)
+                for _ in os.listdir(directory)
+                if pattern.match(_)
+                )
+        return result
+
     @staticmethod
     def _make_score_package(
         score_package_path,
@@ -126,6 +173,66 @@ class IOManager(AbjadObject):
             lines.append(line)
         return '\n'.join(lines)
 
+    @staticmethod
+    def _run_lilypond(
+        ly_path,
+        flags=None,
+        lilypond_path=None,
+        log_file_path=None,
+        timeout=None,
+        ):
+        """
+        Returns LilyPond exit code; returns none when LilyPond times out.
+        """
+        import abjad
+        ly_path = str(ly_path)
+        if not lilypond_path:
+            lilypond_path = abjad.abjad_configuration.get('lilypond_path')
+        if not lilypond_path:
+            lilypond_path = abjad.IOManager.find_executable('lilypond')
+            if lilypond_path:
+                lilypond_path = lilypond_path[0]
+            else:
+                lilypond_path = 'lilypond'
+        lilypond_base, extension = os.path.splitext(ly_path)
+        flags = flags or ''
+        date = datetime.datetime.now().strftime('%c')
+        if log_file_path is None:
+            log_file_path = abjad.abjad_configuration.lilypond_log_file_path
+        command = [str(lilypond_path)]
+        command.extend(shlex.split(flags))
+        command.extend(['-dno-point-and-click', '-o', lilypond_base, ly_path])
+        try:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                )
+        except OSError as e:
+            # match exit code of shell when command is not found
+            process, subprocess_output, exit_code = None, f'{e}\n', 127
+        if process is not None:
+            try:
+                subprocess_output, _ = process.communicate(timeout=timeout)
+                exit_code = process.returncode
+            except subprocess.TimeoutExpired:
+                process.kill()
+                subprocess_output, _ = process.communicate()
+                exit_code = None
+            subprocess_output = subprocess_output.decode('utf-8')
+        with open(log_file_path, 'w') as file_pointer:
+            file_pointer.write(date + '\n')
+            file_pointer.write(subprocess_output)
+            if exit_code is None:
+                message = f'LilyPond timed out after {timeout} seconds.\n'
+                file_pointer.write(message)
+        postscript_path = ly_path.replace('.ly', '.ps')
+        try:
+            os.remove(postscript_path)
+        except OSError:
+            pass
+        return exit_code
+
     @staticmethod
     def _warn_when_output_directory_almost_full(last_number):
         import abjad
@@ -684,56 +791,35 @@ class IOManager(AbjadObject):
         return lines
 
     @staticmethod
-    def run_lilypond(ly_path, flags=None, lilypond_path=None):
+    def run_lilypond(
+        ly_path,
+        flags=None,
+        lilypond_path=None,
+        log_file_path=None,
+        timeout=None,
+        ):
         """
         Runs LilyPond on ``ly_path``.
 
-        Writes redirected output of Unix ``date`` to top line of LilyPond log
-        file.
+        Writes date to top line of LilyPond log file.
 
-        Then appends redirected output of LilyPond output to the LilyPond log
-        file.
+        Then appends LilyPond output to the LilyPond log file.
 
-        Returns none.
+        Writes to ``abjad_configuration.lilypond_log_file_path`` when
+        ``log_file_path`` is none.
+
+        Kills LilyPond after ``timeout`` seconds when ``timeout`` is not none.
+
+        Returns true when LilyPond exits successfully; otherwise false.
         """
-        import abjad
-        ly_path = str(ly_path)
-        lilypond_path = abjad.abjad_configuration.get('lilypond_path')
-        if not lilypond_path:
-            lilypond_path = abjad.IOManager.find_executable('lilypond')
-            if lilypond_path:
-                lilypond_path = lilypond_path[0]
-            else:
-                lilypond_path = 'lilypond'
-        lilypond_base, extension = os.path.splitext(ly_path)
-        flags = flags or ''
-        date = datetime.datetime.now().strftime('%c')
-        log_file_path = abjad.abjad_configuration.lilypond_log_file_path
-        command = '{} {} -dno-point-and-click -o {} {}'.format(
-            lilypond_path,
-            flags,
-            lilypond_base,
+        exit_code = IOManager._run_lilypond(
             ly_path,
+            flags=flags,
+            lilypond_path=lilypond_path,
+            log_file_path=log_file_path,
+            timeout=timeout,
             )
-        process = subprocess.Popen(
-            command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            )
-        subprocess_output, _ = process.communicate()
-        subprocess_output = subprocess_output.decode('utf-8')
-        exit_code = process.returncode
-        with open(log_file_path, 'w') as file_pointer:
-            file_pointer.write(date + '\n')
-            file_pointer.write(subprocess_output)
-        postscript_path = ly_path.replace('.ly', '.ps')
-        try:
-            os.remove(postscript_path)
-        except OSError:
-            pass
-        # TODO: maybe just 'return exit_code'?
-        if exit_code:
+        if exit_code is None or exit_code:
             return False
         return True
 
@@ -42,6 +42,18 @@ class LilyPondFormatManager(AbjadObject):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _align_tag(line, n):
+        if '%!' not in line:
+            return line
+        location = line.find('%!')
+        left = line[:location].rstrip()
+        right = line[location:]
+        pad = n - len(left)
+        if pad < 1:
+            pad = 1
+        return left + pad * ' ' + right
+
     @staticmethod
     def _collect_indicators(component):
         import abjad
@@ -66,7 +78,9 @@ class LilyPondFormatManager(AbjadObject):
                 not hasattr(indicator, '_get_lilypond_format_bundle')
                 ):
                 continue
-            elif wrapper.annotation is not None or wrapper.spanner is not None:
+            if hasattr(indicator, '_lilypond_tweak_manager'):
+                abjad.Wrapper._indicator_wrappers[id(indicator)] = wrapper
+            if wrapper.annotation is not None or wrapper.spanner is not None:
                 continue
             # skip comments and commands unless attached directly to us
             elif (wrapper.context is None and
@@ -295,16 +309,7 @@ class LilyPondFormatManager(AbjadObject):
         assert isinstance(n, int), repr(n)
         lines = []
         for line in string.split('\n'):
-            if '%!' not in line:
-                lines.append(line)
-                continue
-            location = line.find('%!')
-            left = line[:location].rstrip()
-            right = line[location:]
-            pad = n - len(left)
-            if pad < 1:
-                pad = 1
-            line = left + pad * ' ' + right
+            line = LilyPondFormatManager._align_tag(line, n)
             lines.append(line)
         string = '\n'.join(lines)
         return string
@@ -577,3 +582,48 @@ class LilyPondFormatManager(AbjadObject):
         if deactivate is True:
             strings_ = ['%@% ' + _ for _ in strings_]
         return strings_
+
+    @staticmethod
+    def write_lilypond_format(argument, file_pointer, strict=None) -> None:
+        r"""
+        Writes LilyPond format of ``argument`` to ``file_pointer`` one line
+        at a time.
+
+        ..  container:: example
+
+            >>> import io
+            >>> staff = abjad.Staff("c'4 d'4")
+            >>> file_pointer = io.StringIO()
+            >>> abjad.LilyPondFormatManager.write_lilypond_format(
+            ...     staff,
+            ...     file_pointer,
+            ...     )
+            >>> print(file_pointer.getvalue())
+            \new Staff
+            {
+                c'4
+                d'4
+            }
+
+            >>> file_pointer.getvalue() == format(staff)
+            True
+
+        Aligns tags starting at column ``strict`` when ``strict`` is an
+        integer.
+
+        Formats score components and LilyPond files without building complete
+        LilyPond format in memory.
+        """
+        if strict is not None:
+            assert isinstance(strict, int), repr(strict)
+        if hasattr(argument, '_iterate_lilypond_format'):
+            pieces = argument._iterate_lilypond_format()
+        else:
+            pieces = [format(argument, 'lilypond')]
+        separator = ''
+        for piece in pieces:
+            for line in piece.split('\n'):
+                if strict is not None:
+                    line = LilyPondFormatManager._align_tag(line, strict)
+                file_pointer.write(separator + line)
+                separator = '\n'
@@ -0,0 +1,281 @@
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+from abjad.tools.abctools.AbjadObject import AbjadObject
+
+
+class LilyPondRenderCache(AbjadObject):
+    """
+    LilyPond render cache.
+
+    ..  container:: example
+
+        >>> cache = abjad.LilyPondRenderCache(
+        ...     directory='/path/to/cache',
+        ...     maximum_size=2**20,
+        ...     )
+        >>> cache
+        LilyPondRenderCache(directory='/path/to/cache', maximum_size=1048576)
+
+        >>> cache.hits, cache.misses
+        (0, 0)
+
+    ..  container:: example
+
+        Persistence manager renders through cache in Abjad output directory:
+
+        >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+        >>> abjad.persist(staff).as_pdf() # doctest: +SKIP
+        >>> abjad.persist(staff).as_pdf() # doctest: +SKIP
+        >>> cache = abjad.persist(staff).render_cache # doctest: +SKIP
+        >>> cache.hits, cache.misses # doctest: +SKIP
+        (1, 1)
+
+    Keys entries on hash of LilyPond file contents, LilyPond flags and
+    LilyPond version.
+
+    Stores files output by LilyPond, together with LilyPond log, in one
+    directory per entry. Evicts least recently used entries when total size
+    of entries exceeds ``maximum_size`` bytes.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Managers'
+
+    __slots__ = (
+        '_directory',
+        '_hits',
+        '_maximum_size',
+        '_misses',
+        )
+
+    _default_maximum_size = 100 * 2**20
+
+    _include_pattern = re.compile(rb'\\include\s+"([^"]+)"')
+
+    _log_file_name = 'lilypond.log'
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory=None, maximum_size=None):
+        if directory is not None:
+            directory = os.path.expanduser(str(directory))
+        self._directory = directory
+        if maximum_size is not None:
+            maximum_size = int(maximum_size)
+            assert 0 <= maximum_size, repr(maximum_size)
+        self._maximum_size = maximum_size
+        self._hits = 0
+        self._misses = 0
+
+    ### PRIVATE METHODS ###
+
+    def _evict(self):
+        entries, directory = [], self._get_directory()
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if not os.path.isdir(path) or name.startswith('.'):
+                continue
+            entry = (os.path.getmtime(path), self._get_size(path), path)
+            entries.append(entry)
+        entries.sort()
+        total_size = sum(_[1] for _ in entries)
+        maximum_size = self._get_maximum_size()
+        for modification_time, size, path in entries:
+            if total_size <= maximum_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+
+    def _get_directory(self):
+        import abjad
+        if self.directory is not None:
+            return self.directory
+        return os.path.join(
+            abjad.abjad_configuration.abjad_output_directory,
+            'cache',
+            )
+
+    def _get_key(self, ly_file_path, flags=None):
+        import abjad
+        hash_ = hashlib.sha1()
+        self._hash_file(hash_, ly_file_path, set())
+        hash_.update(str(flags or '').encode('utf-8'))
+        version = abjad.AbjadConfiguration.get_lilypond_version_string()
+        hash_.update(version.encode('utf-8'))
+        return hash_.hexdigest()
+
+    def _get_maximum_size(self):
+        if self.maximum_size is not None:
+            return self.maximum_size
+        return self._default_maximum_size
+
+    @staticmethod
+    def _get_output_file_paths(ly_file_path, flags=None):
+        import abjad
+        ly_file_time = os.path.getmtime(ly_file_path)
+        output_file_paths = abjad.IOManager._get_lilypond_output_file_paths(
+            ly_file_path,
+            flags=flags,
+            )
+        result = []
+        for paths in output_file_paths.values():
+            # pages left by earlier render of longer score are older
+            result.extend(
+                _ for _ in paths if ly_file_time <= os.path.getmtime(_)
+                )
+        return result
+
+    @staticmethod
+    def _get_size(path):
+        size = 0
+        for name in os.listdir(path):
+            size += os.path.getsize(os.path.join(path, name))
+        return size
+
+    def _hash_file(self, hash_, file_path, visited):
+        visited.add(os.path.abspath(file_path))
+        with open(file_path, 'rb') as file_pointer:
+            contents = file_pointer.read()
+        hash_.update(contents)
+        # included stylesheets change output as much as file itself
+        directory = os.path.dirname(file_path)
+        for match in self._include_pattern.finditer(contents):
+            include = match.group(1).decode('utf-8')
+            include = os.path.join(directory, os.path.expanduser(include))
+            if os.path.abspath(include) in visited:
+                continue
+            if os.path.isfile(include):
+                self._hash_file(hash_, include, visited)
+
+    def _restore(self, entry_directory, ly_file_path):
+        import abjad
+        directory, ly_file_name = os.path.split(ly_file_path)
+        directory = directory or os.curdir
+        prefix = os.path.splitext(ly_file_name)[0]
+        for suffix in os.listdir(entry_directory):
+            source = os.path.join(entry_directory, suffix)
+            if suffix == self._log_file_name:
+                target = abjad.abjad_configuration.lilypond_log_file_path
+            else:
+                target = os.path.join(directory, prefix + suffix)
+            shutil.copyfile(source, target)
+        os.utime(entry_directory)
+
+    def _store(self, key, ly_file_path, output_file_paths):
+        import abjad
+        prefix = os.path.splitext(os.path.basename(ly_file_path))[0]
+        cache_directory = self._get_directory()
+        os.makedirs(cache_directory, exist_ok=True)
+        temporary_directory = tempfile.mkdtemp(
+            dir=cache_directory,
+            prefix='.',
+            )
+        for source in output_file_paths:
+            suffix = os.path.basename(source)[len(prefix):]
+            target = os.path.join(temporary_directory, suffix)
+            shutil.copyfile(source, target)
+        log_file_path = abjad.abjad_configuration.lilypond_log_file_path
+        if os.path.isfile(log_file_path):
+            target = os.path.join(temporary_directory, self._log_file_name)
+            shutil.copyfile(log_file_path, target)
+        entry_directory = os.path.join(cache_directory, key)
+        try:
+            os.rename(temporary_directory, entry_directory)
+        except OSError:
+            # concurrent render stored same entry first
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+        self._evict()
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        """
+        Removes all entries from cache and resets counters.
+
+        Returns none.
+        """
+        directory = self._get_directory()
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+        self._hits = 0
+        self._misses = 0
+
+    def run_lilypond(self, ly_file_path, flags=None):
+        """
+        Runs LilyPond on ``ly_file_path`` unless cache contains output
+        rendered from identical LilyPond file with identical flags.
+
+        Copies cached output next to ``ly_file_path`` on cache hit and
+        restores LilyPond log file written when output was rendered.
+
+        Returns true when LilyPond output exists; otherwise false.
+        """
+        import abjad
+        ly_file_path = str(ly_file_path)
+        key = self._get_key(ly_file_path, flags=flags)
+        entry_directory = os.path.join(self._get_directory(), key)
+        if os.path.isdir(entry_directory):
+            try:
+                self._restore(entry_directory, ly_file_path)
+            except (IOError, OSError):
+                pass
+            else:
+                self._hits += 1
+                return True
+        self._misses += 1
+        success = abjad.IOManager.run_lilypond(ly_file_path, flags=flags)
+        if not success:
+            return success
+        output_file_paths = self._get_output_file_paths(
+            ly_file_path,
+            flags=flags,
+            )
+        if output_file_paths and 0 < self._get_maximum_size():
+            self._store(key, ly_file_path, output_file_paths)
+        return success
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory(self):
+        """
+        Gets cache directory.
+
+        Defaults to ``cache`` directory in Abjad output directory.
+
+        Returns string or none.
+        """
+        return self._directory
+
+    @property
+    def hits(self):
+        """
+        Gets number of renders served from cache.
+
+        Returns nonnegative integer.
+        """
+        return self._hits
+
+    @property
+    def maximum_size(self):
+        """
+        Gets maximum total size of cache entries in bytes.
+
+        Defaults to 100 MB.
+
+        Returns nonnegative integer or none.
+        """
+        return self._maximum_size
+
+    @property
+    def misses(self):
+        """
+        Gets number of renders not served from cache.
+
+        Returns nonnegative integer.
+        """
+        return self._misses
@@ -0,0 +1,204 @@
+import os
+from abjad.tools.abctools.AbjadObject import AbjadObject
+
+
+class LilyPondRenderJob(AbjadObject):
+    """
+    LilyPond render job.
+
+    ..  container:: example
+
+        >>> job = abjad.LilyPondRenderJob('/path/to/score.ly')
+        >>> job
+        LilyPondRenderJob(ly_file_path='/path/to/score.ly')
+
+        >>> job.log_file_path
+        '/path/to/score.log'
+
+        >>> job.status is None
+        True
+
+    Created and run by LilyPond render pool.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Managers'
+
+    __slots__ = (
+        '_elapsed_time',
+        '_exit_code',
+        '_ly_file_path',
+        '_status',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, ly_file_path=None):
+        if ly_file_path is not None:
+            ly_file_path = str(ly_file_path)
+        self._ly_file_path = ly_file_path
+        self._elapsed_time = None
+        self._exit_code = None
+        self._status = None
+
+    ### PRIVATE METHODS ###
+
+    def _get_digest(self, flags=None, lilypond_path=None):
+        import hashlib
+        hash_ = hashlib.sha1()
+        with open(self.ly_file_path, 'rb') as file_pointer:
+            hash_.update(file_pointer.read())
+        hash_.update(str(flags or '').encode('utf-8'))
+        hash_.update(str(lilypond_path or '').encode('utf-8'))
+        return hash_.hexdigest()
+
+    def _outputs_are_current(self, flags=None):
+        import abjad
+        try:
+            digest_time = os.path.getmtime(self.digest_file_path)
+        except (IOError, OSError):
+            return False
+        output_file_paths = abjad.IOManager._get_lilypond_output_file_paths(
+            self.ly_file_path,
+            flags=flags,
+            )
+        for paths in output_file_paths.values():
+            # stale pages left by earlier render do not count
+            if not any(digest_time <= os.path.getmtime(_) for _ in paths):
+                return False
+        return True
+
+    def _read_digest(self):
+        try:
+            with open(self.digest_file_path, 'r') as file_pointer:
+                return file_pointer.read().strip()
+        except (IOError, OSError):
+            return None
+
+    def _remove_digest(self):
+        try:
+            os.remove(self.digest_file_path)
+        except (IOError, OSError):
+            pass
+
+    def _run(
+        self,
+        flags=None,
+        lilypond_path=None,
+        skip_unchanged=True,
+        timeout=None,
+        ):
+        import abjad
+        digest = self._get_digest(flags=flags, lilypond_path=lilypond_path)
+        if (skip_unchanged and
+            digest == self._read_digest() and
+            self._outputs_are_current(flags=flags)):
+            self._exit_code = 0
+            self._elapsed_time = 0
+            self._status = 'skipped'
+            return self
+        # empty digest records file system time at which render starts
+        with open(self.digest_file_path, 'w'):
+            pass
+        start_time = os.path.getmtime(self.digest_file_path)
+        timer = abjad.Timer()
+        with timer:
+            exit_code = abjad.IOManager._run_lilypond(
+                self.ly_file_path,
+                flags=flags,
+                lilypond_path=lilypond_path,
+                log_file_path=self.log_file_path,
+                timeout=timeout,
+                )
+        self._elapsed_time = timer.elapsed_time
+        self._exit_code = exit_code
+        if exit_code is None:
+            self._status = 'timed out'
+            self._remove_digest()
+        elif exit_code:
+            self._status = 'failed'
+            self._remove_digest()
+        else:
+            self._status = 'rendered'
+            with open(self.digest_file_path, 'w') as file_pointer:
+                file_pointer.write(digest + '\n')
+            # outputs written during render are no older than digest
+            os.utime(self.digest_file_path, (start_time, start_time))
+        return self
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def digest_file_path(self):
+        """
+        Gets path of file recording hash of LilyPond file last rendered
+        successfully.
+
+        Modification time of file is time at which render started.
+
+        ..  container:: example
+
+            >>> abjad.LilyPondRenderJob('/path/to/score.ly').digest_file_path
+            '/path/to/score.ly.sha1'
+
+        Returns string.
+        """
+        return self.ly_file_path + '.sha1'
+
+    @property
+    def elapsed_time(self):
+        """
+        Gets elapsed rendering time in seconds.
+
+        Returns float or none.
+        """
+        return self._elapsed_time
+
+    @property
+    def exit_code(self):
+        """
+        Gets LilyPond exit code.
+
+        Returns integer or none.
+        """
+        return self._exit_code
+
+    @property
+    def log_file_path(self):
+        """
+        Gets path of log file to which job writes LilyPond output.
+
+        Returns string.
+        """
+        return os.path.splitext(self.ly_file_path)[0] + '.log'
+
+    @property
+    def ly_file_path(self):
+        """
+        Gets LilyPond file path.
+
+        Returns string.
+        """
+        return self._ly_file_path
+
+    @property
+    def status(self):
+        """
+        Gets status of job.
+
+        Returns ``'failed'``, ``'rendered'``, ``'skipped'``, ``'timed out'``
+        or none when job has not run.
+        """
+        return self._status
+
+    @property
+    def success(self):
+        """
+        Is true when job rendered successfully or was skipped because
+        LilyPond file is unchanged since last successful render and output
+        of that render is still in place.
+
+        Returns true or false.
+        """
+        return self.status in ('rendered', 'skipped')
@@ -0,0 +1,171 @@
+import os
+from abjad.tools.abctools.AbjadObject import AbjadObject
+
+
+class LilyPondRenderPool(AbjadObject):
+    """
+    LilyPond render pool.
+
+    ..  container:: example
+
+        >>> pool = abjad.LilyPondRenderPool(processes=4, timeout=600)
+        >>> pool
+        LilyPondRenderPool(processes=4, skip_unchanged=True, timeout=600)
+
+    ..  container:: example
+
+        Persists scores as LilyPond files and then renders them concurrently:
+
+        >>> ly_file_paths = []
+        >>> for i in range(8): # doctest: +SKIP
+        ...     staff = abjad.Staff(i * "c'4 ")
+        ...     ly_file_path = f'/path/to/part-{i}.ly'
+        ...     abjad.persist(staff).as_ly(ly_file_path)
+        ...     ly_file_paths.append(ly_file_path)
+        ...
+
+        >>> jobs = pool(ly_file_paths) # doctest: +SKIP
+        >>> for job in jobs: # doctest: +SKIP
+        ...     job.status, job.log_file_path
+        ...
+        ('rendered', '/path/to/part-0.log')
+        ('rendered', '/path/to/part-1.log')
+        ...
+
+        Skips LilyPond files unchanged since last successful render:
+
+        >>> jobs = pool(ly_file_paths) # doctest: +SKIP
+        >>> [_.status for _ in jobs] # doctest: +SKIP
+        ['skipped', 'skipped', 'skipped', 'skipped', ...]
+
+    Runs as many LilyPond processes at once as ``processes``; defaults to
+    number of CPUs.
+
+    Writes LilyPond output of each job to log file next to LilyPond file.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Managers'
+
+    __slots__ = (
+        '_flags',
+        '_lilypond_path',
+        '_processes',
+        '_skip_unchanged',
+        '_timeout',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        flags=None,
+        lilypond_path=None,
+        processes=None,
+        skip_unchanged=True,
+        timeout=None,
+        ):
+        if flags is not None:
+            flags = str(flags)
+        self._flags = flags
+        if lilypond_path is not None:
+            lilypond_path = str(lilypond_path)
+        self._lilypond_path = lilypond_path
+        if processes is not None:
+            processes = int(processes)
+            assert 0 < processes, repr(processes)
+        self._processes = processes
+        self._skip_unchanged = bool(skip_unchanged)
+        if timeout is not None:
+            assert 0 < timeout, repr(timeout)
+        self._timeout = timeout
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, ly_file_paths):
+        """
+        Calls LilyPond render pool on ``ly_file_paths``.
+
+        Returns tuple of jobs in order of ``ly_file_paths``.
+        """
+        import abjad
+        import concurrent.futures
+        jobs = []
+        for ly_file_path in ly_file_paths:
+            ly_file_path = os.path.expanduser(str(ly_file_path))
+            job = abjad.LilyPondRenderJob(ly_file_path)
+            jobs.append(job)
+        if not jobs:
+            return ()
+        processes = self.processes or os.cpu_count() or 1
+        processes = min(processes, len(jobs))
+        with concurrent.futures.ThreadPoolExecutor(processes) as executor:
+            futures = [
+                executor.submit(
+                    job._run,
+                    flags=self.flags,
+                    lilypond_path=self.lilypond_path,
+                    skip_unchanged=self.skip_unchanged,
+                    timeout=self.timeout,
+                    )
+                for job in jobs
+                ]
+            for future in futures:
+                future.result()
+        return tuple(jobs)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def flags(self):
+        """
+        Gets LilyPond command-line flags.
+
+        ..  container:: example
+
+            >>> abjad.LilyPondRenderPool(flags='--png').flags
+            '--png'
+
+        Returns string or none.
+        """
+        return self._flags
+
+    @property
+    def lilypond_path(self):
+        """
+        Gets LilyPond executable path.
+
+        Defaults to LilyPond path found by Abjad configuration.
+
+        Returns string or none.
+        """
+        return self._lilypond_path
+
+    @property
+    def processes(self):
+        """
+        Gets maximum number of concurrent LilyPond processes.
+
+        Returns positive integer or none.
+        """
+        return self._processes
+
+    @property
+    def skip_unchanged(self):
+        """
+        Is true when pool skips LilyPond files unchanged since last
+        successful render with same flags.
+
+        Returns true or false.
+        """
+        return self._skip_unchanged
+
+    @property
+    def timeout(self):
+        """
+        Gets number of seconds after which each LilyPond process is killed.
+
+        Returns number or none.
+        """
+        return self._timeout
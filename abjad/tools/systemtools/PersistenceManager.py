@@ -27,6 +27,8 @@ class PersistenceManager(abctools.AbjadObject):
 
     _png_page_pattern = re.compile(r'.+page(\d+)\.png')
 
+    _render_cache = None
+
     ### INITIALIZER ###
 
     def __init__(self, client=None):
@@ -55,6 +57,9 @@ class PersistenceManager(abctools.AbjadObject):
             '/Users/josiah/Desktop/example.ly'
             0.04491996765136719
 
+        Writes LilyPond format to temporary file line by line and then
+        replaces file at ``ly_file_path``.
+
         Returns output path and elapsed formatting time when LilyPond output is
         written.
         """
@@ -75,18 +80,28 @@ class PersistenceManager(abctools.AbjadObject):
             ly_file_path = str(ly_file_path)
             ly_file_path = os.path.expanduser(ly_file_path)
         assert ly_file_path.endswith('.ly'), ly_file_path
+        directory = os.path.dirname(ly_file_path)
+        abjad.IOManager._ensure_directory_existence(directory)
         timer = abjad.Timer()
         with timer:
-            string = lilypond_file.__format__(
-                format_specification='lilypond',
+            # stream next to target so that replacing target is atomic
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=directory or os.curdir,
+                suffix='.ly',
                 )
-            if isinstance(strict, int):
-                string = abjad.LilyPondFormatManager.align_tags(string, strict)
+            try:
+                with os.fdopen(file_descriptor, 'w') as file_pointer:
+                    abjad.LilyPondFormatManager.write_lilypond_format(
+                        lilypond_file,
+                        file_pointer,
+                        strict=strict,
+                        )
+                os.replace(temporary_path, ly_file_path)
+            except Exception:
+                # existing LilyPond file is left untouched
+                os.remove(temporary_path)
+                raise
         abjad_formatting_time = timer.elapsed_time
-        directory = os.path.dirname(ly_file_path)
-        abjad.IOManager._ensure_directory_existence(directory)
-        with open(ly_file_path, 'w') as file_pointer:
-            file_pointer.write(string)
         return ly_file_path, abjad_formatting_time
 
     def as_midi(self, midi_file_path=None, remove_ly=False, **keywords):
@@ -125,7 +140,7 @@ class PersistenceManager(abctools.AbjadObject):
         ly_file_path, abjad_formatting_time = result
         timer = systemtools.Timer()
         with timer:
-            systemtools.IOManager.run_lilypond(ly_file_path)
+            self.render_cache.run_lilypond(ly_file_path)
         lilypond_rendering_time = timer.elapsed_time
         if os.name == 'nt':
             extension = 'mid'
@@ -234,7 +249,7 @@ class PersistenceManager(abctools.AbjadObject):
         pdf_file_path = '{}.pdf'.format(without_extension)
         timer = systemtools.Timer()
         with timer:
-            success = systemtools.IOManager.run_lilypond(ly_file_path)
+            success = self.render_cache.run_lilypond(ly_file_path)
         lilypond_rendering_time = timer.elapsed_time
         if remove_ly:
             os.remove(ly_file_path)
@@ -316,7 +331,7 @@ class PersistenceManager(abctools.AbjadObject):
 
         timer = systemtools.Timer()
         with timer:
-            success = systemtools.IOManager.run_lilypond(
+            success = self.render_cache.run_lilypond(
                 temporary_ly_file_path,
                 flags='--png',
                 )
@@ -363,3 +378,21 @@ class PersistenceManager(abctools.AbjadObject):
         Returns component or selection.
         """
         return self._client
+
+    @property
+    def render_cache(self):
+        """
+        Gets LilyPond render cache shared by all persistence managers.
+
+        ..  container:: example
+
+            >>> abjad.persist(abjad.Staff()).render_cache
+            LilyPondRenderCache()
+
+        Returns LilyPond render cache.
+        """
+        from abjad.tools import systemtools
+        if PersistenceManager._render_cache is None:
+            cache = systemtools.LilyPondRenderCache()
+            PersistenceManager._render_cache = cache
+        return PersistenceManager._render_cache
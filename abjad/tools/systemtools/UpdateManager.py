@@ -1,6 +1,14 @@
+import bisect
+import functools
+import itertools
+import math
 from abjad.enumerations import Left
 from abjad.tools.abctools.AbjadObject import AbjadObject
 from abjad.exceptions import MissingMetronomeMarkError
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
 
 
 class UpdateManager(AbjadObject):
@@ -16,8 +24,57 @@ class UpdateManager(AbjadObject):
 
     __slots__ = ()
 
+    _measure_start_offsets: dict = {}
+
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _collect_offset_runs(class_, component, numerator, denominator, run):
+        children = getattr(component, '_components', None)
+        if children is None:
+            duration = component._get_preprolated_duration()
+            run['items'].append(component)
+            run['durations'].append((
+                numerator * duration.numerator,
+                denominator * duration.denominator,
+                ))
+            return
+        prolation = getattr(component, 'implied_prolation', 1)
+        if prolation != 1:
+            numerator *= prolation.numerator
+            denominator *= prolation.denominator
+        if component.is_simultaneous:
+            runs = []
+            for child in children:
+                run_ = class_._make_offset_run()
+                class_._collect_offset_runs(
+                    child,
+                    numerator,
+                    denominator,
+                    run_,
+                    )
+                runs.append(run_)
+            run['items'].append((component, runs))
+            run['durations'].append(None)
+        else:
+            start_index = len(run['items'])
+            for child in children:
+                class_._collect_offset_runs(
+                    child,
+                    numerator,
+                    denominator,
+                    run,
+                    )
+            span = (component, start_index, len(run['items']))
+            run['spans'].append(span)
+
+    @staticmethod
+    def _get_cumulative_sums(ticks):
+        if numpy is not None and sum(ticks) < 2**62:
+            sums = numpy.cumsum(numpy.array(ticks, dtype=numpy.int64))
+            return [0] + sums.tolist()
+        return [0] + list(itertools.accumulate(ticks))
+
     @staticmethod
     def _get_score_tree_state_flags(parentage):
         offsets_are_current = True
@@ -50,6 +107,10 @@ class UpdateManager(AbjadObject):
             )
         return components
 
+    @staticmethod
+    def _make_offset_run():
+        return {'durations': [], 'items': [], 'spans': [], 'start': 0}
+
     def _make_metronome_mark_map(self, score_root):
         from abjad.tools.datastructuretools.Multiplier import Multiplier
         from abjad.tools.datastructuretools.Offset import Offset
@@ -116,8 +177,9 @@ class UpdateManager(AbjadObject):
     @staticmethod
     def _update_all_leaf_indices_and_measure_numbers(score_root):
         """
-        Call only when updating offsets.
-        No separate state flags exist for leaf indices or measure numbers.
+        Call only after updating offsets.
+        Leaf indices and measure numbers share one state flag kept on the
+        score root.
         """
         from abjad.tools import scoretools
         from abjad.tools.topleveltools import iterate
@@ -142,10 +204,25 @@ class UpdateManager(AbjadObject):
         """
         Updating offsets does not update indicators.
         Updating offsets does not update offsets in seconds.
+
+        Updates offsets incrementally: components with current offsets
+        whose start offset has not shifted are skipped together with
+        their descendants. Computes offsets of score never updated before
+        from offset table.
         """
-        for component in self._iterate_entire_score(score_root):
-            self._update_component_offsets(component)
-            component._offsets_are_current = True
+        import abjad
+        prototype = (abjad.AfterGraceContainer, abjad.GraceContainer)
+        if isinstance(score_root, prototype):
+            self._update_grace_container_offsets(score_root)
+            return
+        if score_root._start_offset is None:
+            self._update_offsets_from_table(score_root)
+            return
+        self._update_offsets_from(
+            score_root,
+            abjad.Offset(0),
+            abjad.Multiplier(1),
+            )
 
     def _update_all_offsets_in_seconds(self, score_root):
         self._update_all_offsets(score_root)
@@ -208,6 +285,179 @@ class UpdateManager(AbjadObject):
         component._timespan._start_offset = start_offset
         component._timespan._stop_offset = stop_offset
 
+    @classmethod
+    def _update_grace_container_offsets(class_, grace_container):
+        for component in class_._iterate_entire_score(grace_container):
+            class_._update_component_offsets(component)
+            component._offsets_are_current = True
+
+    @classmethod
+    def _update_offsets_from(class_, component, start_offset, prolation):
+        """
+        Updates offsets of ``component`` starting at ``start_offset``.
+
+        ``prolation`` is the prolation of the parentage of ``component``.
+
+        Returns stop offset of ``component``.
+        """
+        if (component._offsets_are_current and
+            component._start_offset == start_offset):
+            return component._stop_offset
+        children = getattr(component, '_components', None)
+        if hasattr(component, '_dependent_wrapper_index'):
+            component._dependent_wrapper_index.clear()
+        if children is None:
+            duration = prolation * component._get_preprolated_duration()
+            stop_offset = start_offset + duration
+        else:
+            prolation *= getattr(component, 'implied_prolation', 1)
+            if component.is_simultaneous:
+                stop_offset = start_offset
+                for child in children:
+                    child_stop_offset = class_._update_offsets_from(
+                        child,
+                        start_offset,
+                        prolation,
+                        )
+                    stop_offset = max(stop_offset, child_stop_offset)
+            else:
+                stop_offset = class_._update_sequential_offsets(
+                    component,
+                    start_offset,
+                    prolation,
+                    )
+        component._start_offset = start_offset
+        component._stop_offset = stop_offset
+        component._timespan._start_offset = start_offset
+        component._timespan._stop_offset = stop_offset
+        component._offsets_are_current = True
+        if children is None:
+            if component._grace_container is not None:
+                class_._update_grace_container_offsets(
+                    component._grace_container)
+            if component._after_grace_container is not None:
+                class_._update_grace_container_offsets(
+                    component._after_grace_container)
+        return stop_offset
+
+    @classmethod
+    def _update_offsets_from_table(class_, score_root):
+        """
+        Updates offsets of all components in ``score_root``.
+
+        Offset table gives durations of leaves as integers over least
+        common denominator of all leaf durations; start offsets are
+        cumulative sums of durations in each voice. Uses NumPy when
+        available. Makes one offset for each distinct point in time.
+        """
+        import abjad
+        root_run = class_._make_offset_run()
+        class_._collect_offset_runs(score_root, 1, 1, root_run)
+        runs, i = [root_run], 0
+        while i < len(runs):
+            for item in runs[i]['items']:
+                if isinstance(item, tuple):
+                    runs.extend(item[1])
+            i += 1
+        denominators = set()
+        for run in runs:
+            for pair in run['durations']:
+                if pair is not None:
+                    denominators.add(pair[1])
+        lcm = functools.reduce(
+            lambda x, y: x * y // math.gcd(x, y),
+            denominators,
+            1,
+            )
+        # inner voices come after outer voices
+        for run in reversed(runs):
+            ticks = []
+            for item, pair in zip(run['items'], run['durations']):
+                if pair is None:
+                    tick = max((_['total'] for _ in item[1]), default=0)
+                else:
+                    tick = pair[0] * (lcm // pair[1])
+                ticks.append(tick)
+            run['ticks'] = ticks
+            run['total'] = sum(ticks)
+        offsets = {}
+
+        def get_offset(tick):
+            offset = offsets.get(tick)
+            if offset is None:
+                offset = abjad.Offset(tick, lcm)
+                offsets[tick] = offset
+            return offset
+
+        def set_offsets(component, start_tick, stop_tick):
+            start_offset = get_offset(start_tick)
+            stop_offset = get_offset(stop_tick)
+            component._start_offset = start_offset
+            component._stop_offset = stop_offset
+            component._timespan._start_offset = start_offset
+            component._timespan._stop_offset = stop_offset
+            component._offsets_are_current = True
+            if hasattr(component, '_dependent_wrapper_index'):
+                component._dependent_wrapper_index.clear()
+
+        for run in runs:
+            start = run['start']
+            sums = [
+                start + _
+                for _ in class_._get_cumulative_sums(run['ticks'])
+                ]
+            for i, item in enumerate(run['items']):
+                if isinstance(item, tuple):
+                    component, runs_ = item
+                    for run_ in runs_:
+                        run_['start'] = sums[i]
+                else:
+                    component = item
+                set_offsets(component, sums[i], sums[i + 1])
+            for component, start_index, stop_index in run['spans']:
+                set_offsets(component, sums[start_index], sums[stop_index])
+        for run in runs:
+            for item in run['items']:
+                if isinstance(item, tuple):
+                    continue
+                if item._grace_container is not None:
+                    class_._update_grace_container_offsets(
+                        item._grace_container)
+                if item._after_grace_container is not None:
+                    class_._update_grace_container_offsets(
+                        item._after_grace_container)
+
+    @classmethod
+    def _update_sequential_offsets(class_, container, start_offset, prolation):
+        """
+        Runs of children with current offsets are skipped in one step
+        when the first child of the run has not shifted.
+
+        Relies on removal marking the following sibling as out of date.
+        """
+        children = container._components
+        dirty_indices = [
+            i for i, child in enumerate(children)
+            if not child._offsets_are_current
+            ]
+        dirty_indices.append(len(children))
+        i, current_offset = 0, start_offset
+        while i < len(children):
+            child = children[i]
+            if (child._offsets_are_current and
+                child._start_offset == current_offset):
+                j = dirty_indices[bisect.bisect(dirty_indices, i)]
+                current_offset = children[j - 1]._stop_offset
+                i = j
+                continue
+            current_offset = class_._update_offsets_from(
+                child,
+                current_offset,
+                prolation,
+                )
+            i += 1
+        return current_offset
+
 #    @staticmethod
 #    def _update_component_offsets_in_seconds(component):
 #        import abjad
@@ -234,9 +484,10 @@ class UpdateManager(AbjadObject):
         offsets=False,
         offsets_in_seconds=False,
         indicators=False,
+        measure_numbers=False,
         ):
         import abjad
-        assert offsets or offsets_in_seconds or indicators
+        assert offsets or offsets_in_seconds or indicators or measure_numbers
         if component._is_forbidden_to_update:
             return
         parentage = abjad.inspect(component).get_parentage(
@@ -252,9 +503,12 @@ class UpdateManager(AbjadObject):
             offsets_in_seconds_are_current,
             ) = self._get_score_tree_state_flags(parentage)
         score_root = parentage.root
-        if offsets and not offsets_are_current:
+        if (offsets or measure_numbers) and not offsets_are_current:
             self._update_all_offsets(score_root)
+            score_root._measure_numbers_are_current = False
+        if measure_numbers and not score_root._measure_numbers_are_current:
             self._update_all_leaf_indices_and_measure_numbers(score_root)
+            score_root._measure_numbers_are_current = True
         if offsets_in_seconds and not offsets_in_seconds_are_current:
             self._update_all_offsets_in_seconds(score_root)
         if indicators and not indicators_are_current:
@@ -309,10 +563,23 @@ class UpdateManager(AbjadObject):
 
     def _get_measure_start_offsets(self, component):
         import abjad
-        wrappers = []
-        prototype = abjad.TimeSignature
         score_root = abjad.inspect(component).get_parentage(
             include_self=True).root
+        # score root gets new format epoch on every change to score
+        key = (id(score_root), score_root._format_epoch)
+        measure_start_offsets = self._measure_start_offsets.get(key)
+        if measure_start_offsets is None:
+            measure_start_offsets = self._make_measure_start_offsets(
+                score_root)
+            if 1024 <= len(self._measure_start_offsets):
+                self._measure_start_offsets.clear()
+            self._measure_start_offsets[key] = measure_start_offsets
+        return measure_start_offsets
+
+    def _make_measure_start_offsets(self, score_root):
+        import abjad
+        wrappers = []
+        prototype = abjad.TimeSignature
         for component in self._iterate_entire_score(score_root):
             wrappers_ = abjad.inspect(component).wrappers(prototype)
             wrappers.extend(wrappers_)
@@ -331,8 +598,6 @@ class UpdateManager(AbjadObject):
         elif not pairs:
             pairs = [default_pair]
         pairs.sort(key=lambda x: x[0])
-        parentage = abjad.inspect(component).get_parentage()
-        score_root = parentage.root
         inspector = abjad.inspect(score_root)
         score_stop_offset = inspector.get_timespan().stop_offset
         dummy_last_pair = (score_stop_offset, None)
@@ -347,26 +612,21 @@ class UpdateManager(AbjadObject):
                 measure_start_offset += current_time_signature.duration
         return measure_start_offsets
 
-    # TODO: reimplement with some type of bisection
     def _to_measure_number(
         self,
         component,
         measure_number_start_offsets,
         ):
-        import abjad
-        inspector = abjad.inspect(component)
-        component_start_offset = inspector.get_timespan().start_offset
-        measure_number_start_offsets = measure_number_start_offsets[:]
-        measure_number_start_offsets.append(abjad.mathtools.Infinity())
-        pairs = abjad.sequence(measure_number_start_offsets)
-        pairs = pairs.nwise()
-        for measure_index, pair in enumerate(pairs):
-            if pair[0] <= component_start_offset < pair[-1]:
-                measure_number = measure_index + 1
-                return measure_number
-        message = 'can not find measure number: {!r}, {!r}.'
-        message = message.format(component, measure_number_start_offsets)
-        raise ValueError(message)
+        start_offset = component._get_timespan().start_offset
+        measure_number = bisect.bisect(
+            measure_number_start_offsets,
+            start_offset,
+            )
+        if measure_number == 0:
+            message = 'can not find measure number: {!r}, {!r}.'
+            message = message.format(component, measure_number_start_offsets)
+            raise ValueError(message)
+        return measure_number
 
     def _update_measure_numbers(self, component):
         import abjad
@@ -374,9 +634,15 @@ class UpdateManager(AbjadObject):
         assert measure_start_offsets, repr(measure_start_offsets)
         score_root = abjad.inspect(component).get_parentage(
             include_self=True).root
+        score_root._update_now(offsets=True)
         for component in self._iterate_entire_score(score_root):
-            measure_number = self._to_measure_number(
-                component,
+            start_offset = component._timespan.start_offset
+            measure_number = bisect.bisect(
                 measure_start_offsets,
+                start_offset,
                 )
+            if measure_number == 0:
+                message = 'can not find measure number: {!r}, {!r}.'
+                message = message.format(component, measure_start_offsets)
+                raise ValueError(message)
             component._measure_number = measure_number
@@ -18,6 +18,7 @@ class WellformednessManager(AbjadObject):
 
     __slots__ = (
         '_allow_percussion_clef',
+        '_walk',
         )
 
     _publish_storage_format = True
@@ -26,6 +27,7 @@ class WellformednessManager(AbjadObject):
 
     def __init__(self, allow_percussion_clef=None):
         self._allow_percussion_clef = allow_percussion_clef
+        self._walk = None
 
     ### SPECIAL METHODS ###
 
@@ -33,17 +35,26 @@ class WellformednessManager(AbjadObject):
         """
         Calls all wellformedness checks on ``argument``.
 
+        Iterates ``argument`` once; checks share components and effective
+        indicators found during iteration.
+
         Returns triples.
         """
         if argument is None:
             return
         check_names = [_ for _ in dir(self) if _.startswith('check_')]
         triples = []
-        for current_check_name in sorted(check_names):
-            current_check = getattr(self, current_check_name)
-            current_violators, current_total = current_check(argument=argument)
-            triple = (current_violators, current_total, current_check_name)
-            triples.append(triple)
+        self._walk = self._make_walk(argument)
+        try:
+            for current_check_name in sorted(check_names):
+                current_check = getattr(self, current_check_name)
+                current_violators, current_total = current_check(
+                    argument=argument,
+                    )
+                triple = (current_violators, current_total, current_check_name)
+                triples.append(triple)
+        finally:
+            self._walk = None
         return triples
 
     ### PRIVATE METHODS ###
@@ -51,8 +62,8 @@ class WellformednessManager(AbjadObject):
     def _check_overlapping_spanners(self, argument, prototype=None):
         import abjad
         violators, spanners = set(), set()
-        for leaf in abjad.iterate(argument).leaves():
-            spanners_ = list(abjad.inspect(leaf).get_spanners(prototype))
+        for leaf in self._iterate_components(argument, abjad.Leaf):
+            spanners_ = list(self._get_spanners(leaf, prototype))
             spanners.update(spanners_)
             if 1 < len(spanners_):
                 if len(spanners_) == 2:
@@ -68,6 +79,46 @@ class WellformednessManager(AbjadObject):
                 violators.update(spanners_)
         return violators, len(spanners)
 
+    def _get_effective(self, leaf, prototype):
+        import abjad
+        if self._walk is None:
+            return abjad.inspect(leaf).get_effective(prototype)
+        effective = self._walk['effective']
+        key = (id(leaf), prototype)
+        if key not in effective:
+            effective[key] = abjad.inspect(leaf).get_effective(prototype)
+        return effective[key]
+
+    def _get_spanners(self, leaf, prototype=None):
+        import abjad
+        if self._walk is None:
+            return abjad.inspect(leaf).get_spanners(prototype)
+        spanners = self._walk['spanners']
+        if id(leaf) not in spanners:
+            spanners[id(leaf)] = abjad.inspect(leaf).get_spanners()
+        if prototype is None:
+            return list(spanners[id(leaf)])
+        return [_ for _ in spanners[id(leaf)] if isinstance(_, prototype)]
+
+    def _iterate_components(self, argument, prototype=None):
+        import abjad
+        if self._walk is None or self._walk['argument'] is not argument:
+            return abjad.iterate(argument).components(prototype)
+        if prototype is None:
+            return iter(self._walk['components'])
+        components = self._walk['components']
+        return (_ for _ in components if isinstance(_, prototype))
+
+    @staticmethod
+    def _make_walk(argument):
+        import abjad
+        return {
+            'argument': argument,
+            'components': list(abjad.iterate(argument).components()),
+            'effective': {},
+            'spanners': {},
+            }
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -107,11 +158,11 @@ class WellformednessManager(AbjadObject):
             abjad.DuratedComplexBeam,
             abjad.MultipartBeam,
             )
-        for leaf in abjad.iterate(argument).leaves():
+        for leaf in self._iterate_components(argument, abjad.Leaf):
             if leaf.written_duration < abjad.Duration(1, 4):
                 continue
             total.add(leaf)
-            beams = abjad.inspect(leaf).get_spanners(abjad.Beam)
+            beams = self._get_spanners(leaf, abjad.Beam)
             for beam in beams:
                 if isinstance(beam, smart_beams):
                     continue
@@ -148,7 +199,7 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators = []
-        components = abjad.iterate(argument).components()
+        components = self._iterate_components(argument)
         total_ids = [id(_) for _ in components]
         unique_ids = abjad.sequence(total_ids).remove_repeats()
         if len(unique_ids) < len(total_ids):
@@ -188,7 +239,8 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, containers = [], set()
-        for container in abjad.iterate(argument).components(abjad.Container):
+        prototype = abjad.Container
+        for container in self._iterate_components(argument, prototype):
             containers.add(container)
             if len(container) == 0:
                 violators.append(container)
@@ -202,7 +254,7 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        for measure in abjad.iterate(argument).components(abjad.Measure):
+        for measure in self._iterate_components(argument, abjad.Measure):
             total.add(measure)
             time_signature = measure.time_signature
             if time_signature is not None:
@@ -219,12 +271,45 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        for measure in abjad.iterate(argument).components(abjad.Measure):
+        for measure in self._iterate_components(argument, abjad.Measure):
             total.add(measure)
             if measure.is_misfilled:
                 violators.append(measure)
         return violators, len(total)
 
+    def check_misindexed_components(self, argument=None):
+        r"""
+        Checks misindexed components.
+
+        ..  container:: example
+
+            Components cache index in parent; changing parent contents
+            without container methods leaves cached indices out of date:
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+            >>> staff._components.reverse()
+
+            >>> manager = abjad.WellformednessManager()
+            >>> violators, total = manager.check_misindexed_components(staff)
+            >>> violators
+            [Note("f'4"), Note("e'4"), Note("d'4"), Note("c'4")]
+
+        Returns list of misindexed components and count of all components in
+        ``argument``.
+        """
+        violators, total = [], set()
+        for component in self._iterate_components(argument):
+            total.add(component)
+            if component._parent is None:
+                continue
+            components = component._parent._components
+            i = component._index_in_parent
+            if (i is None or
+                len(components) <= i or
+                components[i] is not component):
+                violators.append(component)
+        return violators, len(total)
+
     def check_mismatched_enchained_hairpins(self, argument=None):
         r"""
         Checks mismatched enchained hairpins.
@@ -245,6 +330,7 @@ class WellformednessManager(AbjadObject):
             0 / 1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	5 misindexed components
             2 /	2 mismatched enchained hairpins
             0 / 0 mispitched ties
             0 /	4 misrepresented flags
@@ -266,8 +352,8 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves():
-            hairpins = abjad.inspect(leaf).get_spanners(abjad.Hairpin)
+        for leaf in self._iterate_components(argument, abjad.Leaf):
+            hairpins = self._get_spanners(leaf, abjad.Hairpin)
             hairpins = list(hairpins)
             total.update(hairpins)
             if len(hairpins) <= 1:
@@ -314,6 +400,7 @@ class WellformednessManager(AbjadObject):
             0 / 1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	3 misindexed components
             0 /	0 mismatched enchained hairpins
             1 /	1 mispitched ties
             0 /	2 misrepresented flags
@@ -344,6 +431,7 @@ class WellformednessManager(AbjadObject):
             0 / 1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	3 misindexed components
             0 /	0 mismatched enchained hairpins
             1 /	1 mispitched ties
             0 /	2 misrepresented flags
@@ -363,8 +451,9 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, ties = [], set()
-        for leaf in abjad.iterate(argument).leaves(pitched=True):
-            ties_ = abjad.inspect(leaf).get_spanners(abjad.Tie)
+        prototype = (abjad.Chord, abjad.Note)
+        for leaf in self._iterate_components(argument, prototype):
+            ties_ = self._get_spanners(leaf, abjad.Tie)
             ties.update(ties_)
         for tie in ties:
             for first_leaf, second_leaf in abjad.sequence(tie).nwise():
@@ -385,7 +474,7 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves():
+        for leaf in self._iterate_components(argument, abjad.Leaf):
             total.add(leaf)
             flags = leaf.written_duration.flag_count
             left = getattr(abjad.setting(leaf), 'stem_left_beam_count', None)
@@ -410,7 +499,7 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        components = abjad.iterate(argument).components()
+        components = self._iterate_components(argument)
         for i, component in enumerate(components):
             total.add(component)
             if 0 < i:
@@ -426,7 +515,7 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        for measure in abjad.iterate(argument).components(abjad.Measure):
+        for measure in self._iterate_components(argument, abjad.Measure):
             total.add(measure)
             parentage = abjad.inspect(measure).get_parentage(
                 include_self=False,
@@ -470,6 +559,7 @@ class WellformednessManager(AbjadObject):
             0 /	1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	5 misindexed components
             0 /	0 mismatched enchained hairpins
             0 / 0 mispitched ties
             0 /	4 misrepresented flags
@@ -520,6 +610,7 @@ class WellformednessManager(AbjadObject):
             0 /	1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	5 misindexed components
             0 /	0 mismatched enchained hairpins
             0 / 0 mispitched ties
             0 /	4 misrepresented flags
@@ -549,6 +640,7 @@ class WellformednessManager(AbjadObject):
             0 /	1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	5 misindexed components
             0 /	0 mismatched enchained hairpins
             0 / 0 mispitched ties
             0 /	4 misrepresented flags
@@ -568,20 +660,25 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves():
+        # most leaves share effective instrument and clef with predecessor
+        results = {}
+        for leaf in self._iterate_components(argument, abjad.Leaf):
             total.add(leaf)
-            instrument = abjad.inspect(leaf).get_effective(abjad.Instrument)
+            instrument = self._get_effective(leaf, abjad.Instrument)
             if instrument is None:
                 continue
-            clef = abjad.inspect(leaf).get_effective(abjad.Clef)
+            clef = self._get_effective(leaf, abjad.Clef)
             if clef is None:
                 continue
-            allowable_clefs = [
-                abjad.Clef(_) for _ in instrument.allowable_clefs
-                ]
-            if self.allow_percussion_clef:
-                allowable_clefs.append(abjad.Clef('percussion'))
-            if clef not in allowable_clefs:
+            key = (id(instrument), id(clef))
+            if key not in results:
+                allowable_clefs = [
+                    abjad.Clef(_) for _ in instrument.allowable_clefs
+                    ]
+                if self.allow_percussion_clef:
+                    allowable_clefs.append(abjad.Clef('percussion'))
+                results[key] = clef in allowable_clefs
+            if not results[key]:
                 violators.append(leaf)
         return violators, len(total)
 
@@ -619,6 +716,7 @@ class WellformednessManager(AbjadObject):
             0 /	1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	5 misindexed components
             0 /	0 mismatched enchained hairpins
             0 / 0 mispitched ties
             0 /	4 misrepresented flags
@@ -638,9 +736,10 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves(pitched=True):
+        prototype = (abjad.Chord, abjad.Note)
+        for leaf in self._iterate_components(argument, prototype):
             total.add(leaf)
-            instrument = abjad.inspect(leaf).get_effective(abjad.Instrument)
+            instrument = self._get_effective(leaf, abjad.Instrument)
             if instrument is None:
                 continue
             if leaf not in instrument.pitch_range:
@@ -687,8 +786,8 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves():
-            beams = abjad.inspect(leaf).get_spanners(abjad.Beam)
+        for leaf in self._iterate_components(argument, abjad.Leaf):
+            beams = self._get_spanners(leaf, abjad.Beam)
             total.update(beams)
             if 1 < len(beams):
                 for beam in beams:
@@ -725,6 +824,7 @@ class WellformednessManager(AbjadObject):
             0 / 1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	5 misindexed components
             0 /	2 mismatched enchained hairpins
             0 / 0 mispitched ties
             0 /	4 misrepresented flags
@@ -756,8 +856,8 @@ class WellformednessManager(AbjadObject):
         import abjad
         violators, total = [], set()
         prototype = abjad.OctavationSpanner
-        for leaf in abjad.iterate(argument).leaves():
-            spanners = abjad.inspect(leaf).get_spanners(prototype)
+        for leaf in self._iterate_components(argument, abjad.Leaf):
+            spanners = self._get_spanners(leaf, prototype)
             total.update(spanners)
             if 1 < len(spanners):
                 for spanner in spanners:
@@ -788,6 +888,7 @@ class WellformednessManager(AbjadObject):
             0 / 1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	5 misindexed components
             0 /	0 mismatched enchained hairpins
             0 / 2 mispitched ties
             0 /	4 misrepresented flags
@@ -807,8 +908,8 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves():
-            spanners = abjad.inspect(leaf).get_spanners(abjad.Tie)
+        for leaf in self._iterate_components(argument, abjad.Leaf):
+            spanners = self._get_spanners(leaf, abjad.Tie)
             total.update(spanners)
             if 1 < len(spanners):
                 for spanner in spanners:
@@ -879,6 +980,7 @@ class WellformednessManager(AbjadObject):
             0 /	1 empty containers
             0 /	0 misdurated measures
             0 /	0 misfilled measures
+            0 /	5 misindexed components
             0 /	0 mismatched enchained hairpins
             0 / 0 mispitched ties
             0 /	4 misrepresented flags
@@ -909,7 +1011,7 @@ class WellformednessManager(AbjadObject):
         """
         import abjad
         violators, total = [], set()
-        for rest in abjad.iterate(argument).leaves(abjad.Rest):
+        for rest in self._iterate_components(argument, abjad.Rest):
             total.add(rest)
             if abjad.inspect(rest).has_spanner(abjad.Tie):
                 violators.append(rest)
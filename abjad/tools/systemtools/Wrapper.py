@@ -1,5 +1,6 @@
 import copy
 import typing
+import weakref
 from abjad.tools.abctools.AbjadValueObject import AbjadValueObject
 from .Tag import Tag
 
@@ -115,8 +116,12 @@ class Wrapper(AbjadValueObject):
         '_spanner',
         '_synthetic_offset',
         '_tag',
+        '__weakref__',
         )
 
+    # tweak managers find components of attached indicators here
+    _indicator_wrappers: typing.MutableMapping = weakref.WeakValueDictionary()
+
     _publish_storage_format = True
 
     ### INITIALIZER ###
@@ -616,11 +621,20 @@ class Wrapper(AbjadValueObject):
 
     ### PRIVATE METHODS ###
 
-    def _bind_correct_effective_context(self, correct_effective_context):
+    def _bind_correct_effective_context(
+        self,
+        correct_effective_context,
+        offsets_are_current=False,
+        ):
         import abjad
         self._unbind_effective_context()
         if correct_effective_context is not None:
             correct_effective_context._dependent_wrappers.append(self)
+            if offsets_are_current:
+                correct_effective_context._add_to_dependent_wrapper_index(
+                    self)
+            else:
+                correct_effective_context._dependent_wrapper_index.clear()
         self._effective_context = correct_effective_context
         self._update_effective_context()
         if isinstance(self.indicator, abjad.MetronomeMark):
@@ -628,12 +642,21 @@ class Wrapper(AbjadValueObject):
 
     def _bind_to_component(self, component):
         import abjad
-        self._warn_duplicate_indicator(component)
+        batch = abjad.BatchAttach._current_batch
+        if batch is not None and isinstance(component, abjad.Component):
+            batch._wrappers.append(self)
+            self._unbind_effective_context()
+        else:
+            batch = None
+            self._warn_duplicate_indicator(component)
         self._unbind_component()
         self._component = component
-        self._update_effective_context()
+        if batch is None:
+            self._update_effective_context()
         if isinstance(self.indicator, abjad.MetronomeMark):
             self._component._update_later(offsets_in_seconds=True)
+        self._update_component_offsets_later()
+        self._update_component_format_later()
         component._wrappers.append(self)
 
     def _detach(self):
@@ -667,6 +690,10 @@ class Wrapper(AbjadValueObject):
             self.component._update_now(indicators=True)
         return self._effective_context
 
+    @staticmethod
+    def _get_indicator_wrapper(indicator):
+        return Wrapper._indicator_wrappers.get(id(indicator))
+
     def _get_format_pieces(self):
         import abjad
         result = []
@@ -755,6 +782,11 @@ class Wrapper(AbjadValueObject):
             if hasattr(component, '_wrappers'):
                 if self in component._wrappers:
                     component._wrappers.remove(self)
+            self._update_component_offsets_later()
+            self._update_component_format_later()
+        key = id(self.indicator)
+        if Wrapper._indicator_wrappers.get(key) is self:
+            del Wrapper._indicator_wrappers[key]
         self._component = None
 
     def _unbind_effective_context(self):
@@ -764,13 +796,34 @@ class Wrapper(AbjadValueObject):
                 effective_context._dependent_wrappers.remove(self)
             except ValueError:
                 pass
+            effective_context._dependent_wrapper_index.clear()
         self._effective_context = None
 
-    def _update_effective_context(self):
+    def _update_component_offsets_later(self):
+        import abjad
+        component = self.component
+        if isinstance(component, abjad.Measure):
+            if isinstance(self.indicator, abjad.TimeSignature):
+                component._update_later(offsets=True)
+                component._update_descendants_later()
+        elif isinstance(component, abjad.Leaf):
+            prototype = (abjad.Multiplier, abjad.NonreducedFraction)
+            if isinstance(self.indicator, prototype):
+                component._update_later(offsets=True)
+
+    def _update_component_format_later(self):
+        import abjad
+        if isinstance(self.component, abjad.Component):
+            self.component._format_later()
+
+    def _update_effective_context(self, offsets_are_current=False):
         current_effective_context = self._effective_context
         correct_effective_context = self._find_correct_effective_context()
         if current_effective_context is not correct_effective_context:
-            self._bind_correct_effective_context(correct_effective_context)
+            self._bind_correct_effective_context(
+                correct_effective_context,
+                offsets_are_current=offsets_are_current,
+                )
 
     def _warn_duplicate_indicator(self, component):
         import abjad
@@ -884,6 +937,7 @@ class Wrapper(AbjadValueObject):
     def deactivate(self, argument):
         assert argument in (True, False, None)
         self._deactivate: typing.Optional[bool] = argument
+        self._update_component_format_later()
 
     @property
     def indicator(self) -> typing.Any:
@@ -953,3 +1007,4 @@ class Wrapper(AbjadValueObject):
             raise Exception(f'string or tag: {argument!r}.')
         tag = Tag(argument)
         self._tag = tag
+        self._update_component_format_later()
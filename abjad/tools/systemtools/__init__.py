@@ -1,4 +1,5 @@
 from .AbjadConfiguration import AbjadConfiguration
+from .BatchAttach import BatchAttach
 from .BenchmarkScoreMaker import BenchmarkScoreMaker
 from .Configuration import Configuration
 from .FilesystemState import FilesystemState
@@ -9,6 +10,9 @@ from .ImportManager import ImportManager
 from .Wrapper import Wrapper
 from .LilyPondFormatBundle import LilyPondFormatBundle
 from .LilyPondFormatManager import LilyPondFormatManager
+from .LilyPondRenderCache import LilyPondRenderCache
+from .LilyPondRenderJob import LilyPondRenderJob
+from .LilyPondRenderPool import LilyPondRenderPool
 from .NullContextManager import NullContextManager
 from .PersistenceManager import PersistenceManager
 from .ProgressIndicator import ProgressIndicator
@@ -0,0 +1,77 @@
+import abjad
+import pytest
+
+
+def test_systemtools_BatchAttach___exit___01():
+    r'''Binds effective contexts on exit.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    with abjad.BatchAttach():
+        abjad.attach(abjad.Clef('bass'), staff[0])
+        abjad.attach(abjad.Clef('alto'), staff[2])
+
+    assert staff._dependent_wrappers == [
+        abjad.inspect(staff[0]).wrapper(abjad.Clef),
+        abjad.inspect(staff[2]).wrapper(abjad.Clef),
+        ]
+    clefs = [abjad.inspect(_).get_effective(abjad.Clef) for _ in staff]
+    assert clefs == [
+        abjad.Clef('bass'),
+        abjad.Clef('bass'),
+        abjad.Clef('alto'),
+        abjad.Clef('alto'),
+        ]
+
+
+def test_systemtools_BatchAttach___exit___02():
+    r'''Checks duplicate indicators against indicators attached earlier in
+    the same batch.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    with pytest.raises(abjad.PersistentIndicatorError):
+        with abjad.BatchAttach():
+            abjad.attach(abjad.Clef('bass'), staff[0])
+            abjad.attach(abjad.Clef('alto'), staff[1])
+            abjad.attach(abjad.Clef('treble'), staff[1])
+            abjad.attach(abjad.Clef('tenor'), staff[2])
+
+    assert abjad.inspect(staff[0]).get_indicators(abjad.Clef) == (
+        abjad.Clef('bass'),
+        )
+    assert abjad.inspect(staff[1]).get_indicators(abjad.Clef) == (
+        abjad.Clef('alto'),
+        )
+    assert not abjad.inspect(staff[2]).get_indicators(abjad.Clef)
+    assert len(staff._dependent_wrappers) == 2
+    assert abjad.inspect(staff).is_well_formed()
+
+
+def test_systemtools_BatchAttach___exit___03():
+    r'''Nested context managers join the outermost context manager.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    with abjad.BatchAttach():
+        with abjad.BatchAttach():
+            abjad.attach(abjad.Clef('bass'), staff[0])
+        assert not staff._dependent_wrappers
+    assert len(staff._dependent_wrappers) == 1
+
+
+def test_systemtools_BatchAttach___exit___04():
+    r'''Ignores indicators detached in body of context manager.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    clef = abjad.Clef('bass')
+    with abjad.BatchAttach():
+        abjad.attach(clef, staff[0])
+        abjad.detach(clef, staff[0])
+        abjad.attach(abjad.Clef('alto'), staff[0])
+
+    assert abjad.inspect(staff[0]).get_indicators(abjad.Clef) == (
+        abjad.Clef('alto'),
+        )
+    assert len(staff._dependent_wrappers) == 1
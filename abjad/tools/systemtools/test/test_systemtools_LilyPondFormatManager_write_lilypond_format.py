@@ -0,0 +1,66 @@
+import abjad
+import io
+
+
+def test_systemtools_LilyPondFormatManager_write_lilypond_format_01():
+    """
+    Writes LilyPond file one line at a time.
+    """
+
+    voice = abjad.Voice("c'8 d'8 e'8 f'8", name='Voice_1')
+    abjad.attach(abjad.Slur(), voice[:])
+    tuplet = abjad.Tuplet((2, 3), "g'8 a'8 b'8")
+    abjad.override(tuplet).tuplet_bracket.color = 'red'
+    voice.append(tuplet)
+    staff = abjad.Staff([voice])
+    lilypond_file = abjad.LilyPondFile.new(staff, includes=['stylesheet.ily'])
+
+    class FilePointer(io.StringIO):
+        writes = 0
+        def write(self, string):
+            self.writes += 1
+            return io.StringIO.write(self, string)
+
+    file_pointer = FilePointer()
+    abjad.LilyPondFormatManager.write_lilypond_format(
+        lilypond_file,
+        file_pointer,
+        )
+
+    string = format(lilypond_file)
+    assert file_pointer.getvalue() == string
+    assert file_pointer.writes == len(string.split('\n'))
+
+
+def test_systemtools_LilyPondFormatManager_write_lilypond_format_02():
+    """
+    Writes scaled measures and cached components.
+    """
+
+    measure = abjad.Measure((3, 12), "c'8 d'8 e'8", implicit_scaling=True)
+    staff = abjad.Staff([measure, abjad.Measure((2, 8), "f'8 g'8")])
+    format(staff[1])
+
+    file_pointer = io.StringIO()
+    abjad.LilyPondFormatManager.write_lilypond_format(staff, file_pointer)
+
+    assert file_pointer.getvalue() == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            {   % measure
+                \time 3/12
+                \scaleDurations #'(2 . 3) {
+                    c'8
+                    d'8
+                    e'8
+                }
+            }   % measure
+            {   % measure
+                \time 2/8
+                f'8
+                g'8
+            }   % measure
+        }
+        """
+        )
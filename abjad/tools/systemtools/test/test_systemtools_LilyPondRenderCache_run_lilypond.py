@@ -0,0 +1,156 @@
+import abjad
+import os
+import pytest
+import stat
+
+
+pytestmark = pytest.mark.skipif(
+    os.name == 'nt',
+    reason='fake LilyPond executable is shell script.',
+    )
+
+
+@pytest.fixture
+def fake_lilypond(monkeypatch, tmpdir):
+    r'''Fake LilyPond writes PDF containing render count to output base and
+    logs render count.
+    '''
+    path = str(tmpdir.join('fake-lilypond'))
+    counter = str(tmpdir.join('counter'))
+    with open(path, 'w') as file_pointer:
+        file_pointer.write('#!/bin/sh\n')
+        file_pointer.write('if [ "$1" = --version ]; then\n')
+        file_pointer.write('    echo "GNU LilyPond 2.19.0"\n')
+        file_pointer.write('    exit 0\n')
+        file_pointer.write('fi\n')
+        file_pointer.write(f'echo x >> {counter}\n')
+        file_pointer.write(f'echo "render $(wc -l < {counter})"\n')
+        file_pointer.write('for last; do true; done\n')
+        file_pointer.write('base="${last%.ly}"\n')
+        file_pointer.write(f'wc -l < {counter} > "$base.pdf"\n')
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    settings = abjad.abjad_configuration._settings
+    monkeypatch.setitem(settings, 'lilypond_path', path)
+    monkeypatch.setitem(settings, 'abjad_output_directory', str(tmpdir))
+    # cache keys read version; monkeypatch restores it after test
+    monkeypatch.setattr(
+        abjad.AbjadConfiguration,
+        '_lilypond_version_string',
+        '2.19.0',
+        )
+    return path
+
+
+def test_systemtools_LilyPondRenderCache_run_lilypond_01(fake_lilypond):
+    r'''Serves byte-identical LilyPond file from cache.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.LilyPondRenderCache(os.path.join(directory, 'cache'))
+        ly_file_path = os.path.join(directory, 'score.ly')
+        pdf_file_path = os.path.join(directory, 'score.pdf')
+        abjad.persist(abjad.Staff("c'4")).as_ly(ly_file_path)
+        assert cache.run_lilypond(ly_file_path)
+        assert (cache.hits, cache.misses) == (0, 1)
+        with open(pdf_file_path) as file_pointer:
+            pdf = file_pointer.read()
+        os.remove(pdf_file_path)
+        assert cache.run_lilypond(ly_file_path)
+        assert (cache.hits, cache.misses) == (1, 1)
+        with open(pdf_file_path) as file_pointer:
+            assert file_pointer.read() == pdf
+        copy_ly_file_path = os.path.join(directory, 'copy.ly')
+        abjad.persist(abjad.Staff("c'4")).as_ly(copy_ly_file_path)
+        assert cache.run_lilypond(copy_ly_file_path)
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert os.path.exists(os.path.join(directory, 'copy.pdf'))
+
+
+def test_systemtools_LilyPondRenderCache_run_lilypond_02(fake_lilypond):
+    r'''Misses when LilyPond file, included file or flags change.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.LilyPondRenderCache(os.path.join(directory, 'cache'))
+        ly_file_path = os.path.join(directory, 'score.ly')
+        stylesheet_path = os.path.join(directory, 'stylesheet.ily')
+        with open(stylesheet_path, 'w') as file_pointer:
+            file_pointer.write('\\layout {}\n')
+        lilypond_file = abjad.LilyPondFile.new(
+            abjad.Staff("c'4"),
+            includes=['stylesheet.ily'],
+            )
+        abjad.persist(lilypond_file).as_ly(ly_file_path)
+        assert cache.run_lilypond(ly_file_path)
+        abjad.persist(abjad.Staff("d'4")).as_ly(ly_file_path)
+        assert cache.run_lilypond(ly_file_path)
+        assert (cache.hits, cache.misses) == (0, 2)
+        abjad.persist(lilypond_file).as_ly(ly_file_path)
+        assert cache.run_lilypond(ly_file_path)
+        assert (cache.hits, cache.misses) == (1, 2)
+        with open(stylesheet_path, 'w') as file_pointer:
+            file_pointer.write('\\layout { indent = 0 }\n')
+        assert cache.run_lilypond(ly_file_path)
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert cache.run_lilypond(ly_file_path, flags='--png')
+        assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_systemtools_LilyPondRenderCache_run_lilypond_03(fake_lilypond):
+    r'''Evicts least recently used entries.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        cache_directory = os.path.join(directory, 'cache')
+        cache = abjad.LilyPondRenderCache(cache_directory)
+        ly_file_paths = []
+        for i, pitch in enumerate("cdef"):
+            ly_file_path = os.path.join(directory, f'score-{i}.ly')
+            abjad.persist(abjad.Staff(f"{pitch}'4")).as_ly(ly_file_path)
+            ly_file_paths.append(ly_file_path)
+        assert cache.run_lilypond(ly_file_paths[0])
+        entry_directory = os.path.join(
+            cache_directory,
+            os.listdir(cache_directory)[0],
+            )
+        size = cache._get_size(entry_directory)
+        cache = abjad.LilyPondRenderCache(
+            cache_directory,
+            maximum_size=2 * size,
+            )
+        for ly_file_path in ly_file_paths[1:]:
+            assert cache.run_lilypond(ly_file_path)
+        assert len(os.listdir(cache_directory)) == 2
+        assert cache.run_lilypond(ly_file_paths[-1])
+        assert cache.run_lilypond(ly_file_paths[0])
+        assert (cache.hits, cache.misses) == (1, 4)
+        cache.clear()
+        assert not os.path.exists(cache_directory)
+        assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_systemtools_LilyPondRenderCache_run_lilypond_04(fake_lilypond):
+    r'''Restores LilyPond log on cache hit and caches only files LilyPond
+    is expected to output.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.LilyPondRenderCache(os.path.join(directory, 'cache'))
+        ly_file_path = os.path.join(directory, 'score.ly')
+        with open(os.path.join(directory, 'score.midi'), 'w'):
+            pass
+        abjad.persist(abjad.Staff("c'4")).as_ly(ly_file_path)
+        log_file_path = abjad.abjad_configuration.lilypond_log_file_path
+        assert cache.run_lilypond(ly_file_path)
+        with open(log_file_path) as file_pointer:
+            log = file_pointer.read()
+        assert 'render 1' in log
+        os.remove(log_file_path)
+        copy_ly_file_path = os.path.join(directory, 'copy.ly')
+        abjad.persist(abjad.Staff("c'4")).as_ly(copy_ly_file_path)
+        assert cache.run_lilypond(copy_ly_file_path)
+        assert (cache.hits, cache.misses) == (1, 1)
+        with open(log_file_path) as file_pointer:
+            assert file_pointer.read() == log
+        assert os.path.exists(os.path.join(directory, 'copy.pdf'))
+        assert not os.path.exists(os.path.join(directory, 'copy.midi'))
@@ -0,0 +1,134 @@
+import abjad
+import os
+import pytest
+import stat
+
+
+pytestmark = pytest.mark.skipif(
+    os.name == 'nt',
+    reason='fake LilyPond executable is shell script.',
+    )
+
+
+_touch_pdf = 'for ly in "$@"; do :; done; touch "${ly%.ly}.pdf"'
+
+
+def _make_fake_lilypond(directory, body):
+    path = os.path.join(directory, 'fake-lilypond')
+    with open(path, 'w') as file_pointer:
+        file_pointer.write('#!/bin/sh\n')
+        file_pointer.write(body + '\n')
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+def _make_ly_files(directory, count):
+    ly_file_paths = []
+    for i in range(count):
+        ly_file_path = os.path.join(directory, f'part-{i}.ly')
+        abjad.persist(abjad.Staff("c'4")).as_ly(ly_file_path)
+        ly_file_paths.append(ly_file_path)
+    return ly_file_paths
+
+
+def test_systemtools_LilyPondRenderPool___call___01():
+    r'''Renders each file and writes one log per job.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        lilypond_path = _make_fake_lilypond(directory, 'echo "rendering $@"')
+        ly_file_paths = _make_ly_files(directory, 4)
+        pool = abjad.LilyPondRenderPool(
+            lilypond_path=lilypond_path,
+            processes=2,
+            )
+        jobs = pool(ly_file_paths)
+        assert [_.ly_file_path for _ in jobs] == ly_file_paths
+        assert [_.status for _ in jobs] == 4 * ['rendered']
+        assert all(_.exit_code == 0 for _ in jobs)
+        for job in jobs:
+            with open(job.log_file_path) as file_pointer:
+                log = file_pointer.read()
+            assert job.ly_file_path in log
+            assert os.path.exists(job.digest_file_path)
+
+
+def test_systemtools_LilyPondRenderPool___call___02():
+    r'''Skips files unchanged since last successful render.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        lilypond_path = _make_fake_lilypond(directory, _touch_pdf)
+        ly_file_paths = _make_ly_files(directory, 3)
+        pool = abjad.LilyPondRenderPool(lilypond_path=lilypond_path)
+        jobs = pool(ly_file_paths)
+        assert [_.status for _ in jobs] == 3 * ['rendered']
+        abjad.persist(abjad.Staff("d'4")).as_ly(ly_file_paths[1])
+        jobs = pool(ly_file_paths)
+        assert [_.status for _ in jobs] == ['skipped', 'rendered', 'skipped']
+        assert all(_.success for _ in jobs)
+        pool = abjad.LilyPondRenderPool(
+            lilypond_path=lilypond_path,
+            skip_unchanged=False,
+            )
+        jobs = pool(ly_file_paths)
+        assert [_.status for _ in jobs] == 3 * ['rendered']
+
+
+def test_systemtools_LilyPondRenderPool___call___03():
+    r'''Collects exit codes of failed jobs and does not skip them next time.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        lilypond_path = _make_fake_lilypond(directory, 'exit 1')
+        ly_file_paths = _make_ly_files(directory, 2)
+        pool = abjad.LilyPondRenderPool(lilypond_path=lilypond_path)
+        jobs = pool(ly_file_paths)
+        assert [_.status for _ in jobs] == ['failed', 'failed']
+        assert [_.exit_code for _ in jobs] == [1, 1]
+        assert not any(_.success for _ in jobs)
+        jobs = pool(ly_file_paths)
+        assert [_.status for _ in jobs] == ['failed', 'failed']
+
+
+def test_systemtools_LilyPondRenderPool___call___04():
+    r'''Kills jobs that time out.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        lilypond_path = _make_fake_lilypond(directory, 'exec sleep 10')
+        ly_file_paths = _make_ly_files(directory, 2)
+        pool = abjad.LilyPondRenderPool(
+            lilypond_path=lilypond_path,
+            timeout=0.5,
+            )
+        jobs = pool(ly_file_paths)
+        assert [_.status for _ in jobs] == ['timed out', 'timed out']
+        assert [_.exit_code for _ in jobs] == [None, None]
+        for job in jobs:
+            assert job.elapsed_time < 10
+            with open(job.log_file_path) as file_pointer:
+                assert 'timed out' in file_pointer.read()
+
+
+def test_systemtools_LilyPondRenderPool___call___05():
+    r'''Renders unchanged files again when output is missing or older than
+    last successful render.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        lilypond_path = _make_fake_lilypond(directory, _touch_pdf)
+        ly_file_paths = _make_ly_files(directory, 2)
+        pdf_file_paths = [_[:-3] + '.pdf' for _ in ly_file_paths]
+        pool = abjad.LilyPondRenderPool(lilypond_path=lilypond_path)
+        jobs = pool(ly_file_paths)
+        assert [_.status for _ in jobs] == 2 * ['rendered']
+        assert all(os.path.exists(_) for _ in pdf_file_paths)
+        os.remove(pdf_file_paths[0])
+        jobs = pool(ly_file_paths)
+        assert [_.status for _ in jobs] == ['rendered', 'skipped']
+        assert os.path.exists(pdf_file_paths[0])
+        digest_time = os.path.getmtime(jobs[1].digest_file_path)
+        os.utime(pdf_file_paths[1], (digest_time - 60, digest_time - 60))
+        jobs = pool(ly_file_paths)
+        assert [_.status for _ in jobs] == ['skipped', 'rendered']
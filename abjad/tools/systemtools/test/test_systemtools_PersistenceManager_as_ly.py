@@ -1,5 +1,6 @@
 import abjad
 import os
+import pytest
 configuration = abjad.AbjadConfiguration()
 ly_path = os.path.join(
     configuration.abjad_directory, 
@@ -31,3 +32,48 @@ def test_systemtools_PersistenceManager_as_ly_02():
         assert os.path.isfile(ly_path)
         abjad.persist(note).as_ly(ly_path)
         assert os.path.isfile(ly_path)
+
+
+def test_systemtools_PersistenceManager_as_ly_03():
+    """
+    Agent abjad.persists LilyPond file with tags aligned line by line.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.Clef('alto'), staff[0], tag='RED')
+    abjad.attach(abjad.Articulation('accent'), staff[1], tag='BLUE')
+    lilypond_file = abjad.LilyPondFile.new(staff)
+    string = abjad.LilyPondFormatManager.align_tags(format(lilypond_file), 40)
+    with abjad.FilesystemState(remove=[ly_path]):
+        abjad.persist(lilypond_file).as_ly(ly_path, strict=40)
+        with open(ly_path) as file_pointer:
+            assert file_pointer.read() == string
+
+
+def test_systemtools_PersistenceManager_as_ly_04(monkeypatch):
+    """
+    Agent abjad.persists nothing when formatting fails: existing LilyPond file
+    is left untouched and no temporary file remains.
+    """
+
+    def write_lilypond_format(argument, file_pointer, strict=None):
+        file_pointer.write('partial')
+        raise ValueError
+
+    note = abjad.Note("c'4")
+    directory = os.path.dirname(ly_path)
+    with abjad.FilesystemState(remove=[ly_path]):
+        abjad.persist(note).as_ly(ly_path)
+        with open(ly_path) as file_pointer:
+            string = file_pointer.read()
+        file_names = sorted(os.listdir(directory))
+        monkeypatch.setattr(
+            abjad.LilyPondFormatManager,
+            'write_lilypond_format',
+            write_lilypond_format,
+            )
+        with pytest.raises(ValueError):
+            abjad.persist(abjad.Note("d'4")).as_ly(ly_path)
+        with open(ly_path) as file_pointer:
+            assert file_pointer.read() == string
+        assert sorted(os.listdir(directory)) == file_names
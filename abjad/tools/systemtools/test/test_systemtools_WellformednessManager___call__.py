@@ -0,0 +1,46 @@
+import abjad
+
+
+def test_systemtools_WellformednessManager___call___01():
+    """
+    Calling manager finds same violators as calling checks one by one.
+    """
+
+    staff = abjad.Staff("c'8 <d fs>8 e'8 f'8 g''''8 a8 b8 c''8")
+    abjad.attach(abjad.Violin(), staff[0])
+    abjad.attach(abjad.Clef('bass'), staff[4])
+    abjad.attach(abjad.ClarinetInBFlat(), staff[5])
+    abjad.attach('sounding pitch', staff[6])
+    abjad.attach(abjad.Beam(), staff[:3])
+    abjad.attach(abjad.Beam(), staff[2:4])
+    abjad.attach(abjad.Hairpin('p < f'), staff[5:])
+    manager = abjad.WellformednessManager()
+
+    triples = manager(staff)
+
+    assert manager._walk is None
+    assert len(triples) == 21
+    for violators, total, check_name in triples:
+        check = getattr(manager, check_name)
+        assert (violators, total) == check(staff)
+
+
+def test_systemtools_WellformednessManager___call___02():
+    """
+    Transposes written pitches by effective instrument.
+    """
+
+    staff = abjad.Staff("c'4 d4 d'4 g4")
+    abjad.attach(abjad.ClarinetInBFlat(), staff[0])
+    abjad.attach(abjad.Violin(), staff[2])
+    abjad.attach('sounding pitch', staff[3])
+    abjad.attach('unpitched', staff[1])
+    manager = abjad.WellformednessManager()
+
+    violators, total = manager.check_out_of_range_notes(staff)
+    assert violators == []
+    assert total == 4
+
+    triples = manager(staff)
+    triple = [_ for _ in triples if _[2] == 'check_out_of_range_notes'][0]
+    assert triple == ([], 4, 'check_out_of_range_notes')
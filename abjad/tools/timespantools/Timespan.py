@@ -742,7 +742,8 @@ class Timespan(AbjadValueObject):
 
     def _initialize_offset(self, offset):
         import abjad
-        if offset in (NegativeInfinity, Infinity):
+        # negative infinity subclasses infinity
+        if isinstance(offset, abjad.mathtools.Infinity):
             return offset
         return abjad.Offset(offset)
 
@@ -1,4 +1,6 @@
+import bisect
 import collections
+import operator
 from abjad.enumerations import Left, Right
 from abjad.tools import markuptools
 from abjad.tools.datastructuretools.TypedList import TypedList
@@ -121,7 +123,27 @@ class TimespanList(TypedList):
 
     __documentation_section__ = 'Timespans'
 
-    __slots__ = ()
+    __slots__ = (
+        '_index',
+        )
+
+    _comparison_operators = {
+        '<': (operator.lt, '>'),
+        '<=': (operator.le, '>='),
+        '==': (operator.eq, '=='),
+        }
+
+    ### INITIALIZER ###
+
+    def __init__(self, items=None, item_class=None, keep_sorted=False):
+        # index is emptied in place so shallow copies never keep stale index
+        self._index = {}
+        TypedList.__init__(
+            self,
+            items=items,
+            item_class=item_class,
+            keep_sorted=keep_sorted,
+            )
 
     ### SPECIAL METHODS ###
 
@@ -372,6 +394,94 @@ class TimespanList(TypedList):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _build_index_tree(stops, maxima, minima, node, start, stop):
+        if stop - start == 1:
+            maxima[node] = minima[node] = stops[start]
+            return
+        middle = (start + stop) // 2
+        TimespanList._build_index_tree(
+            stops, maxima, minima, 2 * node, start, middle)
+        TimespanList._build_index_tree(
+            stops, maxima, minima, 2 * node + 1, middle, stop)
+        maxima[node] = max(maxima[2 * node], maxima[2 * node + 1])
+        minima[node] = min(minima[2 * node], minima[2 * node + 1])
+
+    def _clear_index(self):
+        index = getattr(self, '_index', None)
+        if index is None:
+            self._index = {}
+        else:
+            index.clear()
+
+    @classmethod
+    def _get_conjunctions(class_, inequality, constants, variables):
+        import abjad
+        if isinstance(inequality, abjad.timespantools.CompoundInequality):
+            logical_operator = inequality.logical_operator
+            if logical_operator == 'and':
+                conjunctions = [[]]
+            elif logical_operator == 'or':
+                conjunctions = []
+            else:
+                return None
+            for element in inequality:
+                element_conjunctions = class_._get_conjunctions(
+                    element,
+                    constants,
+                    variables,
+                    )
+                if element_conjunctions is None:
+                    return None
+                if logical_operator == 'and':
+                    conjunctions = [
+                        x + y
+                        for x in conjunctions
+                        for y in element_conjunctions
+                        ]
+                else:
+                    conjunctions.extend(element_conjunctions)
+            return conjunctions
+        left, symbol, right = inequality.template.split()
+        function, reflected_symbol = class_._comparison_operators[symbol]
+        if left in constants and right in constants:
+            if function(constants[left], constants[right]):
+                return [[]]
+            return []
+        if left in variables and right in constants:
+            return [[(variables[left], symbol, constants[right])]]
+        if left in constants and right in variables:
+            return [[(variables[right], reflected_symbol, constants[left])]]
+        return None
+
+    def _get_index(self):
+        import abjad
+        index = getattr(self, '_index', None)
+        if index is None:
+            index = self._index = {}
+        if index:
+            if index['positions'] is None:
+                return None
+            return index
+        timespans = self._collection
+        if not all(isinstance(_, abjad.Timespan) for _ in timespans):
+            index['positions'] = None
+            return None
+        # positions sorted by start offset; tree nodes keep stop extrema
+        positions = sorted(
+            range(len(timespans)),
+            key=lambda _: timespans[_].start_offset,
+            )
+        stops = [timespans[_].stop_offset for _ in positions]
+        maxima, minima = [None] * 4 * len(stops), [None] * 4 * len(stops)
+        if stops:
+            self._build_index_tree(stops, maxima, minima, 1, 0, len(stops))
+        index['maxima'] = maxima
+        index['minima'] = minima
+        index['positions'] = positions
+        index['starts'] = [timespans[_].start_offset for _ in positions]
+        return index
+
     def _get_offsets(self, argument):
         try:
             return argument.start_offset, argument.stop_offset
@@ -388,6 +498,74 @@ class TimespanList(TypedList):
         start_offset, stop_offset = self._get_offsets(argument)
         return abjad.Timespan(start_offset, stop_offset)
 
+    def _get_positions_that_satisfy_time_relation(self, time_relation):
+        all_bounds = self._get_time_relation_bounds(time_relation)
+        if all_bounds is None:
+            return None
+        if not self:
+            return []
+        index = self._get_index()
+        if index is None:
+            return None
+        positions = set()
+        for bounds in all_bounds:
+            positions.update(self._query_index(index, bounds))
+        return sorted(positions)
+
+    @classmethod
+    def _get_time_relation_bounds(class_, time_relation):
+        import abjad
+        if isinstance(
+            time_relation,
+            abjad.timespantools.TimespanTimespanTimeRelation):
+            timespan = time_relation.timespan_1
+            if not isinstance(timespan, abjad.Timespan):
+                return None
+            constants = {
+                'timespan_1.start_offset': timespan.start_offset,
+                'timespan_1.stop_offset': timespan.stop_offset,
+                }
+            variables = {
+                'timespan_2.start_offset': 0,
+                'timespan_2.stop_offset': 1,
+                }
+        elif isinstance(
+            time_relation,
+            abjad.timespantools.OffsetTimespanTimeRelation):
+            if time_relation.offset is None:
+                return None
+            constants = {'offset': abjad.Offset(time_relation.offset)}
+            variables = {'timespan.start': 0, 'timespan.stop': 1}
+        else:
+            return None
+        conjunctions = class_._get_conjunctions(
+            time_relation.inequality,
+            constants,
+            variables,
+            )
+        if conjunctions is None:
+            return None
+        all_bounds = []
+        for conjunction in conjunctions:
+            bounds = [[None, None], [None, None]]
+            for variable, symbol, offset in conjunction:
+                lower, upper = bounds[variable]
+                if symbol in ('>', '>=', '=='):
+                    is_closed = symbol != '>'
+                    if lower is None or lower[0] < offset:
+                        lower = (offset, is_closed)
+                    elif lower[0] == offset:
+                        lower = (offset, lower[1] and is_closed)
+                if symbol in ('<', '<=', '=='):
+                    is_closed = symbol != '<'
+                    if upper is None or offset < upper[0]:
+                        upper = (offset, is_closed)
+                    elif upper[0] == offset:
+                        upper = (offset, upper[1] and is_closed)
+                bounds[variable] = [lower, upper]
+            all_bounds.append(bounds)
+        return all_bounds
+
     @staticmethod
     def _make_timespan_list_markup(
         timespans,
@@ -460,6 +638,57 @@ class TimespanList(TypedList):
         markup = abjad.Markup.column([fraction_markup, lines_markup])
         return markup
 
+    def _on_insertion(self, item):
+        self._clear_index()
+
+    def _on_removal(self, item):
+        self._clear_index()
+
+    @staticmethod
+    def _query_index(index, bounds):
+        (start_lower, start_upper), (stop_lower, stop_upper) = bounds
+        starts = index['starts']
+        i, j = 0, len(starts)
+        if start_lower is not None:
+            if start_lower[1]:
+                i = bisect.bisect_left(starts, start_lower[0])
+            else:
+                i = bisect.bisect_right(starts, start_lower[0])
+        if start_upper is not None:
+            if start_upper[1]:
+                j = bisect.bisect_right(starts, start_upper[0])
+            else:
+                j = bisect.bisect_left(starts, start_upper[0])
+        positions = index['positions']
+        if j <= i:
+            return []
+        if stop_lower is None and stop_upper is None:
+            return positions[i:j]
+        maxima, minima = index['maxima'], index['minima']
+        result = []
+        stack = [(1, 0, len(starts))]
+        while stack:
+            node, start, stop = stack.pop()
+            if stop <= i or j <= start:
+                continue
+            if stop_lower is not None:
+                maximum = maxima[node]
+                if (maximum < stop_lower[0] or
+                    (maximum == stop_lower[0] and not stop_lower[1])):
+                    continue
+            if stop_upper is not None:
+                minimum = minima[node]
+                if (stop_upper[0] < minimum or
+                    (minimum == stop_upper[0] and not stop_upper[1])):
+                    continue
+            if stop - start == 1:
+                result.append(positions[start])
+                continue
+            middle = (start + stop) // 2
+            stack.append((2 * node + 1, middle, stop))
+            stack.append((2 * node, start, middle))
+        return result
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1158,16 +1387,26 @@ class TimespanList(TypedList):
 
         Operates in place and returns timespan list.
         """
+        import abjad
         if 1 < len(self):
-            result = self[0]
+            start_offset, stop_offset = self[0].offsets
             for timespan in self:
-                if not timespan.intersects_timespan(result):
+                if not (
+                    (timespan.start_offset <= start_offset and
+                        start_offset < timespan.stop_offset) or
+                    (start_offset <= timespan.start_offset and
+                        timespan.start_offset < stop_offset)
+                    ):
                     self[:] = []
                     return self
-                else:
-                    timespans = result & timespan
-                    result = timespans[0]
-            self[:] = [result]
+                start_offset = max(start_offset, timespan.start_offset)
+                stop_offset = min(stop_offset, timespan.stop_offset)
+            timespan = abjad.new(
+                self[0],
+                start_offset=start_offset,
+                stop_offset=stop_offset,
+                )
+            self[:] = [timespan]
         return self
 
     def compute_logical_or(self):
@@ -1280,17 +1519,52 @@ class TimespanList(TypedList):
                     ]
                 )
 
+        ..  container:: example
+
+            Computes logical OR of unsorted timespans:
+
+            >>> timespans = abjad.TimespanList([
+            ...     abjad.Timespan(0, 5),
+            ...     abjad.Timespan(10, 15),
+            ...     abjad.Timespan(3, 12),
+            ...     ])
+            >>> _ = timespans.compute_logical_or()
+
+            >>> abjad.f(timespans)
+            abjad.TimespanList(
+                [
+                    abjad.Timespan(
+                        start_offset=abjad.Offset(0, 1),
+                        stop_offset=abjad.Offset(15, 1),
+                        ),
+                    ]
+                )
+
         Operates in place and returns timespan list.
         """
+        import abjad
         timespans = []
-        if self:
-            timespans = [self[0]]
-            for timespan in self[1:]:
-                if timespans[-1]._can_fuse(timespan):
-                    timespans_ = timespans[-1] | timespan
-                    timespans[-1:] = timespans_[:]
-                else:
-                    timespans.append(timespan)
+        groups = []
+        for timespan in sorted(self, key=lambda _: _.offsets):
+            if groups:
+                first, start_offset, stop_offset, count = groups[-1]
+                if (isinstance(timespan, type(first)) and
+                    timespan.start_offset <= stop_offset):
+                    stop_offset = max(stop_offset, timespan.stop_offset)
+                    groups[-1] = (first, start_offset, stop_offset, count + 1)
+                    continue
+            groups.append((timespan, timespan.start_offset,
+                timespan.stop_offset, 1))
+        for first, start_offset, stop_offset, count in groups:
+            if count == 1:
+                timespans.append(first)
+                continue
+            timespan = abjad.new(
+                first,
+                start_offset=start_offset,
+                stop_offset=stop_offset,
+                )
+            timespans.append(timespan)
         self[:] = timespans
         return self
 
@@ -1467,24 +1741,51 @@ class TimespanList(TypedList):
 
         Operates in place and returns timespan list.
         """
-        all_fragments = []
-        for i, timespan_1 in enumerate(self):
-            timespan_1_fragments = [timespan_1]
-            for j, timespan_2 in enumerate(self):
-                if i == j:
-                    continue
-                revised_timespan_1_fragments = []
-                for timespan_1_fragment in timespan_1_fragments:
-                    if timespan_2.intersects_timespan(timespan_1_fragment):
-                        result = timespan_1_fragment - timespan_2
-                        revised_timespan_1_fragments.extend(result)
-                    else:
-                        revised_timespan_1_fragments.append(
-                            timespan_1_fragment)
-                timespan_1_fragments = revised_timespan_1_fragments
-            all_fragments.extend(timespan_1_fragments)
-        self[:] = all_fragments
-        self.sort()
+        import abjad
+        timespans = self[:]
+        # maps offset to starting, stopping and zero-duration timespans;
+        # zero-duration timespans split fragments but cover nothing
+        events = {}
+        for i, timespan in enumerate(timespans):
+            start_offset, stop_offset = timespan.offsets
+            if start_offset == stop_offset:
+                events.setdefault(start_offset, ([], [], []))[2].append(i)
+            else:
+                events.setdefault(start_offset, ([], [], []))[0].append(i)
+                events.setdefault(stop_offset, ([], [], []))[1].append(i)
+        offsets = sorted(events)
+        active = set()
+        fragments = []
+        fragment = None
+        for offset, next_offset in zip(offsets, offsets[1:] + [None]):
+            starts, stops, points = events[offset]
+            active.difference_update(stops)
+            active.update(starts)
+            if not active:
+                for i in points:
+                    fragments.append([i, offset, offset])
+            if len(active) != 1:
+                continue
+            i = next(iter(active))
+            if (fragment is not None and
+                fragment[0] == i and
+                fragment[2] == offset and
+                not points):
+                fragment[2] = next_offset
+                continue
+            fragment = [i, offset, next_offset]
+            fragments.append(fragment)
+        result = []
+        for i, start_offset, stop_offset in fragments:
+            timespan = timespans[i]
+            if timespan.offsets != (start_offset, stop_offset):
+                timespan = abjad.new(
+                    timespan,
+                    start_offset=start_offset,
+                    stop_offset=stop_offset,
+                    )
+            result.append(timespan)
+        self[:] = result
         return self
 
     def compute_overlap_factor(self, timespan=None):
@@ -1996,29 +2297,51 @@ class TimespanList(TypedList):
         assert isinstance(inventory_count, (type(None), int))
         if isinstance(inventory_count, int):
             assert 0 < inventory_count
-        bounding_timespan = self.timespan
+        import abjad
         global_overlap_factors = []
         empty_timespans_pairs = []
         result_timespan_lists = []
+        # offset pairs of each result list that may overlap later timespans
+        result_offset_pairs = []
+        start_offsets = [_.start_offset for _ in self]
+        is_sorted = all(
+            x <= y for x, y in zip(start_offsets, start_offsets[1:]))
+        if self:
+            bounding_duration = \
+                max(_.stop_offset for _ in self) - min(start_offsets)
         if inventory_count is not None:
             for i in range(inventory_count):
                 global_overlap_factors.append(0)
-                result_timespans = type(self)([])
+                result_timespans = []
                 empty_timespans_pairs.append((i, result_timespans))
                 result_timespan_lists.append(result_timespans)
+                result_offset_pairs.append([])
         for current_timespan in self:
             current_overlap_factor = \
-                current_timespan.duration / bounding_timespan.duration
+                current_timespan.duration / bounding_duration
+            start_offset, stop_offset = current_timespan.offsets
             if empty_timespans_pairs:
                 i, empty_timespans = empty_timespans_pairs.pop()
                 empty_timespans.append(current_timespan)
+                result_offset_pairs[i].append((start_offset, stop_offset))
                 global_overlap_factors[i] = current_overlap_factor
                 continue
             nonoverlapping_timespan_lists = []
             overlapping_timespan_lists = []
-            for i, result_timespans in enumerate(result_timespan_lists):
-                local_overlap_factor = result_timespans.compute_overlap_factor(
-                    current_timespan)
+            for i, offset_pairs in enumerate(result_offset_pairs):
+                if is_sorted:
+                    offset_pairs[:] = [
+                        _ for _ in offset_pairs if start_offset < _[1]]
+                local_overlap_factor = 0
+                if offset_pairs:
+                    overlaps = [
+                        min(stop_offset, _[1]) - max(start_offset, _[0])
+                        for _ in offset_pairs
+                        ]
+                    total_overlap = abjad.Duration(
+                        sum(_ for _ in overlaps if 0 < _))
+                    local_overlap_factor = \
+                        total_overlap / current_timespan.duration
                 global_overlap_factor = global_overlap_factors[i]
                 if not local_overlap_factor:
                     nonoverlapping_timespan_lists.append(
@@ -2029,9 +2352,10 @@ class TimespanList(TypedList):
             nonoverlapping_timespan_lists.sort(key=lambda x: x[1])
             overlapping_timespan_lists.sort(key=lambda x: (x[1], x[2]))
             if not nonoverlapping_timespan_lists and inventory_count is None:
-                result_timespans = type(self)([current_timespan])
+                result_timespans = [current_timespan]
                 global_overlap_factors.append(current_overlap_factor)
                 result_timespan_lists.append(result_timespans)
+                result_offset_pairs.append([(start_offset, stop_offset)])
                 continue
             if nonoverlapping_timespan_lists:
                 i = nonoverlapping_timespan_lists[0][0]
@@ -2039,8 +2363,9 @@ class TimespanList(TypedList):
                 i = overlapping_timespan_lists[0][0]
             result_timespans = result_timespan_lists[i]
             result_timespans.append(current_timespan)
+            result_offset_pairs[i].append((start_offset, stop_offset))
             global_overlap_factors[i] += current_overlap_factor
-        return tuple(result_timespan_lists)
+        return tuple(type(self)(_) for _ in result_timespan_lists)
 
     def get_timespan_that_satisfies_time_relation(self, time_relation):
         """
@@ -2127,6 +2452,10 @@ class TimespanList(TypedList):
         Returns new timespan list.
         """
         from abjad.tools import timespantools
+        positions = self._get_positions_that_satisfy_time_relation(
+            time_relation)
+        if positions is not None:
+            return type(self)([self[_] for _ in positions])
         result = []
         for timespan in self:
             if isinstance(
@@ -2355,8 +2684,8 @@ class TimespanList(TypedList):
         if not self:
             return []
         timespan_lists = []
-        timespans = sorted(self[:])
-        current_list = type(self)([timespans[0]])
+        timespans = sorted(self, key=lambda _: _.offsets)
+        current_list = [timespans[0]]
         latest_stop_offset = current_list[0].stop_offset
         for current_timespan in timespans[1:]:
             if current_timespan.start_offset < latest_stop_offset:
@@ -2366,12 +2695,58 @@ class TimespanList(TypedList):
                 current_list.append(current_timespan)
             else:
                 timespan_lists.append(current_list)
-                current_list = type(self)([current_timespan])
+                current_list = [current_timespan]
             if latest_stop_offset < current_timespan.stop_offset:
                 latest_stop_offset = current_timespan.stop_offset
         if current_list:
             timespan_lists.append(current_list)
-        return tuple(timespan_lists)
+        return tuple(type(self)(_) for _ in timespan_lists)
+
+    def query_many(self, offsets):
+        """
+        Gets timespans that contain each offset in ``offsets``.
+
+        ..  container:: example
+
+            >>> timespans = abjad.TimespanList([
+            ...     abjad.Timespan(0, 3),
+            ...     abjad.Timespan(2, 6),
+            ...     abjad.Timespan(6, 10),
+            ...     ])
+
+            >>> for timespan_list in timespans.query_many([1, 2, 6, 10]):
+            ...     [_.offsets for _ in timespan_list]
+            ...
+            [(Offset(0, 1), Offset(3, 1))]
+            [(Offset(0, 1), Offset(3, 1)), (Offset(2, 1), Offset(6, 1))]
+            [(Offset(6, 1), Offset(10, 1))]
+            []
+
+        Timespan contains offset when offset happens during timespan.
+
+        Answers all queries from one start-sorted index of timespan list.
+
+        Returns list of timespan lists.
+        """
+        import abjad
+        result = []
+        offsets = [abjad.Offset(_) for _ in offsets]
+        index = None
+        if self:
+            index = self._get_index()
+        for offset in offsets:
+            if index is None:
+                time_relation = \
+                    abjad.timespantools.offset_happens_during_timespan(
+                        offset=offset)
+                timespans = self.get_timespans_that_satisfy_time_relation(
+                    time_relation)
+                result.append(timespans)
+                continue
+            bounds = [[None, (offset, True)], [(offset, False), None]]
+            positions = sorted(self._query_index(index, bounds))
+            result.append(type(self)([self[_] for _ in positions]))
+        return result
 
     def reflect(self, axis=None):
         """
@@ -2553,6 +2928,15 @@ class TimespanList(TypedList):
                 self[-1] = self[-1].set_offsets(stop_offset=stop_offset)
         return self
 
+    def reverse(self):
+        """
+        Reverses timespans in timespan list.
+
+        Returns none.
+        """
+        self._clear_index()
+        TypedList.reverse(self)
+
     def rotate(self, count):
         """
         Rotates by ``count`` contiguous timespans.
@@ -2876,6 +3260,15 @@ class TimespanList(TypedList):
         self[:] = timespans
         return self
 
+    def sort(self, cmp=None, key=None, reverse=False):
+        """
+        Sorts timespans in timespan list.
+
+        Returns none.
+        """
+        self._clear_index()
+        TypedList.sort(self, cmp=cmp, key=key, reverse=reverse)
+
     def split_at_offset(self, offset):
         """
         Splits timespans at ``offset``.
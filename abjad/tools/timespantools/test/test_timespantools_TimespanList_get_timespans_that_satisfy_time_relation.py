@@ -0,0 +1,170 @@
+import abjad
+import copy
+
+
+def _check(timespans):
+    """
+    Checks indexed queries against linear scan.
+    """
+    timespantools = abjad.timespantools
+    functions = (
+        timespantools.timespan_2_intersects_timespan_1,
+        timespantools.timespan_2_starts_during_timespan_1,
+        timespantools.timespan_2_stops_when_timespan_1_starts,
+        )
+    for timespan_1 in (
+        abjad.Timespan(0, 5),
+        abjad.Timespan(3, 8),
+        abjad.Timespan(10, 12),
+        ):
+        for function in functions:
+            time_relation = function(timespan_1=timespan_1)
+            result = timespans.get_timespans_that_satisfy_time_relation(
+                time_relation)
+            assert list(result) == [
+                _ for _ in timespans if time_relation(timespan_2=_)
+                ]
+    offsets = (0, 4, 9)
+    results = timespans.query_many(offsets)
+    for offset, result in zip(offsets, results):
+        time_relation = timespantools.offset_happens_during_timespan(
+            offset=offset)
+        expected = [_ for _ in timespans if time_relation(timespan=_)]
+        assert list(result) == expected
+        result = timespans.get_timespans_that_satisfy_time_relation(
+            time_relation)
+        assert list(result) == expected
+
+
+def test_timespantools_TimespanList_get_timespans_that_satisfy_time_relation_01():
+    """
+    Rebuilds index after timespan list changes.
+    """
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, 3),
+        abjad.Timespan(2, 6),
+        abjad.Timespan(6, 10),
+        ])
+    _check(timespans)
+
+    timespans.append(abjad.Timespan(4, 9))
+    _check(timespans)
+
+    timespans.extend([abjad.Timespan(-2, 1), abjad.Timespan(8, 11)])
+    _check(timespans)
+
+    timespans.insert(0, abjad.Timespan(5, 5))
+    _check(timespans)
+
+    del timespans[2]
+    _check(timespans)
+
+    del timespans[1:3]
+    _check(timespans)
+
+    timespans[0] = abjad.Timespan(1, 12)
+    _check(timespans)
+
+    timespans[1:2] = [abjad.Timespan(3, 4), abjad.Timespan(7, 8)]
+    _check(timespans)
+
+    timespans.remove(abjad.Timespan(3, 4))
+    _check(timespans)
+
+    timespans.pop()
+    _check(timespans)
+
+    timespans.sort()
+    _check(timespans)
+
+    timespans.reverse()
+    _check(timespans)
+
+    timespans.sort(key=lambda _: _.stop_offset, reverse=True)
+    _check(timespans)
+
+    timespans[:] = []
+    _check(timespans)
+
+    timespans.append(abjad.Timespan(0, 4))
+    _check(timespans)
+
+
+def test_timespantools_TimespanList_get_timespans_that_satisfy_time_relation_02():
+    """
+    Rebuilds index of sorted timespan list after insertion.
+    """
+
+    timespans = abjad.TimespanList(
+        [abjad.Timespan(6, 10), abjad.Timespan(0, 3)],
+        keep_sorted=True,
+        )
+    _check(timespans)
+
+    timespans.append(abjad.Timespan(2, 6))
+    assert timespans[1] == abjad.Timespan(2, 6)
+    _check(timespans)
+
+    timespans.extend([abjad.Timespan(4, 9), abjad.Timespan(-1, 0)])
+    _check(timespans)
+
+    del timespans[0]
+    _check(timespans)
+
+
+def test_timespantools_TimespanList_get_timespans_that_satisfy_time_relation_03():
+    """
+    Shallow copy shares contents and index with copied list.
+    """
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, 3),
+        abjad.Timespan(2, 6),
+        ])
+    _check(timespans)
+    copied_timespans = copy.copy(timespans)
+    copied_timespans.append(abjad.Timespan(4, 9))
+    _check(copied_timespans)
+    _check(timespans)
+
+
+def test_timespantools_TimespanList_get_timespans_that_satisfy_time_relation_04():
+    """
+    Scans timespan list linearly when list holds items other than
+    timespans.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    timespans = abjad.TimespanList(list(staff))
+    time_relation = abjad.timespantools.timespan_2_intersects_timespan_1(
+        timespan_1=abjad.Timespan(0, (1, 2)))
+    result = timespans.get_timespans_that_satisfy_time_relation(
+        time_relation)
+
+    assert list(result) == staff[:2]
+    assert timespans._get_index() is None
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, (1, 4)),
+        abjad.Timespan((1, 4), (3, 4)),
+        ])
+    result = timespans.get_timespans_that_satisfy_time_relation(
+        time_relation)
+    assert len(result) == 2
+    assert timespans._get_index() is not None
+
+    timespans.append(staff[2])
+    result = timespans.get_timespans_that_satisfy_time_relation(
+        time_relation)
+    assert len(result) == 2
+    assert timespans._get_index() is None
+
+    timespans.remove(staff[2])
+    result = timespans.get_timespans_that_satisfy_time_relation(
+        time_relation)
+    assert len(result) == 2
+    assert timespans._get_index() is not None
+
+    results = timespans.query_many([0, (1, 2)])
+    assert [len(_) for _ in results] == [1, 1]
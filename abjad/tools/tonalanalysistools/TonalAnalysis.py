@@ -55,6 +55,8 @@ class TonalAnalysis(abctools.AbjadObject):
         '_client',
         )
 
+    _chord_classes: dict = {}
+
     ### INITIALIZER ###
 
     def __init__(self, client=None):
@@ -67,10 +69,36 @@ class TonalAnalysis(abctools.AbjadObject):
 
     @staticmethod
     def _analyze_chord(argument):
-        from abjad.tools import tonalanalysistools
         pitches = pitchtools.PitchSegment.from_selection(argument)
+        return TonalAnalysis._analyze_pitches(pitches)
+
+    @staticmethod
+    def _analyze_pitches(pitches):
+        if not pitches:
+            return None
+        names = frozenset(_.pitch_class.name for _ in pitches)
+        bass = min(pitches).pitch_class
+        # chord class depends only on pitch-class content and bass
+        key = (names, bass.name)
+        chord_classes = TonalAnalysis._chord_classes
+        if key not in chord_classes:
+            if 1024 <= len(chord_classes):
+                chord_classes.clear()
+            try:
+                chord_class = TonalAnalysis._classify_chord(names, bass)
+            except KeyError as exception:
+                chord_class = exception
+            chord_classes[key] = chord_class
+        chord_class = chord_classes[key]
+        if isinstance(chord_class, KeyError):
+            raise KeyError(*chord_class.args)
+        return chord_class
+
+    @staticmethod
+    def _classify_chord(names, bass):
+        from abjad.tools import tonalanalysistools
         npcset = pitchtools.PitchClassSet(
-            pitches,
+            names,
             item_class=pitchtools.NamedPitchClass,
             )
         ordered_npcs = []
@@ -94,7 +122,6 @@ class TonalAnalysis(abctools.AbjadObject):
         root = ordered_npcs[0]
         class_ = tonalanalysistools.RootlessChordClass
         rootless_chord_class = class_.from_interval_class_segment(segment)
-        bass = min(pitches).pitch_class
         inversion = ordered_npcs.index(bass)
         return tonalanalysistools.RootedChordClass(
             root,
@@ -823,6 +850,106 @@ class TonalAnalysis(abctools.AbjadObject):
                 return False
         return True
 
+    def tabulate_chords(self):
+        r"""
+        Tabulates chords sounding at each vertical moment in client.
+
+        ..  container:: example
+
+            >>> score = abjad.Score([
+            ...     abjad.Staff("<e' g'>4 <f' a'>4 <e' g'>4 <d' g'>4"),
+            ...     abjad.Staff(r"\clef bass c4 c4 c4 b,4"),
+            ...     ])
+            >>> abjad.show(score) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(score)
+                \new Score
+                <<
+                    \new Staff
+                    {
+                        <e' g'>4
+                        <f' a'>4
+                        <e' g'>4
+                        <d' g'>4
+                    }
+                    \new Staff
+                    {
+                        \clef "bass"
+                        c4
+                        c4
+                        c4
+                        b,4
+                    }
+                >>
+
+            >>> for row in abjad.analyze(score).tabulate_chords():
+            ...     row
+            ...
+            (Offset(0, 1), NamedPitchClass('c'), 'major', 5, 0)
+            (Offset(1, 4), NamedPitchClass('f'), 'major', 5, 2)
+            (Offset(1, 2), NamedPitchClass('c'), 'major', 5, 0)
+            (Offset(3, 4), NamedPitchClass('g'), 'major', 5, 1)
+
+        ..  container:: example
+
+            Tabulates none when no tonal chord is understood:
+
+            >>> staff = abjad.Staff("<c' e' g'>4 r4 <c' e'>4 <c' d' e'>4")
+            >>> for row in abjad.analyze(staff).tabulate_chords():
+            ...     row
+            ...
+            (Offset(0, 1), NamedPitchClass('c'), 'major', 5, 0)
+            (Offset(1, 2), None, None, None, None)
+            (Offset(3, 4), None, None, None, None)
+
+        Iterates vertical moments of each score once. Classifies each
+        distinct combination of pitch classes and bass once.
+
+        Returns list of (offset, root, quality, extent, inversion) tuples.
+        Root, quality, extent and inversion are none when no tonal chord is
+        understood.
+        """
+        import abjad
+        prototype = (abjad.Chord, abjad.Note)
+        leaf_ids, roots = set(), {}
+        for leaf in self._client:
+            if not isinstance(leaf, prototype):
+                continue
+            leaf_ids.add(id(leaf))
+            root = abjad.inspect(leaf).get_parentage().root
+            roots.setdefault(id(root), root)
+        result = []
+        for root in roots.values():
+            for vertical_moment in abjad.iterate(root).vertical_moments():
+                pitches = []
+                for leaf in vertical_moment._components:
+                    if id(leaf) not in leaf_ids:
+                        continue
+                    if isinstance(leaf, abjad.Note):
+                        pitches.append(leaf.written_pitch)
+                    else:
+                        pitches.extend(leaf.written_pitches)
+                if not pitches:
+                    continue
+                try:
+                    chord_class = self._analyze_pitches(pitches)
+                except KeyError:
+                    chord_class = None
+                if chord_class is None:
+                    row = (vertical_moment.offset, None, None, None, None)
+                else:
+                    row = (
+                        vertical_moment.offset,
+                        chord_class.root,
+                        chord_class.chord_quality.quality_string,
+                        chord_class.extent.number,
+                        chord_class.inversion,
+                        )
+                result.append(row)
+        return result
+
     ### PUBLIC PROPERTIES ###
 
     @property
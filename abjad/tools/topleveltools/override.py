@@ -58,4 +58,6 @@ def override(argument):
     if getattr(argument, '_lilypond_grob_name_manager', None) is None:
         manager = lilypondnametools.LilyPondGrobNameManager()
         argument._lilypond_grob_name_manager = manager
-    return argument._lilypond_grob_name_manager
+    manager = argument._lilypond_grob_name_manager
+    manager._client = argument
+    return manager
@@ -38,4 +38,6 @@ def setting(argument):
     if getattr(argument, '_lilypond_setting_name_manager', None) is None:
         manager = lilypondnametools.LilyPondSettingNameManager()
         argument._lilypond_setting_name_manager = manager
-    return argument._lilypond_setting_name_manager
+    manager = argument._lilypond_setting_name_manager
+    manager._client = argument
+    return manager
@@ -248,4 +248,6 @@ def tweak(argument) -> LilyPondTweakManager:
         raise NotImplementedError(f'{name} does not allow tweaks (yet).')
     if argument._lilypond_tweak_manager is None:
         argument._lilypond_tweak_manager = LilyPondTweakManager()
-    return argument._lilypond_tweak_manager
+    manager = argument._lilypond_tweak_manager
+    manager._client = argument
+    return manager